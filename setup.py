@@ -7,6 +7,9 @@ setup(
     install_requires=[
         "sqlparse>=0.4.3",
     ],
+    extras_require={
+        "xml": ["lxml>=4.4"],
+    },
     author="Oracle to PostgreSQL Migration Team",
     author_email="example@example.com",
     description="A toolkit for analyzing Oracle SQL queries and MyBatis dynamic queries for PostgreSQL migration",
@@ -26,6 +29,8 @@ setup(
             "analyze-sql=oracle_to_postgres_analyzer.src.query_complexity_analyzer:main",
             "analyze-mybatis=oracle_to_postgres_analyzer.src.mybatis_query_analyzer:main",
             "analyze-sql-dir=oracle_to_postgres_analyzer.src.sql_directory_analyzer:main",
+            "analyze-sql-merge=oracle_to_postgres_analyzer.src.sql_directory_analyzer:merge_main",
+            "query-sql-results=oracle_to_postgres_analyzer.src.results_db:main",
         ],
     },
 )
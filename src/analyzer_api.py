@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+라이브러리용 분석 API
+콘솔 출력 없이 파일/디렉토리/쿼리(Query)를 분석하고, 완료되는 대로 결과를 돌려주는 반복자 기반 API
+"""
+
+import os
+from collections import namedtuple
+
+try:
+    # 패키지로 설치된 경우
+    from .sql_directory_analyzer import BUDGET_DEGRADE, BudgetedFileAnalyzer, find_sql_files
+except ImportError:
+    # 직접 실행하는 경우
+    from sql_directory_analyzer import BUDGET_DEGRADE, BudgetedFileAnalyzer, find_sql_files
+
+_RESULT_FIELDS = [
+    'source',
+    'is_query',
+    'is_mybatis',
+    'complexity_score',
+    'description',
+    'detailed_scores',
+    'base_complexity',
+    'max_complexity',
+    'dynamic_complexity',
+    'degraded',
+    'budget_exceeded',
+    'error'
+]
+
+class Query(namedtuple('Query', ['text'])):
+    """
+    경로가 아닌 SQL/MyBatis XML 문자열로 분석할 입력
+    
+    iter_analyze에 넘기는 일반 문자열은 항상 경로로 취급하므로, 쿼리 문자열은
+    Query로 감싸서 넘겨야 합니다.
+    
+    Attributes:
+        text (str): SQL 쿼리 또는 MyBatis XML
+    """
+    
+    __slots__ = ()
+
+class AnalysisResult(namedtuple('AnalysisResult', _RESULT_FIELDS)):
+    """
+    분석 결과 하나
+    
+    Attributes:
+        source (str): 파일 경로 또는 쿼리 문자열의 식별자 ('<query N>')
+        is_query (bool): 쿼리 문자열을 직접 분석한 결과인지 여부
+        is_mybatis (bool): MyBatis 동적 쿼리 여부 (점수가 없으면 None)
+        complexity_score (float): 0-10 사이의 복잡도 점수 (점수가 없으면 None)
+        description (str): 복잡도 설명
+        detailed_scores (dict): 세부 평가 요소별 점수
+        base_complexity (float): MyBatis 기본 SQL 복잡도 (MyBatis가 아니면 None)
+        max_complexity (float): MyBatis 최대 SQL 복잡도 (MyBatis가 아니면 None)
+        dynamic_complexity (float): MyBatis 동적 쿼리 복잡도 (MyBatis가 아니면 None)
+        degraded (bool): 저비용 근사 모드로 계산된 점수인지 여부
+        budget_exceeded (str): 예산 초과 사유 (초과하지 않았으면 None)
+        error (str): 분석 오류 메시지 (오류가 없으면 None)
+    """
+    
+    __slots__ = ()
+    
+    @property
+    def ok(self):
+        """
+        점수가 계산되었는지 여부
+        """
+        return self.error is None and self.complexity_score is not None
+    
+    @classmethod
+    def from_dict(cls, result, is_query=False):
+        """
+        analyze_sql_file 형식의 결과 딕셔너리로부터 생성
+        
+        Args:
+            result (dict): 분석 결과 딕셔너리
+            is_query (bool): 쿼리 문자열을 직접 분석한 결과인지 여부
+            
+        Returns:
+            AnalysisResult: 분석 결과
+        """
+        return cls(
+            source=result['file_path'],
+            is_query=is_query,
+            is_mybatis=result.get('is_mybatis'),
+            complexity_score=result.get('complexity_score'),
+            description=result.get('description'),
+            detailed_scores=result.get('detailed_scores', {}),
+            base_complexity=result.get('base_complexity'),
+            max_complexity=result.get('max_complexity'),
+            dynamic_complexity=result.get('dynamic_complexity'),
+            degraded=result.get('degraded', False),
+            budget_exceeded=result.get('budget_exceeded'),
+            error=result.get('error')
+        )
+
+def _iter_sources(sources):
+    """
+    입력 항목을 분석 단위로 펼침
+    
+    Query는 쿼리 문자열로, 디렉토리는 포함된 SQL 파일로, 나머지는 파일 경로로 취급합니다.
+    
+    Args:
+        sources (iterable): 파일 경로, 디렉토리 경로 또는 Query
+        
+    Yields:
+        tuple: (파일 경로 또는 Query, 쿼리 번호 - 파일이면 False)
+    """
+    query_number = 0
+    for source in sources:
+        if isinstance(source, Query):
+            query_number += 1
+            yield source, query_number
+        elif os.path.isdir(source):
+            for file_path in find_sql_files(source):
+                yield file_path, False
+        else:
+            yield source, False
+
+def iter_analyze(sources, progress=None, cancel=None, max_file_size=None, time_budget=None,
+                 on_budget_exceeded=BUDGET_DEGRADE):
+    """
+    파일, 디렉토리, 쿼리(Query)를 분석하여 완료되는 대로 결과를 반환
+    
+    콘솔에 아무것도 출력하지 않으며, 분석 오류는 예외 대신 error 필드로 전달됩니다.
+    존재하지 않는 경로도 오류 결과로 반환합니다. 쿼리에도 파일과 같은 크기/시간 예산이
+    적용됩니다.
+    
+    Args:
+        sources (iterable): 파일 경로, 디렉토리 경로 또는 Query(SQL/MyBatis XML 문자열)
+        progress (callable): 결과마다 호출되는 콜백 progress(완료 건수, AnalysisResult)
+        cancel (callable): 항목마다 호출되어 True를 반환하면 분석을 중단하는 콜백
+        max_file_size (int): 파일 크기 예산 (바이트, None이면 제한 없음)
+        time_budget (float): 파일별 분석 시간 예산 (초, None이면 제한 없음)
+        on_budget_exceeded (str): 예산 초과 시 처리 방식 ('degrade' 또는 'skip')
+        
+    Yields:
+        AnalysisResult: 분석 결과
+    """
+    completed = 0
+    
+    with BudgetedFileAnalyzer(max_file_size, time_budget, on_budget_exceeded) as analyzer:
+        for source, query_number in _iter_sources(sources):
+            if cancel is not None and cancel():
+                return
+            
+            if query_number:
+                label = f"<query {query_number}>"
+                result = analyzer.analyze(label, source.text.encode('utf-8'))
+                analysis = AnalysisResult.from_dict(result, is_query=True)
+            elif not os.path.isfile(source):
+                analysis = AnalysisResult.from_dict({
+                    'file_name': os.path.basename(source),
+                    'file_path': source,
+                    'error': f"파일이나 디렉토리를 찾을 수 없습니다: {source}"
+                })
+            else:
+                analysis = AnalysisResult.from_dict(analyzer.analyze(source))
+            
+            completed += 1
+            if progress is not None:
+                progress(completed, analysis)
+            yield analysis
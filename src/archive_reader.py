@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+압축 파일 멤버 읽기 도구
+zip/tar.gz 압축 파일을 디스크에 풀지 않고 멤버를 하나씩 읽어 분석에 넘기는 도구
+"""
+
+import tarfile
+import zipfile
+
+# 지원하는 압축 파일 확장자
+ZIP_EXTENSIONS = ('.zip', '.jar', '.war', '.ear')
+TAR_EXTENSIONS = ('.tar.gz', '.tgz', '.tar')
+
+# 압축 파일 경로와 멤버 경로 구분자 (예: bundle.zip!/dir/a.sql)
+ARCHIVE_SEPARATOR = '!/'
+
+def is_archive(path):
+    """
+    경로가 지원하는 압축 파일인지 확인
+    
+    Args:
+        path (str): 파일 경로
+        
+    Returns:
+        bool: 압축 파일 여부
+    """
+    return path.lower().endswith(ZIP_EXTENSIONS + TAR_EXTENSIONS)
+
+def archive_member_path(archive_path, member_name):
+    """
+    보고서에 표시할 압축 파일 기준 멤버 경로
+    
+    Args:
+        archive_path (str): 압축 파일 경로
+        member_name (str): 압축 파일 안의 멤버 이름
+        
+    Returns:
+        str: '압축 파일 경로!/멤버 이름' 형식의 경로
+    """
+    # tar로 묶을 때 붙는 './' 접두사와 절대 경로의 '/'는 제거
+    name = member_name.lstrip('/')
+    while name.startswith('./'):
+        name = name[2:].lstrip('/')
+    return archive_path + ARCHIVE_SEPARATOR + name
+
+def _read_member(member, size, max_file_size):
+    """
+    크기 예산 안에서 멤버 내용 읽기
+    
+    Args:
+        member (file): 멤버 파일 객체
+        size (int): 압축 파일에 기록된 멤버 크기 (압축 해제 후)
+        max_file_size (int): 파일 크기 예산 (바이트, None이면 제한 없음)
+        
+    Returns:
+        bytes: 멤버 내용 (예산을 넘으면 None)
+    """
+    if max_file_size is None:
+        return member.read()
+    if size > max_file_size:
+        return None
+    # 기록된 크기가 실제와 다른 경우에도 예산보다 1바이트 넘게는 읽지 않음
+    data = member.read(max_file_size + 1)
+    return data if len(data) <= max_file_size else None
+
+def iter_archive_members(archive_path, extensions=('.sql',), max_file_size=None):
+    """
+    압축 파일에서 확장자가 맞는 멤버를 하나씩 읽음
+    
+    멤버 내용은 한 번에 하나만 메모리에 올리며, 디스크에는 아무것도 쓰지 않습니다.
+    tar 계열은 앞에서부터 순서대로 읽는 스트림 모드로 엽니다. 압축 파일에 기록된
+    크기가 max_file_size를 넘는 멤버는 읽지 않고 내용 없이 내보냅니다.
+    
+    Args:
+        archive_path (str): 압축 파일 경로
+        extensions (tuple): 읽을 멤버 확장자
+        max_file_size (int): 파일 크기 예산 (바이트, None이면 제한 없음)
+        
+    Yields:
+        tuple: (압축 파일 기준 멤버 경로, 멤버 내용 bytes (예산 초과 시 None), 멤버 크기)
+    """
+    if archive_path.lower().endswith(ZIP_EXTENSIONS):
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or not info.filename.endswith(extensions):
+                    continue
+                if max_file_size is not None and info.file_size > max_file_size:
+                    data = None
+                else:
+                    with archive.open(info) as member:
+                        data = _read_member(member, info.file_size, max_file_size)
+                yield archive_member_path(archive_path, info.filename), data, info.file_size
+        return
+    
+    with tarfile.open(archive_path, mode='r|*') as archive:
+        for info in archive:
+            if info.isfile() and info.name.endswith(extensions):
+                if max_file_size is not None and info.size > max_file_size:
+                    # 읽지 않은 멤버 내용은 다음 멤버로 넘어갈 때 건너뜀
+                    data = None
+                else:
+                    data = _read_member(archive.extractfile(info), info.size, max_file_size)
+                yield archive_member_path(archive_path, info.name), data, info.size
+            # 스트림 모드에서도 읽은 멤버 정보가 쌓이지 않도록 비움
+            archive.members = []
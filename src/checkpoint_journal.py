@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+분석 체크포인트 저널
+완료된 파일별 분석 결과를 추가 전용 JSON Lines 파일에 일괄 기록하여, 중단된 디렉토리 분석을 이어서 실행할 수 있게 하는 도구
+"""
+
+import hashlib
+import json
+import os
+
+# 저널 파일 형식 식별자
+JOURNAL_FORMAT = 'sql-analysis-journal'
+JOURNAL_VERSION = 2
+
+# 기본 일괄 기록 크기
+DEFAULT_BATCH_SIZE = 100
+
+def content_digest(data):
+    """
+    이미 읽은 파일 내용의 해시 계산 (file_digest와 같은 값)
+    
+    Args:
+        data (bytes): 파일 내용
+        
+    Returns:
+        str: BLAKE2b 해시 (16진수)
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def file_digest(file_path):
+    """
+    파일 내용의 해시 계산
+    
+    Args:
+        file_path (str): 파일 경로
+        
+    Returns:
+        str: BLAKE2b 해시 (16진수)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class CheckpointJournal:
+    """
+    추가 전용 체크포인트 저널
+    
+    결과는 batch_size건씩 모아 한 번에 기록하고 fsync하므로, 프로세스가 강제 종료되어도
+    마지막 일괄 기록까지의 결과는 남습니다. 기록 도중 잘린 마지막 줄은 읽을 때 무시됩니다.
+    결과에 영향을 주는 분석 옵션은 헤더에 기록되며, 옵션이 다른 저널은 이어서 사용할 수 없습니다.
+    
+    Args:
+        path (str): 저널 파일 경로
+        resume (bool): 기존 저널을 이어서 사용할지 여부 (False이면 새로 시작)
+        batch_size (int): 한 번에 기록할 결과 수
+        options (dict): 결과에 영향을 주는 분석 옵션 (JSON 직렬화 가능해야 함)
+    """
+    
+    def __init__(self, path, resume=False, batch_size=DEFAULT_BATCH_SIZE, options=None):
+        self.path = path
+        self.batch_size = batch_size
+        self.options = options or {}
+        self._entries = {}
+        self._pending = []
+        
+        if resume and os.path.exists(path):
+            complete = self._load()
+            self._file = open(path, 'a', encoding='utf-8')
+            if not complete:
+                # 잘린 줄 뒤에 새 기록이 이어 붙지 않도록 줄을 끝냄
+                self._file.write("\n")
+        else:
+            self._file = open(path, 'w', encoding='utf-8')
+            header = {'format': JOURNAL_FORMAT, 'version': JOURNAL_VERSION, 'options': self.options}
+            self._file.write(json.dumps(header) + "\n")
+            self._file.flush()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def _load(self):
+        """
+        기존 저널 기록을 읽어 들임
+        
+        Returns:
+            bool: 파일이 줄바꿈으로 끝나는지 여부 (False이면 마지막 기록이 잘림)
+        """
+        complete = True
+        with open(self.path, 'r', encoding='utf-8') as f:
+            header = json.loads(f.readline() or 'null')
+            if not header or header.get('format') != JOURNAL_FORMAT:
+                raise ValueError(f"체크포인트 저널 파일이 아닙니다: {self.path}")
+            if header.get('version') != JOURNAL_VERSION:
+                raise ValueError(f"지원하지 않는 저널 버전입니다: {self.path}")
+            if header.get('options') != self.options:
+                raise ValueError(f"저널의 분석 옵션 {header.get('options')}이 현재 옵션 {self.options}과 "
+                                 f"다르므로 이어서 실행할 수 없습니다: {self.path}")
+            for line in f:
+                complete = line.endswith("\n")
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 강제 종료로 잘린 마지막 줄
+                    continue
+                self._entries[entry['file_path']] = entry
+        return complete
+    
+    def lookup(self, file_path):
+        """
+        파일이 바뀌지 않았다면 저널에 기록된 결과 반환
+        
+        크기가 같고 수정 시각도 같으면 기록을 그대로 사용하고, 수정 시각만 다르면
+        (새로 체크아웃한 경우 등) 내용 해시를 비교합니다.
+        
+        Args:
+            file_path (str): 파일 경로
+            
+        Returns:
+            dict: 기록된 분석 결과 (없거나 파일이 바뀌었으면 None)
+        """
+        entry = self._entries.get(file_path)
+        if entry is None:
+            return None
+        
+        try:
+            stat = os.stat(file_path)
+            if stat.st_size != entry['size']:
+                return None
+            if stat.st_mtime_ns != entry['mtime_ns'] and file_digest(file_path) != entry['hash']:
+                return None
+        except OSError:
+            return None
+        
+        return entry['result']
+    
+    def record(self, file_path, result, digest=None):
+        """
+        완료된 분석 결과를 기록 대기열에 추가 (batch_size건마다 파일에 기록)
+        
+        분석 오류는 일시적일 수 있으므로 기록하지 않고 다음 실행에서 다시 분석합니다.
+        
+        Args:
+            file_path (str): 파일 경로
+            result (dict): 분석 결과
+            digest (str): 분석할 때 읽은 내용의 content_digest 값 (None이면 파일을 다시 읽어 계산)
+        """
+        if 'error' in result:
+            return
+        
+        try:
+            stat = os.stat(file_path)
+            entry = {
+                'file_path': file_path,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'hash': digest if digest is not None else file_digest(file_path),
+                'result': result
+            }
+        except OSError:
+            return
+        
+        self._entries[file_path] = entry
+        self._pending.append(entry)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        """
+        대기 중인 결과를 저널 파일에 기록
+        """
+        if not self._pending:
+            return
+        self._file.write("".join(
+            json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + "\n"
+            for entry in self._pending
+        ))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = []
+    
+    def close(self):
+        """
+        대기 중인 결과를 기록하고 저널 파일을 닫음
+        """
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+층화 표본 추출 도구
+탐색한 파일을 디렉토리와 크기로 층화하여 재현 가능한 표본을 뽑고, 표본 결과로 전체 복잡도 분포와 신뢰구간을 추정하는 도구
+"""
+
+import hashlib
+import heapq
+import math
+import os
+from collections import Counter, defaultdict
+
+# 기본 표본 시드
+DEFAULT_SAMPLE_SEED = 0
+
+# 크기 층 경계: 1KB 미만, 1-4KB, 4-16KB, ... (4배 간격)
+SIZE_BUCKET_UNIT = 1024
+SIZE_BUCKET_BASE = 4
+
+# 신뢰구간 (95%, 정규 근사)
+CONFIDENCE_LEVEL = 0.95
+CONFIDENCE_Z = 1.96
+
+# 점수를 얻지 못한 표본 파일(오류, 예산 초과로 건너뜀, SQL 없는 소스)의 분류
+EXCLUDED_CATEGORY = "분석 제외 (오류/건너뜀/SQL 없음)"
+
+def parse_sample(value):
+    """
+    표본 크기 지정 문자열 해석
+    
+    Args:
+        value (str): 파일 수(예: '500') 또는 0과 1 사이의 비율(예: '0.05')
+        
+    Returns:
+        int 또는 float: 파일 수(int) 또는 비율(float)
+    """
+    try:
+        count = int(value)
+    except ValueError:
+        try:
+            fraction = float(value)
+        except ValueError:
+            raise ValueError(f"표본 크기는 파일 수 또는 비율이어야 합니다: {value}")
+        if not 0 < fraction < 1:
+            raise ValueError(f"표본 비율은 0과 1 사이여야 합니다: {value}")
+        return fraction
+    if count < 1:
+        raise ValueError(f"표본 파일 수는 1 이상이어야 합니다: {value}")
+    return count
+
+def size_bucket(size):
+    """
+    파일 크기가 속한 크기 층 번호
+    
+    Args:
+        size (int): 파일 크기 (바이트)
+        
+    Returns:
+        int: 크기 층 번호 (0: 1KB 미만, 1: 1-4KB, 2: 4-16KB, ...)
+    """
+    bucket = 0
+    limit = SIZE_BUCKET_UNIT
+    while size >= limit:
+        bucket += 1
+        limit *= SIZE_BUCKET_BASE
+    return bucket
+
+def _sample_key(relative_path, seed):
+    """
+    파일별 표본 추출 순서 키
+    
+    시드와 루트 기준 상대 경로만으로 정해지므로 다른 파일이 추가/삭제되어도 값이 바뀌지 않습니다.
+    
+    Args:
+        relative_path (str): 루트 기준 상대 경로
+        seed (int): 표본 시드
+        
+    Returns:
+        int: 정렬 키
+    """
+    digest = hashlib.sha1(f"{seed}:{relative_path}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+class StratifiedSample:
+    """
+    디렉토리와 파일 크기로 층화한 재현 가능한 표본
+    
+    층은 (루트 바로 아래 디렉토리, 크기 층)입니다. 표본 크기는 층 크기에 비례하도록
+    한 파일씩 순서대로 배정하고(Sainte-Laguë 방식), 각 층에서는 시드로 정한 파일별
+    키 순서대로 뽑습니다. 따라서 같은 시드로 표본 크기만 늘리면 이전 표본을 모두
+    포함하는 표본이 나오므로, 체크포인트 저널과 함께 쓰면 이미 분석한 파일은 다시
+    분석하지 않고 추정을 정밀하게 만들 수 있습니다.
+    
+    Args:
+        size (int 또는 float): 표본 파일 수(int) 또는 전체 대비 비율(float)
+        seed (int): 표본 시드
+    """
+    
+    def __init__(self, size, seed=DEFAULT_SAMPLE_SEED):
+        self.size = size
+        self.seed = seed
+        self.population = Counter()
+        self.allocation = Counter()
+        self.strata_of = {}
+    
+    @property
+    def population_size(self):
+        """
+        탐색된 전체 파일 수
+        """
+        return sum(self.population.values())
+    
+    @property
+    def sample_size(self):
+        """
+        표본 파일 수
+        """
+        return sum(self.allocation.values())
+    
+    def _target_size(self, total):
+        """
+        전체 파일 수에 대한 표본 파일 수
+        
+        Args:
+            total (int): 전체 파일 수
+            
+        Returns:
+            int: 표본 파일 수
+        """
+        if isinstance(self.size, float):
+            return min(total, math.ceil(self.size * total))
+        return min(total, self.size)
+    
+    def draw(self, file_paths, root):
+        """
+        탐색된 파일에서 표본을 뽑음
+        
+        Args:
+            file_paths (list): 탐색된 파일 경로 (탐색 순서)
+            root (str): 분석 루트 디렉토리
+            
+        Returns:
+            list: 표본 파일 경로 (탐색 순서 유지)
+        """
+        self.population = Counter()
+        self.allocation = Counter()
+        self.strata_of = {}
+        members = defaultdict(list)
+        
+        for file_path in file_paths:
+            relative_path = os.path.relpath(file_path, root).replace(os.sep, '/')
+            directory = relative_path.split('/', 1)[0] if '/' in relative_path else '.'
+            try:
+                size = os.path.getsize(file_path)
+            except OSError:
+                size = 0
+            stratum = (directory, size_bucket(size))
+            self.strata_of[file_path] = stratum
+            self.population[stratum] += 1
+            members[stratum].append((_sample_key(relative_path, self.seed), file_path))
+        
+        # 층 크기 / (배정 수 + 0.5)가 가장 큰 층에 한 파일씩 배정
+        # (배정 순서가 표본 크기와 무관하므로 작은 표본은 항상 큰 표본의 일부)
+        heap = [(-count / 0.5, stratum) for stratum, count in self.population.items()]
+        heapq.heapify(heap)
+        for _ in range(self._target_size(len(file_paths))):
+            _, stratum = heapq.heappop(heap)
+            self.allocation[stratum] += 1
+            allocated = self.allocation[stratum]
+            if allocated < self.population[stratum]:
+                heapq.heappush(heap, (-self.population[stratum] / (allocated + 0.5), stratum))
+        
+        selected = set()
+        for stratum, allocated in self.allocation.items():
+            selected.update(file_path for _, file_path in sorted(members[stratum])[:allocated])
+        return [file_path for file_path in file_paths if file_path in selected]
+    
+    def estimate(self, results):
+        """
+        표본 분석 결과로 전체 파일의 복잡도 분포 추정
+        
+        층별 비율을 층 크기로 가중 평균한 층화 추정량과 유한 모집단 보정을 적용한
+        정규 근사 신뢰구간을 계산합니다. 표본이 배정되지 않은 층은 나머지 층의
+        분포를 따른다고 보고 가중치를 나눕니다.
+        
+        Args:
+            results (list): 표본 파일의 분석 결과 (SQL 없는 소스처럼 결과에서 빠진 파일은 분석 제외로 분류)
+            
+        Returns:
+            dict: 추정 결과
+                - population: 전체 파일 수
+                - sample_size: 표본 파일 수
+                - strata: 층 수
+                - sampled_strata: 표본이 배정된 층 수
+                - buckets: 분류별 (분류, 표본 수, 추정 비율, 하한, 상한) 목록
+        """
+        counts = defaultdict(Counter)
+        for result in results:
+            stratum = self.strata_of.get(result['file_path'])
+            if stratum is None:
+                continue
+            category = result['description'] if 'complexity_score' in result else EXCLUDED_CATEGORY
+            counts[stratum][category] += 1
+        for stratum, allocated in self.allocation.items():
+            missing = allocated - sum(counts[stratum].values())
+            if missing > 0:
+                counts[stratum][EXCLUDED_CATEGORY] += missing
+        
+        sampled = [stratum for stratum in self.allocation if self.allocation[stratum] > 0]
+        covered = sum(self.population[stratum] for stratum in sampled)
+        categories = set()
+        for stratum in sampled:
+            categories.update(counts[stratum])
+        
+        buckets = []
+        for category in categories:
+            proportion = 0.0
+            variance = 0.0
+            sample_count = 0
+            for stratum in sampled:
+                allocated = self.allocation[stratum]
+                population = self.population[stratum]
+                weight = population / covered
+                share = counts[stratum][category] / allocated
+                sample_count += counts[stratum][category]
+                proportion += weight * share
+                if allocated > 1:
+                    stratum_variance = share * (1 - share) * allocated / (allocated - 1)
+                else:
+                    # 표본 1개인 층은 분산을 추정할 수 없으므로 최댓값(0.25)을 사용
+                    stratum_variance = 0.25
+                variance += weight ** 2 * (1 - allocated / population) * stratum_variance / allocated
+            margin = CONFIDENCE_Z * math.sqrt(variance)
+            buckets.append((category, sample_count, proportion,
+                            max(0.0, proportion - margin), min(1.0, proportion + margin)))
+        
+        return {
+            'population': self.population_size,
+            'sample_size': self.sample_size,
+            'strata': len(self.population),
+            'sampled_strata': len(sampled),
+            'buckets': buckets
+        }
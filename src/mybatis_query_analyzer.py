@@ -8,104 +8,207 @@ Oracle SQL 쿼리와 MyBatis 동적 쿼리의 복잡도를 0-10 척도로 평가
 
 import xml.etree.ElementTree as ET
 
+try:
+    # lxml이 설치되어 있으면 더 빠른 파서 사용
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
+
 # 기존 SQL 복잡도 분석 함수 가져오기
 try:
     # 패키지로 설치된 경우
-    from .query_complexity_analyzer import calculate_query_complexity, get_complexity_description
+    from .query_complexity_analyzer import (calculate_complexity_score, calculate_query_complexity,
+                                            estimate_query_complexity, get_complexity_description)
 except ImportError:
     # 직접 실행하는 경우
-    from query_complexity_analyzer import calculate_query_complexity, get_complexity_description
+    from query_complexity_analyzer import (calculate_complexity_score, calculate_query_complexity,
+                                           estimate_query_complexity, get_complexity_description)
 
-def analyze_mybatis_dynamic_query(xml_content):
+# 동적 태그 (중첩 깊이와 복잡도 계산 대상)
+DYNAMIC_TAGS = ('if', 'choose', 'when', 'otherwise', 'foreach', 'where', 'set', 'trim', 'bind')
+
+# 증분 파싱 시 한 번에 파서에 넣는 문자 수
+FEED_CHUNK_SIZE = 1024 * 1024
+
+# lxml 파서에 넣는 바이트의 인코딩 (문서의 인코딩 선언보다 우선)
+LXML_FEED_ENCODING = 'utf-8'
+
+def _local_name(tag):
     """
-    MyBatis XML에서 동적 쿼리의 복잡도를 분석
+    네임스페이스를 제거한 태그 이름
     
     Args:
-        xml_content (str): MyBatis XML 내용
+        tag (str): 태그 이름
         
     Returns:
-        tuple: (기본 SQL, 동적 복잡도 점수, 최대 복잡도 SQL 추정)
+        str: 네임스페이스가 제거된 태그 이름
     """
-    try:
-        # XML 파싱
-        root = ET.fromstring(xml_content)
-    except ET.ParseError:
-        # XML 파싱 오류 처리
-        return "", 0, ""
+    if '}' in tag:
+        tag = tag.split('}', 1)[1]
+    return tag
+
+def _create_stdlib_parser():
+    """
+    표준 라이브러리 증분 XML 파서 생성
     
-    # 동적 태그 카운트
-    dynamic_tags = {
-        'if': 0,
-        'choose': 0,
-        'when': 0,
-        'otherwise': 0,
-        'foreach': 0,
-        'where': 0,
-        'set': 0,
-        'trim': 0,
-        'bind': 0
-    }
+    Returns:
+        XMLPullParser: start/end 이벤트를 내보내는 증분 파서
+    """
+    return ET.XMLPullParser(events=('start', 'end'))
+
+def _create_lxml_parser():
+    """
+    lxml 증분 XML 파서 생성
+    
+    표준 라이브러리 파서와 같은 트리를 만들도록 주석과 처리 명령은 트리에 넣지 않습니다.
+    내용은 이미 디코딩된 문자열이므로 LXML_FEED_ENCODING으로 인코딩한 바이트를 넣고,
+    문서의 인코딩 선언(예: EUC-KR) 대신 이 인코딩으로 해석하게 합니다.
+    
+    Returns:
+        XMLPullParser: start/end 이벤트를 내보내는 증분 파서
+    """
+    return _lxml_etree.XMLPullParser(events=('start', 'end'), remove_comments=True,
+                                     remove_pis=True, encoding=LXML_FEED_ENCODING)
+
+# 시도할 (파서 생성 함수, 입력 인코딩) 순서 (lxml이 거부한 문서는 표준 라이브러리 파서로 다시 파싱)
+if _lxml_etree is None:
+    _PARSER_FACTORIES = ((_create_stdlib_parser, None),)
+    _PARSE_ERRORS = (ET.ParseError,)
+else:
+    _PARSER_FACTORIES = ((_create_lxml_parser, LXML_FEED_ENCODING), (_create_stdlib_parser, None))
+    _PARSE_ERRORS = (ET.ParseError, _lxml_etree.XMLSyntaxError, ValueError)
+
+class _DynamicQueryScanner:
+    """
+    MyBatis XML 요소를 문서 순서대로 방문하며 기본 SQL, 최대 복잡도 SQL, 동적 태그 수를 누적
     
-    # 기본 SQL 추출 (동적 태그 제외)
-    base_sql = ""
-    max_complexity_sql = ""
+    루트의 자식 요소(select, insert 등 구문 요소)는 닫히는 즉시 명시적 스택으로 순회한 뒤
+    트리에서 제거하므로, 문서 전체 트리를 메모리에 유지하지 않고 깊은 중첩에서도
+    재귀 한도에 걸리지 않습니다.
+    """
     
-    # 동적 태그 중첩 깊이
-    max_nesting_depth = 0
+    def __init__(self):
+        self.dynamic_tags = dict.fromkeys(DYNAMIC_TAGS, 0)
+        self.max_nesting_depth = 0
+        self.base_parts = []
+        self.max_parts = []
+        self._level = 0
+        self._root = None
+        self._root_entered = False
+        self._pending = None
     
-    # 동적 태그 분석 함수
-    def analyze_element(element, depth=0):
-        nonlocal max_nesting_depth
-        nonlocal base_sql
-        nonlocal max_complexity_sql
-        
-        # 현재 깊이가 최대 깊이보다 크면 업데이트
-        max_nesting_depth = max(max_nesting_depth, depth)
+    def _enter(self, element, depth, is_child):
+        """
+        요소 자체의 태그와 텍스트를 반영
         
-        # 태그 이름 (네임스페이스 제거)
-        tag = element.tag
-        if '}' in tag:
-            tag = tag.split('}', 1)[1]
+        Args:
+            element (Element): 방문할 요소
+            depth (int): 동적 태그 중첩 깊이
+            is_child (bool): 다른 요소의 자식인지 여부 (루트가 아니면 True)
+        """
+        self.max_nesting_depth = max(self.max_nesting_depth, depth)
         
-        # 동적 태그 카운트 증가
-        if tag in dynamic_tags:
-            dynamic_tags[tag] += 1
+        tag = _local_name(element.tag)
+        is_dynamic = tag in self.dynamic_tags
+        if is_dynamic:
+            self.dynamic_tags[tag] += 1
         
-        # 텍스트 내용 처리
         if element.text and element.text.strip():
             text = element.text.strip()
-            base_sql += " " + text
-            max_complexity_sql += " " + text
-        
-        # 자식 요소 처리
-        for child in element:
-            child_tag = child.tag
-            if '}' in child_tag:
-                child_tag = child_tag.split('}', 1)[1]
-            
-            # 동적 태그인 경우
-            if child_tag in dynamic_tags:
-                # 기본 SQL에는 포함하지 않음
-                # 최대 복잡도 SQL에는 내용 포함
-                if child.text and child.text.strip():
-                    max_complexity_sql += " " + child.text.strip()
-                
-                # 자식 요소 재귀 처리
-                analyze_element(child, depth + 1)
-            else:
-                # 일반 태그인 경우 양쪽 모두에 포함
-                analyze_element(child, depth)
+            if is_dynamic and is_child:
+                # 동적 태그 내용은 최대 복잡도 SQL에 한 번 더 반영
+                self.max_parts.append(text)
+            self.base_parts.append(text)
+            self.max_parts.append(text)
+    
+    def _add_tail(self, element):
+        """
+        요소 뒤의 꼬리 텍스트를 반영
         
-        # 꼬리 텍스트 처리
+        Args:
+            element (Element): 꼬리 텍스트를 가진 요소
+        """
         if element.tail and element.tail.strip():
             tail = element.tail.strip()
-            base_sql += " " + tail
-            max_complexity_sql += " " + tail
+            self.base_parts.append(tail)
+            self.max_parts.append(tail)
     
-    # 루트 요소부터 분석 시작
-    analyze_element(root)
+    def walk(self, element, depth):
+        """
+        루트의 자식 요소 하위 트리를 명시적 스택으로 순회 (요소 자신의 꼬리 텍스트 제외)
+        
+        Args:
+            element (Element): 순회할 요소
+            depth (int): 요소의 동적 태그 중첩 깊이
+        """
+        stack = [(element, depth, True)]
+        while stack:
+            current, current_depth, entering = stack.pop()
+            if not entering:
+                self._add_tail(current)
+                continue
+            
+            self._enter(current, current_depth, True)
+            if current is not element:
+                stack.append((current, current_depth, False))
+            for child in reversed(current):
+                child_depth = current_depth + (_local_name(child.tag) in self.dynamic_tags)
+                stack.append((child, child_depth, True))
+    
+    def _enter_root(self):
+        """
+        루트 요소의 텍스트를 한 번만 반영
+        """
+        if not self._root_entered:
+            self._enter(self._root, 0, False)
+            self._root_entered = True
+    
+    def _flush_pending(self):
+        """
+        직전에 처리한 구문 요소의 꼬리 텍스트를 반영하고 트리에서 제거
+        """
+        if self._pending is not None:
+            self._add_tail(self._pending)
+            self._root.remove(self._pending)
+            self._pending = None
+    
+    def handle_events(self, events):
+        """
+        파서 이벤트 처리
+        
+        Args:
+            events (iterable): (이벤트, 요소) 튜플
+        """
+        for event, element in events:
+            if event == 'start':
+                self._level += 1
+                if self._level == 1:
+                    self._root = element
+                continue
+            
+            if self._level == 2:
+                # 구문 요소가 닫힘: 루트 텍스트와 직전 요소 꼬리 텍스트가 이미 확정됨
+                self._enter_root()
+                self._flush_pending()
+                self.walk(element, int(_local_name(element.tag) in self.dynamic_tags))
+                self._pending = element
+            elif self._level == 1:
+                self._enter_root()
+                self._flush_pending()
+                self._add_tail(element)
+            self._level -= 1
+
+def _score_dynamic_tags(dynamic_tags, max_nesting_depth):
+    """
+    동적 태그 수와 중첩 깊이로 동적 쿼리 복잡도 점수 계산
     
-    # 동적 쿼리 복잡도 점수 계산
+    Args:
+        dynamic_tags (dict): 동적 태그별 개수
+        max_nesting_depth (int): 동적 태그 최대 중첩 깊이
+        
+    Returns:
+        float: 동적 쿼리 복잡도 점수 (최대 3.0)
+    """
     dynamic_complexity = 0
     
     # 1. 동적 태그 수에 따른 복잡도
@@ -137,16 +240,53 @@ def analyze_mybatis_dynamic_query(xml_content):
         dynamic_complexity += min(0.8, dynamic_tags['choose'] * 0.2)
     
     # 최대 3.0으로 제한
-    dynamic_complexity = min(3.0, dynamic_complexity)
+    return min(3.0, dynamic_complexity)
+
+def analyze_mybatis_dynamic_query(xml_content):
+    """
+    MyBatis XML에서 동적 쿼리의 복잡도를 분석
     
-    return base_sql.strip(), dynamic_complexity, max_complexity_sql.strip()
+    XML은 FEED_CHUNK_SIZE 단위로 증분 파싱하며, 구문 요소는 닫히는 즉시 처리하고
+    트리에서 제거합니다. lxml이 설치되어 있으면 lxml 파서를 먼저 사용하고, lxml이
+    거부한 문서(중첩 한도 초과 등)는 표준 라이브러리 파서로 다시 파싱하므로 결과는
+    lxml 설치 여부와 관계없이 같습니다.
+    
+    Args:
+        xml_content (str): MyBatis XML 내용
+        
+    Returns:
+        tuple: (기본 SQL, 동적 복잡도 점수, 최대 복잡도 SQL 추정)
+    """
+    for create_parser, encoding in _PARSER_FACTORIES:
+        parser = create_parser()
+        scanner = _DynamicQueryScanner()
+        try:
+            for offset in range(0, len(xml_content), FEED_CHUNK_SIZE):
+                chunk = xml_content[offset:offset + FEED_CHUNK_SIZE]
+                parser.feed(chunk if encoding is None else chunk.encode(encoding))
+                scanner.handle_events(parser.read_events())
+            parser.close()
+            scanner.handle_events(parser.read_events())
+            break
+        except _PARSE_ERRORS:
+            continue
+    else:
+        # XML 파싱 오류 처리
+        return "", 0, ""
+    
+    dynamic_complexity = _score_dynamic_tags(scanner.dynamic_tags, scanner.max_nesting_depth)
+    return " ".join(scanner.base_parts), dynamic_complexity, " ".join(scanner.max_parts)
 
-def analyze_mybatis_query(xml_content):
+def analyze_mybatis_query(xml_content, degraded=False, score_only=False):
     """
     MyBatis XML 쿼리를 분석하고 복잡도 결과를 계산
     
+    기본 SQL은 총점만 사용하므로 항상 총점 전용 모드(calculate_complexity_score)로 계산합니다.
+    
     Args:
         xml_content (str): MyBatis XML 쿼리 내용
+        degraded (bool): 저비용 근사 모드(estimate_query_complexity) 사용 여부
+        score_only (bool): 최대 복잡도 SQL도 총점만 계산할지 여부 (결과에 detailed_scores 없음)
         
     Returns:
         dict: 복잡도 분석 결과
@@ -156,39 +296,51 @@ def analyze_mybatis_query(xml_content):
     
     # 기본 SQL과 최대 복잡도 SQL의 복잡도 계산
     try:
-        base_complexity, base_scores = calculate_query_complexity(base_sql)
+        if degraded:
+            base_complexity = estimate_query_complexity(base_sql)[0]
+        else:
+            base_complexity = calculate_complexity_score(base_sql)
     except:
-        base_complexity, base_scores = 0, {}
+        base_complexity = 0
     
     try:
-        max_complexity, max_scores = calculate_query_complexity(max_complexity_sql)
+        if degraded:
+            max_complexity, max_scores = estimate_query_complexity(max_complexity_sql)
+        elif score_only:
+            max_complexity, max_scores = calculate_complexity_score(max_complexity_sql), None
+        else:
+            max_complexity, max_scores = calculate_query_complexity(max_complexity_sql)
     except:
         max_complexity, max_scores = 0, {}
     
-    # 동적 복잡도 점수 추가
-    if 'dynamic_complexity' not in max_scores:
-        max_scores['dynamic_complexity'] = dynamic_complexity
-    
     # 최종 복잡도 계산 (최대 복잡도 SQL + 동적 복잡도)
     final_complexity = min(10, max_complexity + (dynamic_complexity * 0.5))
     
-    return {
+    result = {
         'base_sql': base_sql,
         'max_complexity_sql': max_complexity_sql,
         'base_complexity': base_complexity,
         'max_complexity': max_complexity,
         'dynamic_complexity': dynamic_complexity,
-        'final_complexity': round(final_complexity, 1),
-        'detailed_scores': max_scores
+        'final_complexity': round(final_complexity, 1)
     }
+    
+    if not score_only:
+        # 동적 복잡도 점수 추가
+        if 'dynamic_complexity' not in max_scores:
+            max_scores['dynamic_complexity'] = dynamic_complexity
+        result['detailed_scores'] = max_scores
+    
+    return result
 
-def analyze_query(query, is_mybatis_xml=False):
+def analyze_query(query, is_mybatis_xml=False, verbose=True):
     """
     쿼리를 분석하고 복잡도 결과를 출력
     
     Args:
         query (str): 분석할 SQL 쿼리 또는 MyBatis XML
         is_mybatis_xml (bool): MyBatis XML 형식 여부
+        verbose (bool): 결과를 콘솔에 출력할지 여부
         
     Returns:
         tuple: (복잡도 점수, 복잡도 설명, 세부 점수 딕셔너리)
@@ -199,22 +351,24 @@ def analyze_query(query, is_mybatis_xml=False):
         description = get_complexity_description(complexity_score)
         detailed_scores = result['detailed_scores']
         
-        print(f"쿼리 복잡도 점수: {complexity_score}/10 - {description}")
-        print(f"기본 SQL 복잡도: {result['base_complexity']}/10")
-        print(f"동적 쿼리 복잡도: {result['dynamic_complexity']}/3.0")
-        print("\n세부 평가 요소:")
-        for category, score in detailed_scores.items():
-            print(f"- {category}: {score}")
+        if verbose:
+            print(f"쿼리 복잡도 점수: {complexity_score}/10 - {description}")
+            print(f"기본 SQL 복잡도: {result['base_complexity']}/10")
+            print(f"동적 쿼리 복잡도: {result['dynamic_complexity']}/3.0")
+            print("\n세부 평가 요소:")
+            for category, score in detailed_scores.items():
+                print(f"- {category}: {score}")
         
         return complexity_score, description, detailed_scores
     else:
         complexity_score, detailed_scores = calculate_query_complexity(query)
         description = get_complexity_description(complexity_score)
         
-        print(f"쿼리 복잡도 점수: {complexity_score}/10 - {description}")
-        print("\n세부 평가 요소:")
-        for category, score in detailed_scores.items():
-            print(f"- {category}: {score}")
+        if verbose:
+            print(f"쿼리 복잡도 점수: {complexity_score}/10 - {description}")
+            print("\n세부 평가 요소:")
+            for category, score in detailed_scores.items():
+                print(f"- {category}: {score}")
         
         return complexity_score, description, detailed_scores
 
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+샤드 분석 부분 결과 파일
+샤드별 분석 결과를 압축된 JSON Lines 파일로 저장하고 다시 읽어 병합하는 도구
+"""
+
+import gzip
+import hashlib
+import json
+import os
+
+# 부분 결과 파일 형식 식별자
+PARTIAL_FORMAT = 'sql-analysis-partial'
+PARTIAL_VERSION = 1
+
+def parse_shard(value):
+    """
+    'i/N' 형식의 샤드 지정 문자열 해석 (i는 1부터 N까지)
+    
+    Args:
+        value (str): 샤드 지정 문자열 (예: '2/8')
+        
+    Returns:
+        tuple: (샤드 번호, 전체 샤드 수)
+    """
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"샤드는 'i/N' 형식이어야 합니다: {value}")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"샤드 번호는 1부터 {count} 사이여야 합니다: {value}")
+    return index, count
+
+def shard_of(file_path, root, count):
+    """
+    파일이 속한 샤드 번호 계산
+    
+    루트 기준 상대 경로의 해시를 사용하므로 체크아웃 위치나 탐색 순서와
+    관계없이 같은 파일은 항상 같은 샤드에 배정됩니다.
+    
+    Args:
+        file_path (str): 파일 경로
+        root (str): 분석 루트 디렉토리
+        count (int): 전체 샤드 수
+        
+    Returns:
+        int: 1부터 count 사이의 샤드 번호
+    """
+    relative_path = os.path.relpath(file_path, root).replace(os.sep, '/')
+    digest = hashlib.sha1(relative_path.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count + 1
+
+def write_partial_results(path, results, root=None, shard=None):
+    """
+    분석 결과를 부분 결과 파일로 저장
+    
+    첫 줄은 헤더, 이후 한 줄에 결과 하나씩 gzip으로 압축된 JSON Lines 형식으로 씁니다.
+    
+    Args:
+        path (str): 저장할 파일 경로
+        results (list): 분석 결과 목록
+        root (str): 분석 루트 디렉토리
+        shard (tuple): (샤드 번호, 전체 샤드 수), 샤드 분석이 아니면 None
+    """
+    header = {
+        'format': PARTIAL_FORMAT,
+        'version': PARTIAL_VERSION,
+        'root': root,
+        'shard': list(shard) if shard else None,
+        'result_count': len(results)
+    }
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write(json.dumps(header, ensure_ascii=False) + "\n")
+        for result in results:
+            f.write(json.dumps(result, ensure_ascii=False, separators=(',', ':')) + "\n")
+
+def read_partial_results(path):
+    """
+    부분 결과 파일 읽기
+    
+    Args:
+        path (str): 부분 결과 파일 경로
+        
+    Returns:
+        tuple: (헤더 딕셔너리, 분석 결과 목록)
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        if header.get('format') != PARTIAL_FORMAT:
+            raise ValueError(f"부분 결과 파일이 아닙니다: {path}")
+        if header.get('version') != PARTIAL_VERSION:
+            raise ValueError(f"지원하지 않는 부분 결과 파일 버전입니다: {path}")
+        results = [json.loads(line) for line in f if line.strip()]
+    return header, results
+
+def merge_partial_results(paths):
+    """
+    여러 부분 결과 파일을 하나의 결과 목록으로 병합
+    
+    샤드 분석 결과는 원래의 파일 탐색 순서로 다시 정렬되므로, 병합 결과로 만든
+    보고서는 한 번에 분석한 보고서와 같습니다.
+    
+    Args:
+        paths (list): 부분 결과 파일 경로 목록
+        
+    Returns:
+        list: 병합된 분석 결과 목록
+        list: 병합 중 발견한 경고 메시지 목록
+        str: 부분 결과들의 공통 분석 루트 (기록되지 않았거나 서로 다르면 None)
+    """
+    results = []
+    warnings = []
+    shard_counts = set()
+    seen_shards = set()
+    roots = set()
+    
+    for path in paths:
+        header, partial = read_partial_results(path)
+        roots.add(header.get('root'))
+        if header['shard']:
+            index, count = header['shard']
+            shard_counts.add(count)
+            if (index, count) in seen_shards:
+                warnings.append(f"샤드 {index}/{count}가 중복되었습니다: {path}")
+            seen_shards.add((index, count))
+        results.extend(partial)
+    
+    if len(shard_counts) > 1:
+        warnings.append(f"전체 샤드 수가 서로 다른 부분 결과가 섞여 있습니다: {sorted(shard_counts)}")
+    elif shard_counts:
+        count = shard_counts.pop()
+        missing = sorted(set(range(1, count + 1)) - {index for index, _ in seen_shards})
+        if missing:
+            warnings.append(f"누락된 샤드: {', '.join(f'{index}/{count}' for index in missing)}")
+    
+    if len(roots) > 1:
+        warnings.append(f"분석 루트가 서로 다른 부분 결과가 섞여 있습니다: "
+                        f"{', '.join(sorted(str(root) for root in roots))}")
+    
+    results.sort(key=lambda result: result.get('discovery_index', 0))
+    for result in results:
+        result.pop('discovery_index', None)
+    
+    return results, warnings, roots.pop() if len(roots) == 1 else None
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PL/SQL 단위 분석기
+패키지 본문, 프로시저, 함수, 트리거를 한 번의 토큰 스캔으로 단위와 내장 SQL 문으로 나누고, SQL 문별 점수를 단위별로 집계하는 도구
+"""
+
+import re
+
+# 한 번의 스캔에 사용하는 토큰 패턴 (주석과 문자열은 건너뛰기 위해 먼저 매칭)
+_TOKEN_PATTERN = re.compile(
+    r"(?P<comment>--[^\n]*|/\*.*?(?:\*/|\Z))"
+    r"|(?P<string>[nN]?[qQ]'(?:\[.*?\]|\{.*?\}|\(.*?\)|<.*?>|(?P<qd>[^\s\[{(<]).*?(?P=qd))'"
+    r"|'(?:[^']|'')*(?:'|\Z)|\"[^\"]*(?:\"|\Z))"
+    r"|(?P<word>[A-Za-z][A-Za-z0-9_$#]*)"
+    r"|(?P<punct>[();])",
+    re.DOTALL
+)
+
+# CREATE 문 뒤의 단위 종류 앞에 올 수 있는 수식어
+_CREATE_MODIFIERS = {'OR', 'REPLACE', 'EDITIONABLE', 'NONEDITIONABLE'}
+
+# CREATE로 시작하는 PL/SQL 단위 종류
+_CREATE_KINDS = {'PACKAGE', 'PROCEDURE', 'FUNCTION', 'TRIGGER', 'TYPE'}
+
+# 내장 SQL 문을 시작하는 키워드
+_SQL_KEYWORDS = {'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'MERGE', 'WITH'}
+
+# CREATE 뒤 단위 이름 (스키마 한정 이름 포함)
+_NAME_PATTERN = re.compile(r'\s*((?:"[^"]+"|[A-Za-z][\w$#]*)(?:\s*\.\s*(?:"[^"]+"|[A-Za-z][\w$#]*))?)')
+
+# PL/SQL 소스 판별 패턴
+_PLSQL_PATTERN = re.compile(
+    r'^\s*CREATE\s+(?:OR\s+REPLACE\s+)?(?:(?:NON)?EDITIONABLE\s+)?'
+    r'(?:PACKAGE|PROCEDURE|FUNCTION|TRIGGER|TYPE\s+BODY)\b',
+    re.IGNORECASE | re.MULTILINE
+)
+
+def is_plsql_source(content):
+    """
+    내용이 PL/SQL 단위 정의(CREATE PACKAGE/PROCEDURE/FUNCTION/TRIGGER)인지 확인
+    
+    Args:
+        content (str): 파일 내용
+        
+    Returns:
+        bool: PL/SQL 소스 여부
+    """
+    return bool(_PLSQL_PATTERN.search(content))
+
+def _follows_dot(text, offset):
+    """
+    offset 앞의 공백이 아닌 첫 문자가 '.'인지 확인
+    
+    Args:
+        text (str): 소스
+        offset (int): 토큰 시작 위치
+        
+    Returns:
+        bool: 멤버 접근(예: v_tab.DELETE) 여부
+    """
+    index = offset - 1
+    while index >= 0 and text[index].isspace():
+        index -= 1
+    return index >= 0 and text[index] == '.'
+
+def parse_plsql(text):
+    """
+    PL/SQL 소스를 단위와 내장 SQL 문으로 분리
+    
+    BEGIN/END, DECLARE, IF/LOOP/CASE 중첩과 중첩 프로시저/함수를 스택으로 추적하며
+    소스를 한 번만 스캔합니다. 커서 선언(CURSOR ... IS SELECT)과 커서 FOR 루프의
+    SELECT도 SQL 문으로 추출됩니다. 본문 없는 선언(패키지 명세, 전방 선언)은 단위로
+    기록하지 않습니다. 단위 밖의 최상위 SQL 문(문의 첫 단어이거나 CREATE TABLE/VIEW ... AS
+    뒤의 SQL 문)은 unit이 None인 SQL 문으로 기록합니다.
+    
+    Args:
+        text (str): PL/SQL 소스
+        
+    Returns:
+        list: 단위 목록 (kind, name, start, end, start_line, end_line, parent, statements)
+        list: SQL 문 목록 (keyword, start, end, start_line, unit)
+    """
+    units = []
+    statements = []
+    stack = []
+    
+    position = 0
+    line = 1
+    line_position = 0
+    depth = 0
+    statement = None
+    pending_end = False
+    closing_units = []
+    create_words = None
+    create_start = None
+    top_level_start = True
+    previous_word = None
+    
+    def line_at(offset):
+        nonlocal line, line_position
+        line += text.count('\n', line_position, offset)
+        line_position = offset
+        return line
+    
+    def current_unit():
+        for frame in reversed(stack):
+            if frame['unit'] is not None:
+                return frame['unit']
+        return None
+    
+    def open_unit(kind, name, start, state, confirmed=True):
+        unit = {
+            'kind': kind,
+            'name': name,
+            'start': start,
+            'end': None,
+            'start_line': line_at(start),
+            'end_line': None,
+            'parent': current_unit(),
+            'statements': []
+        }
+        stack.append({'type': 'UNIT', 'kind': kind, 'state': state, 'unit': None, 'pending': unit})
+        if confirmed:
+            confirm_unit(stack[-1])
+    
+    def confirm_unit(frame):
+        if frame['pending'] is not None:
+            frame['unit'] = len(units)
+            units.append(frame['pending'])
+            frame['pending'] = None
+    
+    def close_frame():
+        frame = stack.pop()
+        if frame['unit'] is not None:
+            closing_units.append(frame['unit'])
+    
+    while True:
+        match = _TOKEN_PATTERN.search(text, position)
+        if match is None:
+            break
+        position = match.end()
+        
+        if match.lastgroup in ('comment', 'string'):
+            continue
+        
+        token = match.group(0).upper()
+        
+        # 1. 내장 SQL 문 내부: 괄호와 세미콜론만 추적
+        if statement is not None:
+            if token == '(':
+                depth += 1
+            elif token == ')':
+                depth -= 1
+                if depth < statement['depth']:
+                    statement['end'] = match.start()
+                    statement = None
+            elif token == ';' and depth <= statement['depth']:
+                statement['end'] = match.start()
+                statement = None
+                top_level_start = not stack
+            continue
+        
+        # 2. CREATE [OR REPLACE] <종류> <이름> 해석
+        if create_words is not None:
+            if token in _CREATE_MODIFIERS:
+                continue
+            if token in _CREATE_KINDS:
+                create_words.append(token)
+                continue
+            if token == 'BODY' and create_words:
+                create_words.append(token)
+                continue
+            if create_words:
+                name_match = _NAME_PATTERN.match(text, match.start())
+                name = name_match.group(1) if name_match else token
+                position = name_match.end() if name_match else match.end()
+                open_unit(" ".join(create_words), name, create_start, 'header')
+            create_words = None
+            continue
+        
+        # 3. END 뒤 토큰으로 END IF/LOOP/CASE와 블록 END 구분
+        if pending_end:
+            pending_end = False
+            if token in ('IF', 'LOOP', 'CASE'):
+                if stack and stack[-1]['type'] == token:
+                    stack.pop()
+                continue
+            if stack:
+                close_frame()
+        
+        if token == ';':
+            # 블록 종료 뒤 세미콜론에서 단위 끝 위치 확정
+            for unit_index in closing_units:
+                units[unit_index]['end'] = match.end()
+                units[unit_index]['end_line'] = line_at(match.end())
+            closing_units = []
+            if not stack:
+                top_level_start = True
+            
+            # 본문 없이 끝난 프로시저/함수 선언과 객체 타입 명세는 세미콜론에서 끝남
+            if stack and stack[-1]['type'] == 'UNIT' and depth == 0:
+                frame = stack[-1]
+                if frame['state'] == 'header' or frame['kind'] == 'TYPE':
+                    close_frame()
+                    if closing_units and closing_units[-1] == frame['unit']:
+                        units[frame['unit']]['end'] = match.end()
+                        units[frame['unit']]['end_line'] = line_at(match.end())
+                        closing_units = []
+            continue
+        
+        if token == '(':
+            depth += 1
+            continue
+        if token == ')':
+            depth = max(0, depth - 1)
+            continue
+        
+        top = stack[-1] if stack else None
+        
+        if token == 'CREATE' and top is None:
+            create_words = []
+            create_start = match.start()
+            continue
+        
+        # 4. 단위 머리(이름, 매개변수, RETURN 절): IS/AS/DECLARE/BEGIN까지는 SQL로 보지 않음
+        if top is not None and top['type'] == 'UNIT' and top['state'] == 'header':
+            if depth == 0 and token in ('IS', 'AS', 'DECLARE'):
+                top['state'] = 'declare'
+                confirm_unit(top)
+            elif depth == 0 and token == 'BEGIN':
+                top['state'] = 'body'
+                confirm_unit(top)
+            continue
+        
+        # 5. 블록 구조 키워드
+        if token in ('PROCEDURE', 'FUNCTION') and top is not None and top['state'] == 'declare':
+            # IS/AS가 나오기 전까지는 전방 선언일 수 있으므로 단위 확정을 미룸
+            name_match = _NAME_PATTERN.match(text, match.end())
+            open_unit(token, name_match.group(1) if name_match else '<unknown>',
+                      match.start(), 'header', confirmed=False)
+            continue
+        
+        if token == 'BEGIN':
+            if top is not None and top['state'] == 'declare':
+                top['state'] = 'body'
+            elif top is None:
+                open_unit('BLOCK', '<anonymous>', match.start(), 'body')
+            else:
+                stack.append({'type': 'BEGIN', 'state': 'body', 'unit': None, 'pending': None})
+            continue
+        
+        if token == 'DECLARE':
+            if top is None:
+                open_unit('BLOCK', '<anonymous>', match.start(), 'declare')
+            else:
+                stack.append({'type': 'DECLARE', 'state': 'declare', 'unit': None, 'pending': None})
+            continue
+        
+        if token in ('IF', 'LOOP', 'CASE') and top is not None:
+            stack.append({'type': token, 'state': 'body', 'unit': None, 'pending': None})
+            continue
+        
+        if token == 'END' and top is not None:
+            pending_end = True
+            continue
+        
+        # 6. 내장 SQL 문 시작 (컬렉션 메서드 호출 v_tab.DELETE 등은 제외)
+        #    단위 밖에서는 문의 첫 단어이거나 AS 뒤일 때만 SQL 문으로 봄 (GRANT SELECT ON 등 제외)
+        if top is None:
+            starts_statement = top_level_start or previous_word == 'AS'
+            top_level_start = False
+            previous_word = token
+        else:
+            starts_statement = not _follows_dot(text, match.start())
+        if token in _SQL_KEYWORDS and starts_statement:
+            statement = {
+                'keyword': token,
+                'start': match.start(),
+                'end': len(text),
+                'start_line': line_at(match.start()),
+                'unit': current_unit(),
+                'depth': depth
+            }
+            statements.append(statement)
+            if statement['unit'] is not None:
+                units[statement['unit']]['statements'].append(len(statements) - 1)
+    
+    # 끝나지 않은 단위는 소스 끝까지로 처리
+    for unit in units:
+        if unit['end'] is None:
+            unit['end'] = len(text)
+            unit['end_line'] = line_at(len(text))
+    for statement in statements:
+        statement.pop('depth', None)
+    
+    return units, statements
+
+def analyze_plsql(text, score_query):
+    """
+    PL/SQL 소스의 SQL 문을 각각 점수화하고 단위별로 집계
+    
+    SQL 문마다 한 번씩만 점수를 계산하므로 전체 작업량은 소스 크기에 비례합니다.
+    단위 집계에는 중첩된 하위 단위의 SQL 문도 포함됩니다.
+    
+    Args:
+        text (str): PL/SQL 소스
+        score_query (callable): SQL 문 점수 함수 (calculate_query_complexity 형식)
+        
+    Returns:
+        dict: 분석 결과 (SQL 문이 없으면 None)
+            - complexity_score: SQL 문 중 최고 점수
+            - detailed_scores: 최고 점수 SQL 문의 세부 평가 요소 점수
+            - statement_count: SQL 문 수
+            - statements: SQL 문별 점수 목록 (keyword, start, end, start_line, unit, score, detailed_scores)
+            - units: 단위별 집계 목록
+    """
+    units, statements = parse_plsql(text)
+    if not statements:
+        return None
+    
+    statement_scores = []
+    statement_results = []
+    for statement in statements:
+        score, scores = score_query(text[statement['start']:statement['end']])
+        statement_scores.append(score)
+        statement_results.append({
+            'keyword': statement['keyword'],
+            'start': statement['start'],
+            'end': statement['end'],
+            'start_line': statement['start_line'],
+            'unit': statement['unit'],
+            'score': score,
+            'detailed_scores': scores
+        })
+    
+    # 파일 점수와 세부 점수가 같은 SQL 문에서 나오도록 최고 점수 SQL 문(동점이면 앞선 문)을 대표로 사용
+    top_statement = max(statement_results, key=lambda statement: statement['score'])
+    
+    # 하위 단위의 SQL 문을 상위 단위로 올려 집계 (단위는 부모보다 뒤에 기록됨)
+    rolled_up = [list(unit['statements']) for unit in units]
+    for index in range(len(units) - 1, -1, -1):
+        parent = units[index]['parent']
+        if parent is not None:
+            rolled_up[parent].extend(rolled_up[index])
+    
+    unit_summaries = []
+    for unit, statement_indexes in zip(units, rolled_up):
+        scores = [statement_scores[index] for index in statement_indexes]
+        unit_summaries.append({
+            'kind': unit['kind'],
+            'name': unit['name'],
+            'start': unit['start'],
+            'end': unit['end'],
+            'start_line': unit['start_line'],
+            'end_line': unit['end_line'],
+            'parent': unit['parent'],
+            'statement_count': len(scores),
+            'max_score': max(scores) if scores else 0,
+            'mean_score': round(sum(scores) / len(scores), 1) if scores else 0
+        })
+    
+    return {
+        'complexity_score': top_statement['score'],
+        'detailed_scores': top_statement['detailed_scores'],
+        'statement_count': len(statements),
+        'statements': statement_results,
+        'units': unit_summaries
+    }
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+유사 쿼리 클러스터링
+토큰 shingle과 MinHash 서명, LSH 버킷을 사용하여 거의 동일한 쿼리를 묶는 도구
+"""
+
+import re
+import random
+import zlib
+
+# MinHash 기본 설정
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.8
+SHINGLE_SIZE = 5
+
+# 해시 계산용 메르센 소수 (2^61 - 1)
+_MERSENNE_PRIME = (1 << 61) - 1
+
+# 주석, 문자열 리터럴, 숫자, 식별자, 기호 순으로 토큰 분리
+_TOKEN_PATTERN = re.compile(
+    r"--[^\n]*|/\*.*?\*/|'(?:[^']|'')*'|\d+(?:\.\d+)?|[A-Z_][A-Z0-9_$#]*|\S",
+    re.DOTALL
+)
+
+def tokenize_query(query):
+    """
+    쿼리를 정규화된 토큰 목록으로 변환
+    
+    주석은 제거하고 문자열/숫자 리터럴은 자리표시자로 바꾸어,
+    값만 다른 복사본이 같은 토큰열을 갖도록 합니다.
+    
+    Args:
+        query (str): SQL 쿼리 또는 MyBatis XML
+        
+    Returns:
+        list: 정규화된 토큰 목록
+    """
+    tokens = []
+    for match in _TOKEN_PATTERN.finditer(query.upper()):
+        token = match.group(0)
+        if token.startswith('--') or token.startswith('/*'):
+            continue
+        if token.startswith("'"):
+            token = "'?'"
+        elif token[0].isdigit():
+            token = '0'
+        tokens.append(token)
+    return tokens
+
+def shingle_hashes(tokens, size=SHINGLE_SIZE):
+    """
+    연속된 토큰 shingle의 32비트 해시 집합 계산
+    
+    Args:
+        tokens (list): 토큰 목록
+        size (int): shingle 길이 (토큰 수)
+        
+    Returns:
+        set: shingle 해시 집합
+    """
+    if len(tokens) < size:
+        return {zlib.crc32(" ".join(tokens).encode('utf-8'))} if tokens else set()
+    return {
+        zlib.crc32(" ".join(tokens[i:i + size]).encode('utf-8'))
+        for i in range(len(tokens) - size + 1)
+    }
+
+class MinHasher:
+    """
+    고정된 난수 시드로 MinHash 서명을 계산하는 클래스
+    
+    같은 num_perm/seed로 만든 서명끼리만 비교할 수 있습니다.
+    
+    Args:
+        num_perm (int): 해시 함수(서명 길이) 수
+        seed (int): 해시 계수 생성 시드
+    """
+    
+    def __init__(self, num_perm=DEFAULT_NUM_PERM, seed=1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._coefficients = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+    
+    def signature(self, hashes):
+        """
+        shingle 해시 집합의 MinHash 서명 계산
+        
+        Args:
+            hashes (set): shingle 해시 집합
+            
+        Returns:
+            tuple: 길이 num_perm의 서명
+        """
+        if not hashes:
+            return tuple([_MERSENNE_PRIME] * self.num_perm)
+        return tuple(
+            min((a * x + b) % _MERSENNE_PRIME for x in hashes)
+            for a, b in self._coefficients
+        )
+    
+    def query_signature(self, query):
+        """
+        쿼리 문자열의 MinHash 서명 계산
+        
+        Args:
+            query (str): SQL 쿼리 또는 MyBatis XML
+            
+        Returns:
+            tuple: MinHash 서명
+        """
+        return self.signature(shingle_hashes(tokenize_query(query)))
+
+def estimate_similarity(signature_a, signature_b):
+    """
+    두 MinHash 서명으로 Jaccard 유사도 추정
+    
+    Args:
+        signature_a (tuple): MinHash 서명
+        signature_b (tuple): MinHash 서명
+        
+    Returns:
+        float: 0-1 사이의 추정 유사도
+    """
+    matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return matches / len(signature_a)
+
+def cluster_signatures(signatures, threshold=DEFAULT_THRESHOLD, bands=DEFAULT_BANDS):
+    """
+    LSH 밴딩으로 유사한 서명을 클러스터로 묶음
+    
+    같은 밴드 버킷에 들어간 후보 쌍만 비교하므로 전체 쌍을 비교하지 않습니다.
+    후보는 버킷의 첫 항목과의 추정 유사도가 threshold 이상일 때만 합쳐집니다.
+    
+    Args:
+        signatures (list): MinHash 서명 목록 (None이면 클러스터링 대상에서 제외)
+        threshold (float): 같은 클러스터로 볼 최소 추정 유사도
+        bands (int): LSH 밴드 수 (서명 길이의 약수여야 함)
+        
+    Returns:
+        list: 클러스터 목록 (각 클러스터는 입력 인덱스의 오름차순 리스트)
+    """
+    parent = list(range(len(signatures)))
+    
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+    
+    buckets = {}
+    for index, signature in enumerate(signatures):
+        if signature is None:
+            continue
+        rows = len(signature) // bands
+        for band in range(bands):
+            key = (band, signature[band * rows:(band + 1) * rows])
+            first = buckets.setdefault(key, index)
+            if first == index:
+                continue
+            root_a, root_b = find(first), find(index)
+            if root_a != root_b and estimate_similarity(signatures[first], signature) >= threshold:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+    
+    clusters = {}
+    for index in range(len(signatures)):
+        clusters.setdefault(find(index), []).append(index)
+    
+    return sorted(clusters.values(), key=lambda members: members[0])
@@ -9,6 +9,29 @@ Oracle SQL 쿼리의 복잡도를 0-10 척도로 평가하는 도구
 import re
 import sqlparse
 
+# 카테고리별 최대 점수
+MAX_SCORES = {
+    "structural_complexity": 3.5,
+    "oracle_specific_features": 3.0,
+    "functions_expressions": 2.0,
+    "data_volume": 2.0,
+    "execution_complexity": 1.5,
+    "postgres_conversion": 2.0
+}
+
+# PostgreSQL 변환 시 재작성이 필요한 Oracle 특화 문법
+ORACLE_SPECIFIC_PATTERNS = [
+    r'\bCONNECT\s+BY\b', r'\bSTART\s+WITH\b', r'\bPRIOR\b',
+    r'\bMODEL\b', r'\b(PIVOT|UNPIVOT)\b', r'\bFLASHBACK\b',
+    r'\bSYS_CONNECT_BY_PATH\b', r'\bROWID\b', r'\bROWNUM\b'
+]
+
+# PostgreSQL에 직접 대응되지 않는 Oracle 함수
+ORACLE_FUNCTION_PATTERNS = [
+    r'\bDECODE\s*\(', r'\bNVL2\s*\(', r'\bLISTAGG\s*\(',
+    r'\bREGEXP_', r'\bSYS_CONTEXT\s*\(', r'\bEXTRACT\s*\('
+]
+
 def calculate_query_complexity(query):
     """
     Oracle 쿼리의 복잡도를 0-10 척도로 평가하는 함수
@@ -35,52 +58,13 @@ def calculate_query_complexity(query):
     }
     
     # 1. 구조적 복잡성 평가
-    # 테이블 조인 수 계산
-    join_count = len(re.findall(r'\bJOIN\b', query))
-    if "," in query and "FROM" in query:
-        # 암시적 조인도 계산
-        from_clause = re.search(r'FROM\s+(.*?)(?:WHERE|GROUP BY|ORDER BY|HAVING|$)', query, re.DOTALL)
-        if from_clause:
-            tables = from_clause.group(1).split(',')
-            join_count += max(0, len(tables) - 1)
-    
-    if join_count == 0:
-        scores["structural_complexity"] += 0
-    elif join_count <= 2:
-        scores["structural_complexity"] += 1
-    elif join_count <= 4:
-        scores["structural_complexity"] += 2
-    else:
-        scores["structural_complexity"] += 3
+    # 테이블 조인 수 계산 (암시적 조인 포함)
+    join_count = _count_joins(query)
+    scores["structural_complexity"] += _join_count_score(join_count)
     
     # 서브쿼리 중첩 깊이 계산
-    subquery_depth = 0
-    open_parens = 0
-    max_depth = 0
-    select_in_parens = False
-    
-    for char in query:
-        if char == '(':
-            open_parens += 1
-            if 'SELECT' in query[max(0, query.find(char)-10):query.find(char)]:
-                select_in_parens = True
-                subquery_depth += 1
-                max_depth = max(max_depth, subquery_depth)
-        elif char == ')':
-            if open_parens > 0:
-                open_parens -= 1
-                if select_in_parens:
-                    subquery_depth -= 1
-                    select_in_parens = False
-    
-    if max_depth == 0:
-        scores["structural_complexity"] += 0
-    elif max_depth == 1:
-        scores["structural_complexity"] += 1
-    elif max_depth == 2:
-        scores["structural_complexity"] += 2
-    else:
-        scores["structural_complexity"] += 3 + min(2, max_depth - 2)  # 3단계 이상은 추가 점수
+    max_depth = _subquery_depth(query)
+    scores["structural_complexity"] += _subquery_depth_score(max_depth)
     
     # WITH 절(CTE) 사용 수
     cte_count = len(re.findall(r'\bWITH\b', query))
@@ -114,10 +98,7 @@ def calculate_query_complexity(query):
     scores["functions_expressions"] += min(2, agg_functions * 0.5)
     
     # 사용자 정의 함수 호출 추정 (정확한 판단은 어려움)
-    # 일반적인 내장 함수가 아닌 함수 호출 패턴 찾기
-    std_functions = r'(COUNT|SUM|AVG|MIN|MAX|SUBSTR|INSTR|TO_DATE|TO_CHAR|NVL|DECODE|CASE|CAST|CONVERT)'
-    potential_udf = len(re.findall(r'[A-Z0-9_]+\s*\(', query)) - len(re.findall(r'\b' + std_functions + r'\s*\(', query))
-    scores["functions_expressions"] += min(2, max(0, potential_udf * 0.5))
+    scores["functions_expressions"] += _user_function_score(query)
     
     # CASE 표현식 복잡도
     case_count = len(re.findall(r'\bCASE\b', query))
@@ -129,15 +110,7 @@ def calculate_query_complexity(query):
     
     # 4. 데이터 처리 볼륨 (정적 분석으로는 정확한 평가 어려움)
     # 여기서는 쿼리의 길이와 복잡성을 기반으로 추정
-    query_length = len(query)
-    if query_length < 200:
-        scores["data_volume"] += 0.5
-    elif query_length < 500:
-        scores["data_volume"] += 1
-    elif query_length < 1000:
-        scores["data_volume"] += 1.5
-    else:
-        scores["data_volume"] += 2
+    scores["data_volume"] += _data_volume_score(len(query))
     
     # 5. 실행 계획 복잡성 (정적 분석으로는 제한적 평가)
     # 여기서는 쿼리의 구조적 특성을 기반으로 추정
@@ -155,48 +128,355 @@ def calculate_query_complexity(query):
     
     # 6. PostgreSQL 변환 난이도
     # Oracle 특화 기능 사용 정도
-    oracle_specific = [
-        r'\bCONNECT\s+BY\b', r'\bSTART\s+WITH\b', r'\bPRIOR\b',
-        r'\bMODEL\b', r'\b(PIVOT|UNPIVOT)\b', r'\bFLASHBACK\b',
-        r'\bSYS_CONNECT_BY_PATH\b', r'\bROWID\b', r'\bROWNUM\b'
-    ]
-    
-    for pattern in oracle_specific:
+    for pattern in ORACLE_SPECIFIC_PATTERNS:
         if re.search(pattern, query):
             scores["postgres_conversion"] += 1
     
     # 특수 함수 사용
-    oracle_functions = [
-        r'\bDECODE\s*\(', r'\bNVL2\s*\(', r'\bLISTAGG\s*\(',
-        r'\bREGEXP_', r'\bSYS_CONTEXT\s*\(', r'\bEXTRACT\s*\('
-    ]
-    
-    for pattern in oracle_functions:
+    for pattern in ORACLE_FUNCTION_PATTERNS:
         if re.search(pattern, query):
             scores["postgres_conversion"] += 0.5
     
-    # 총점 계산 (각 카테고리 최대 점수 제한)
-    max_scores = {
-        "structural_complexity": 3.5,
-        "oracle_specific_features": 3.0,
-        "functions_expressions": 2.0,
-        "data_volume": 2.0,
-        "execution_complexity": 1.5,
-        "postgres_conversion": 2.0
-    }
+    return _finalize_scores(scores)
+
+def _count_joins(query):
+    """
+    명시적 JOIN과 FROM 절의 암시적 조인(쉼표로 나열된 테이블) 수 계산
+    
+    Args:
+        query (str): 대문자로 정규화된 쿼리
+        
+    Returns:
+        int: 조인 수
+    """
+    join_count = len(re.findall(r'\bJOIN\b', query))
+    if "," in query and "FROM" in query:
+        # 암시적 조인도 계산
+        from_clause = re.search(r'FROM\s+(.*?)(?:WHERE|GROUP BY|ORDER BY|HAVING|$)', query, re.DOTALL)
+        if from_clause:
+            tables = from_clause.group(1).split(',')
+            join_count += max(0, len(tables) - 1)
+    return join_count
+
+def _join_count_score(join_count):
+    """
+    조인 수에 따른 구조적 복잡성 점수
+    
+    Args:
+        join_count (int): 조인 수
+        
+    Returns:
+        int: 점수
+    """
+    if join_count == 0:
+        return 0
+    elif join_count <= 2:
+        return 1
+    elif join_count <= 4:
+        return 2
+    return 3
+
+def _subquery_depth(query):
+    """
+    서브쿼리 최대 중첩 깊이 계산
+    
+    Args:
+        query (str): 대문자로 정규화된 쿼리
+        
+    Returns:
+        int: 최대 중첩 깊이
+    """
+    subquery_depth = 0
+    open_parens = 0
+    max_depth = 0
+    select_in_parens = False
+    
+    for char in query:
+        if char == '(':
+            open_parens += 1
+            if 'SELECT' in query[max(0, query.find(char)-10):query.find(char)]:
+                select_in_parens = True
+                subquery_depth += 1
+                max_depth = max(max_depth, subquery_depth)
+        elif char == ')':
+            if open_parens > 0:
+                open_parens -= 1
+                if select_in_parens:
+                    subquery_depth -= 1
+                    select_in_parens = False
     
+    return max_depth
+
+def _subquery_depth_score(max_depth):
+    """
+    서브쿼리 중첩 깊이에 따른 구조적 복잡성 점수
+    
+    Args:
+        max_depth (int): 최대 중첩 깊이
+        
+    Returns:
+        int: 점수
+    """
+    if max_depth == 0:
+        return 0
+    elif max_depth == 1:
+        return 1
+    elif max_depth == 2:
+        return 2
+    return 3 + min(2, max_depth - 2)  # 3단계 이상은 추가 점수
+
+def _user_function_score(query):
+    """
+    일반적인 내장 함수가 아닌 함수 호출 패턴으로 사용자 정의 함수 점수 추정
+    
+    Args:
+        query (str): 대문자로 정규화된 쿼리
+        
+    Returns:
+        float: 점수
+    """
+    std_functions = r'(COUNT|SUM|AVG|MIN|MAX|SUBSTR|INSTR|TO_DATE|TO_CHAR|NVL|DECODE|CASE|CAST|CONVERT)'
+    potential_udf = len(re.findall(r'[A-Z0-9_]+\s*\(', query)) - len(re.findall(r'\b' + std_functions + r'\s*\(', query))
+    return min(2, max(0, potential_udf * 0.5))
+
+def _data_volume_score(query_length):
+    """
+    쿼리 길이에 따른 데이터 처리 볼륨 추정 점수
+    
+    Args:
+        query_length (int): 쿼리 길이
+        
+    Returns:
+        float: 점수
+    """
+    if query_length < 200:
+        return 0.5
+    elif query_length < 500:
+        return 1
+    elif query_length < 1000:
+        return 1.5
+    return 2
+
+def _is_saturated(scores, category):
+    """
+    카테고리 점수가 최대 점수에 도달했는지 확인 (이후 규칙은 총점에 영향 없음)
+    
+    Args:
+        scores (dict): 카테고리별 원점수
+        category (str): 카테고리
+        
+    Returns:
+        bool: 최대 점수 도달 여부
+    """
+    return scores[category] >= MAX_SCORES[category]
+
+def calculate_complexity_score(query):
+    """
+    세부 점수 없이 총점만 계산하는 빠른 모드
+    
+    calculate_query_complexity와 같은 규칙과 최대 점수 제한을 사용하므로 총점은 같습니다.
+    저비용 규칙부터 평가하며 최대 점수에 도달한 카테고리의 나머지 규칙은 건너뛰고,
+    모든 카테고리가 최대 점수에 도달하면 남은 규칙 없이 10.0을 반환합니다.
+    점수에 쓰이지 않는 sqlparse 파싱도 생략합니다.
+    
+    Args:
+        query (str): 평가할 Oracle SQL 쿼리
+        
+    Returns:
+        float: 0-10 사이의 복잡도 점수
+    """
+    query = query.strip().upper()
+    if not query:
+        # calculate_query_complexity와 마찬가지로 빈 쿼리는 분석하지 않음
+        raise ValueError("분석할 쿼리가 없습니다")
+    
+    scores = {category: 0 for category in MAX_SCORES}
+    
+    # 저비용 규칙 (길이, 키워드, 단순 정규식)
+    scores["data_volume"] += _data_volume_score(len(query))
+    
+    for keyword in ("ORDER BY", "GROUP BY", "HAVING"):
+        if keyword in query:
+            scores["execution_complexity"] += 0.5
+    
+    if re.search(r'\bCONNECT\s+BY\b', query):
+        scores["oracle_specific_features"] += 2
+    if not _is_saturated(scores, "oracle_specific_features"):
+        scores["oracle_specific_features"] += min(3, len(re.findall(r'\bOVER\s*\(', query)))
+    if not _is_saturated(scores, "oracle_specific_features") and re.search(r'\b(PIVOT|UNPIVOT)\b', query):
+        scores["oracle_specific_features"] += 2
+    if not _is_saturated(scores, "oracle_specific_features") and re.search(r'\bMODEL\b', query):
+        scores["oracle_specific_features"] += 3
+    
+    for points, patterns in ((1, ORACLE_SPECIFIC_PATTERNS), (0.5, ORACLE_FUNCTION_PATTERNS)):
+        for pattern in patterns:
+            if _is_saturated(scores, "postgres_conversion"):
+                break
+            if re.search(pattern, query):
+                scores["postgres_conversion"] += points
+    
+    agg_functions = len(re.findall(r'\b(COUNT|SUM|AVG|MIN|MAX|STDDEV|VARIANCE)\s*\(', query))
+    scores["functions_expressions"] += min(2, agg_functions * 0.5)
+    if not _is_saturated(scores, "functions_expressions"):
+        scores["functions_expressions"] += min(2, len(re.findall(r'\bCASE\b', query)) * 0.5)
+    if not _is_saturated(scores, "functions_expressions") and re.search(r'\bREGEXP_', query):
+        scores["functions_expressions"] += 1
+    
+    scores["structural_complexity"] += min(2, len(re.findall(r'\bWITH\b', query)))
+    if not _is_saturated(scores, "structural_complexity"):
+        scores["structural_complexity"] += min(2, len(re.findall(r'\b(UNION|INTERSECT|MINUS)\b', query)))
+    
+    # 모든 카테고리가 최대 점수이면 남은 규칙은 총점을 바꿀 수 없음
+    if all(_is_saturated(scores, category) for category in MAX_SCORES):
+        return 10.0
+    
+    # 고비용 규칙 (문자 단위 괄호 탐색, 사용자 정의 함수 추정, 암시적 조인 탐색)은
+    # 해당 카테고리가 최대 점수에 도달하지 않았을 때만 평가
+    max_depth = None
+    join_count = None
+    if not _is_saturated(scores, "execution_complexity"):
+        max_depth = _subquery_depth(query)
+        if max_depth <= 1:
+            join_count = _count_joins(query)
+        if max_depth > 1 or join_count > 3:
+            scores["execution_complexity"] += 1
+    
+    if not _is_saturated(scores, "functions_expressions"):
+        scores["functions_expressions"] += _user_function_score(query)
+    
+    if not _is_saturated(scores, "structural_complexity"):
+        if max_depth is None:
+            max_depth = _subquery_depth(query)
+        scores["structural_complexity"] += _subquery_depth_score(max_depth)
+    if not _is_saturated(scores, "structural_complexity"):
+        if join_count is None:
+            join_count = _count_joins(query)
+        scores["structural_complexity"] += _join_count_score(join_count)
+    
+    return _finalize_scores(scores)[0]
+
+def _finalize_scores(scores):
+    """
+    카테고리별 점수에 최대 점수 제한을 적용하고 0-10 척도로 정규화
+    
+    Args:
+        scores (dict): 카테고리별 원점수
+        
+    Returns:
+        float: 0-10 사이의 복잡도 점수
+        dict: 최대 점수가 적용된 세부 점수
+    """
+    # 총점 계산 (각 카테고리 최대 점수 제한)
     for category in scores:
-        scores[category] = min(scores[category], max_scores[category])
+        scores[category] = min(scores[category], MAX_SCORES[category])
     
     # 최종 복잡도 점수 계산 (0-10 척도로 정규화)
     total_score = sum(scores.values())
-    normalized_score = min(10, total_score * 10 / sum(max_scores.values()))
+    normalized_score = min(10, total_score * 10 / sum(MAX_SCORES.values()))
     
     # 복잡도 레벨 결정
     complexity_level = round(normalized_score, 1)
     
     return complexity_level, scores
 
+def estimate_query_complexity(query):
+    """
+    선형 시간 규칙만 사용하는 저비용 복잡도 추정 (degraded 모드)
+    
+    시간/크기 예산을 초과한 파일에 사용하며, 역추적이 큰 암시적 조인 탐색,
+    사용자 정의 함수 추정, sqlparse 파싱을 생략합니다.
+    
+    Args:
+        query (str): 평가할 Oracle SQL 쿼리
+        
+    Returns:
+        float: 0-10 사이의 복잡도 점수 (근사값)
+        dict: 세부 평가 요소별 점수
+    """
+    query = query.strip().upper()
+    
+    scores = {category: 0 for category in MAX_SCORES}
+    
+    # 1. 구조적 복잡성 (명시적 조인과 괄호 깊이만 사용)
+    join_count = len(re.findall(r'\bJOIN\b', query))
+    if join_count == 0:
+        scores["structural_complexity"] += 0
+    elif join_count <= 2:
+        scores["structural_complexity"] += 1
+    elif join_count <= 4:
+        scores["structural_complexity"] += 2
+    else:
+        scores["structural_complexity"] += 3
+    
+    # 서브쿼리 깊이: "(SELECT" 위치를 한 번만 훑으며 괄호 깊이로 추정
+    max_depth = 0
+    depth_stack = []
+    paren_depth = 0
+    for match in re.finditer(r'\(\s*(SELECT\b)?|\)', query):
+        if match.group(0) == ')':
+            if depth_stack and depth_stack[-1] == paren_depth:
+                depth_stack.pop()
+            paren_depth = max(0, paren_depth - 1)
+        else:
+            paren_depth += 1
+            if match.group(1):
+                depth_stack.append(paren_depth)
+                max_depth = max(max_depth, len(depth_stack))
+    
+    if max_depth == 1:
+        scores["structural_complexity"] += 1
+    elif max_depth == 2:
+        scores["structural_complexity"] += 2
+    elif max_depth > 2:
+        scores["structural_complexity"] += 3 + min(2, max_depth - 2)
+    
+    scores["structural_complexity"] += min(2, len(re.findall(r'\bWITH\b', query)))
+    scores["structural_complexity"] += min(2, len(re.findall(r'\b(UNION|INTERSECT|MINUS)\b', query)))
+    
+    # 2. Oracle 특화 기능
+    if re.search(r'\bCONNECT\s+BY\b', query):
+        scores["oracle_specific_features"] += 2
+    scores["oracle_specific_features"] += min(3, len(re.findall(r'\bOVER\s*\(', query)))
+    if re.search(r'\b(PIVOT|UNPIVOT)\b', query):
+        scores["oracle_specific_features"] += 2
+    if re.search(r'\bMODEL\b', query):
+        scores["oracle_specific_features"] += 3
+    
+    # 3. 함수 및 표현식 (사용자 정의 함수 추정 생략)
+    agg_functions = len(re.findall(r'\b(COUNT|SUM|AVG|MIN|MAX|STDDEV|VARIANCE)\s*\(', query))
+    scores["functions_expressions"] += min(2, agg_functions * 0.5)
+    scores["functions_expressions"] += min(2, len(re.findall(r'\bCASE\b', query)) * 0.5)
+    if re.search(r'\bREGEXP_', query):
+        scores["functions_expressions"] += 1
+    
+    # 4. 데이터 처리 볼륨
+    query_length = len(query)
+    if query_length < 200:
+        scores["data_volume"] += 0.5
+    elif query_length < 500:
+        scores["data_volume"] += 1
+    elif query_length < 1000:
+        scores["data_volume"] += 1.5
+    else:
+        scores["data_volume"] += 2
+    
+    # 5. 실행 계획 복잡성
+    if join_count > 3 or max_depth > 1:
+        scores["execution_complexity"] += 1
+    for keyword in ("ORDER BY", "GROUP BY", "HAVING"):
+        if keyword in query:
+            scores["execution_complexity"] += 0.5
+    
+    # 6. PostgreSQL 변환 난이도
+    for pattern in ORACLE_SPECIFIC_PATTERNS:
+        if re.search(pattern, query):
+            scores["postgres_conversion"] += 1
+    for pattern in ORACLE_FUNCTION_PATTERNS:
+        if re.search(pattern, query):
+            scores["postgres_conversion"] += 0.5
+    
+    return _finalize_scores(scores)
+
 def get_complexity_description(score):
     """
     복잡도 점수에 따른 설명 반환
@@ -220,12 +500,13 @@ def get_complexity_description(score):
     else:
         return "극도로 복잡 (Extremely Complex)"
 
-def analyze_query(query):
+def analyze_query(query, verbose=True):
     """
     쿼리를 분석하고 복잡도 결과를 출력
     
     Args:
         query (str): 분석할 Oracle SQL 쿼리
+        verbose (bool): 결과를 콘솔에 출력할지 여부
         
     Returns:
         tuple: (복잡도 점수, 복잡도 설명, 세부 점수 딕셔너리)
@@ -233,10 +514,11 @@ def analyze_query(query):
     complexity_score, detailed_scores = calculate_query_complexity(query)
     description = get_complexity_description(complexity_score)
     
-    print(f"쿼리 복잡도 점수: {complexity_score}/10 - {description}")
-    print("\n세부 평가 요소:")
-    for category, score in detailed_scores.items():
-        print(f"- {category}: {score}")
+    if verbose:
+        print(f"쿼리 복잡도 점수: {complexity_score}/10 - {description}")
+        print("\n세부 평가 요소:")
+        for category, score in detailed_scores.items():
+            print(f"- {category}: {score}")
     
     return complexity_score, description, detailed_scores
 
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+분석 결과 통계 집계기
+분석 결과를 한 번만 순회하며 병합 가능한 요약 통계(개수, 합계, 최솟값/최댓값, 백분위수)를 유지하는 도구
+"""
+
+import os
+from collections import Counter
+
+# 히스토그램 해상도: 점수는 소수 첫째 자리까지 구분
+HISTOGRAM_SCALE = 10
+
+# 보고서에 표시하는 백분위수
+REPORT_PERCENTILES = (50, 90, 99)
+
+class ScoreSummary:
+    """
+    하나의 점수 계열에 대한 병합 가능한 요약 통계
+    
+    점수는 추가할 때 0.1 단위로 양자화하여 히스토그램으로 보관합니다. 분석기가 만드는
+    점수는 이미 0.1 단위(반올림 또는 0.1의 배수 가중치 합)이므로 값이 바뀌지 않고,
+    합계, 최솟값/최댓값, 백분위수는 양자화된 점수 기준으로 정확하며 병합 순서와
+    관계없이 한 번에 집계한 것과 같은 결과가 나옵니다. 0.1 단위가 아닌 점수는 가장
+    가까운 0.1 단위 값으로 집계됩니다.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.minimum = None
+        self.maximum = None
+        self.histogram = Counter()
+    
+    def add(self, value):
+        """
+        점수 하나 추가 (0.1 단위로 양자화)
+        
+        Args:
+            value (float): 점수
+        """
+        bucket = int(round(value * HISTOGRAM_SCALE))
+        value = bucket / HISTOGRAM_SCALE
+        self.count += 1
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+        self.histogram[bucket] += 1
+    
+    def merge(self, other):
+        """
+        다른 요약 통계를 현재 요약에 합침
+        
+        Args:
+            other (ScoreSummary): 합칠 요약 통계
+        """
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.minimum = other.minimum if self.minimum is None else min(self.minimum, other.minimum)
+        self.maximum = other.maximum if self.maximum is None else max(self.maximum, other.maximum)
+        self.histogram.update(other.histogram)
+    
+    @property
+    def total(self):
+        """
+        점수 합계 (히스토그램 해상도 기준)
+        """
+        return sum(bucket * count for bucket, count in self.histogram.items()) / HISTOGRAM_SCALE
+    
+    @property
+    def mean(self):
+        """
+        평균 점수 (값이 없으면 None)
+        """
+        return self.total / self.count if self.count else None
+    
+    def percentile(self, percent):
+        """
+        nearest-rank 방식의 백분위수 계산
+        
+        Args:
+            percent (float): 0-100 사이의 백분위
+            
+        Returns:
+            float: 백분위수 (값이 없으면 None)
+        """
+        if not self.count:
+            return None
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for bucket in sorted(self.histogram):
+            seen += self.histogram[bucket]
+            if seen >= rank:
+                return bucket / HISTOGRAM_SCALE
+        return self.maximum
+    
+    def to_dict(self):
+        """
+        JSON 직렬화 가능한 딕셔너리로 변환
+        
+        Returns:
+            dict: 요약 통계
+        """
+        return {
+            'count': self.count,
+            'min': self.minimum,
+            'max': self.maximum,
+            'histogram': {str(bucket): count for bucket, count in self.histogram.items()}
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        to_dict 결과로부터 요약 통계 복원
+        
+        Args:
+            data (dict): 요약 통계 딕셔너리
+            
+        Returns:
+            ScoreSummary: 복원된 요약 통계
+        """
+        summary = cls()
+        summary.count = data['count']
+        summary.minimum = data['min']
+        summary.maximum = data['max']
+        summary.histogram = Counter({int(bucket): count for bucket, count in data['histogram'].items()})
+        return summary
+
+def _ancestor_directories(file_path):
+    """
+    파일이 있는 디렉토리부터 최상위 디렉토리까지의 경로
+    
+    Args:
+        file_path (str): 파일 경로
+        
+    Yields:
+        str: 디렉토리 경로 (가까운 디렉토리부터)
+    """
+    directory = os.path.dirname(file_path)
+    while True:
+        yield directory
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+
+def _is_within(directory, root):
+    """
+    디렉토리가 root 자신이거나 그 하위 디렉토리인지 확인
+    
+    Args:
+        directory (str): 디렉토리 경로
+        root (str): 기준 디렉토리 경로
+        
+    Returns:
+        bool: 포함 여부
+    """
+    if not root or directory == root:
+        return True
+    prefix = root.rstrip('/' + os.sep)
+    return any(directory.startswith(prefix + separator) for separator in {'/', os.sep})
+
+class ComplexityAggregator:
+    """
+    분석 결과 스트림을 한 번에 집계하는 병합 가능한 집계기
+    
+    개별 결과를 보관하지 않으므로, 병렬 작업자나 별도 실행에서 만든 부분 집계를
+    merge()로 합쳐도 전체를 한 번에 집계한 것과 같은 결과를 얻습니다.
+    디렉토리별 하위 집계는 각 결과를 파일이 있는 디렉토리와 그 모든 상위 디렉토리에
+    더하므로, 상위 디렉토리의 집계에는 하위 디렉토리 전체가 포함됩니다.
+    
+    Args:
+        by_directory (bool): 디렉토리별 하위 집계 유지 여부
+    """
+    
+    def __init__(self, by_directory=True):
+        self.file_count = 0
+        self.error_count = 0
+        self.budget_count = 0
+        self.mybatis_count = 0
+        self.regular_sql_count = 0
+        self.description_counts = Counter()
+        self.complexity = ScoreSummary()
+        self.categories = {}
+        self.directories = {} if by_directory else None
+    
+    @property
+    def scored_count(self):
+        """
+        점수가 계산된 파일 수
+        """
+        return self.mybatis_count + self.regular_sql_count
+    
+    def add(self, result):
+        """
+        분석 결과 하나를 집계에 추가
+        
+        Args:
+            result (dict): analyze_sql_file 형식의 분석 결과
+        """
+        self.file_count += 1
+        if 'budget_exceeded' in result:
+            self.budget_count += 1
+        
+        if 'error' in result or 'complexity_score' not in result:
+            if 'error' in result:
+                self.error_count += 1
+        else:
+            self.description_counts[result['description']] += 1
+            if result['is_mybatis']:
+                self.mybatis_count += 1
+            else:
+                self.regular_sql_count += 1
+            
+            self.complexity.add(result['complexity_score'])
+            for category, score in result.get('detailed_scores', {}).items():
+                self.categories.setdefault(category, ScoreSummary()).add(score)
+        
+        if self.directories is not None:
+            for directory in _ancestor_directories(result['file_path']):
+                if directory not in self.directories:
+                    self.directories[directory] = ComplexityAggregator(by_directory=False)
+                self.directories[directory].add(result)
+    
+    def rollup_directories(self):
+        """
+        분석 루트(모든 파일을 포함하는 가장 깊은 디렉토리)와 그 하위 디렉토리의 집계
+        
+        분석 루트보다 위의 디렉토리는 분석 루트와 집계가 같으므로 제외합니다.
+        
+        Returns:
+            list: (디렉토리, ComplexityAggregator) 목록 (경로 순)
+        """
+        if not self.directories:
+            return []
+        covering = [directory for directory, aggregate in self.directories.items()
+                    if aggregate.file_count == self.file_count]
+        root = max(covering, key=len) if covering else ''
+        return sorted((directory, aggregate) for directory, aggregate in self.directories.items()
+                      if _is_within(directory, root))
+    
+    def merge(self, other):
+        """
+        다른 집계기의 내용을 현재 집계에 합침
+        
+        Args:
+            other (ComplexityAggregator): 합칠 집계기
+        """
+        self.file_count += other.file_count
+        self.error_count += other.error_count
+        self.budget_count += other.budget_count
+        self.mybatis_count += other.mybatis_count
+        self.regular_sql_count += other.regular_sql_count
+        self.description_counts.update(other.description_counts)
+        self.complexity.merge(other.complexity)
+        for category, summary in other.categories.items():
+            self.categories.setdefault(category, ScoreSummary()).merge(summary)
+        
+        if self.directories is not None and other.directories is not None:
+            for directory, aggregate in other.directories.items():
+                if directory not in self.directories:
+                    self.directories[directory] = ComplexityAggregator(by_directory=False)
+                self.directories[directory].merge(aggregate)
+    
+    def to_dict(self):
+        """
+        JSON 직렬화 가능한 딕셔너리로 변환
+        
+        Returns:
+            dict: 집계 내용
+        """
+        data = {
+            'file_count': self.file_count,
+            'error_count': self.error_count,
+            'budget_count': self.budget_count,
+            'mybatis_count': self.mybatis_count,
+            'regular_sql_count': self.regular_sql_count,
+            'description_counts': dict(self.description_counts),
+            'complexity': self.complexity.to_dict(),
+            'categories': {category: summary.to_dict() for category, summary in self.categories.items()}
+        }
+        if self.directories is not None:
+            data['directories'] = {
+                directory: aggregate.to_dict() for directory, aggregate in self.directories.items()
+            }
+        return data
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        to_dict 결과로부터 집계기 복원
+        
+        Args:
+            data (dict): 집계 딕셔너리
+            
+        Returns:
+            ComplexityAggregator: 복원된 집계기
+        """
+        aggregator = cls(by_directory='directories' in data)
+        aggregator.file_count = data['file_count']
+        aggregator.error_count = data['error_count']
+        aggregator.budget_count = data['budget_count']
+        aggregator.mybatis_count = data['mybatis_count']
+        aggregator.regular_sql_count = data['regular_sql_count']
+        aggregator.description_counts = Counter(data['description_counts'])
+        aggregator.complexity = ScoreSummary.from_dict(data['complexity'])
+        aggregator.categories = {
+            category: ScoreSummary.from_dict(summary) for category, summary in data['categories'].items()
+        }
+        if 'directories' in data:
+            aggregator.directories = {
+                directory: cls.from_dict(aggregate) for directory, aggregate in data['directories'].items()
+            }
+        return aggregator
+
+def aggregate_results(results, by_directory=True):
+    """
+    분석 결과 목록을 한 번 순회하여 집계
+    
+    Args:
+        results (iterable): 분석 결과
+        by_directory (bool): 디렉토리별 하위 집계 유지 여부
+        
+    Returns:
+        ComplexityAggregator: 집계 결과
+    """
+    aggregator = ComplexityAggregator(by_directory)
+    for result in results:
+        aggregator.add(result)
+    return aggregator
+
+def format_summary_row(label, summary):
+    """
+    요약 통계를 마크다운 표의 한 행으로 변환
+    
+    Args:
+        label (str): 행 이름
+        summary (ScoreSummary): 요약 통계
+        
+    Returns:
+        str: 마크다운 표 행
+    """
+    if not summary.count:
+        return f"| {label} | 0 | - | - | " + " | ".join("-" for _ in REPORT_PERCENTILES) + " | - |"
+    percentiles = " | ".join(f"{summary.percentile(p):g}" for p in REPORT_PERCENTILES)
+    return (f"| {label} | {summary.count} | {summary.mean:.2f} | {summary.minimum:g} | "
+            f"{percentiles} | {summary.maximum:g} |")
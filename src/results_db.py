@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+분석 결과 SQLite 저장소
+실행별 분석 결과를 색인된 SQLite 데이터베이스에 저장하고, 다시 분석하지 않고 상위 N개 조회와 실행 간 비교를 수행하는 도구
+"""
+
+import argparse
+import os
+import sqlite3
+from collections import Counter
+from datetime import datetime
+
+try:
+    # 패키지로 설치된 경우
+    from .archive_reader import ARCHIVE_SEPARATOR
+except ImportError:
+    # 직접 실행하는 경우
+    from archive_reader import ARCHIVE_SEPARATOR
+
+# 기본 일괄 삽입 크기
+DEFAULT_BATCH_SIZE = 1000
+
+# 데이터베이스 형식 버전 (PRAGMA user_version, 1부터 files.path는 실행 루트 기준 상대 경로)
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    root TEXT,
+    label TEXT,
+    file_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS files (
+    file_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    path TEXT NOT NULL,
+    directory TEXT NOT NULL,
+    status TEXT NOT NULL,
+    is_mybatis INTEGER,
+    complexity_score REAL,
+    description TEXT,
+    message TEXT
+);
+CREATE TABLE IF NOT EXISTS category_scores (
+    file_id INTEGER NOT NULL REFERENCES files(file_id),
+    run_id INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    score REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS statements (
+    statement_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_id INTEGER NOT NULL REFERENCES files(file_id),
+    run_id INTEGER NOT NULL,
+    line INTEGER,
+    start_offset INTEGER,
+    end_offset INTEGER,
+    kind TEXT,
+    unit TEXT,
+    score REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS statement_category_scores (
+    statement_id INTEGER NOT NULL REFERENCES statements(statement_id),
+    run_id INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    score REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_files_run_path ON files(run_id, path);
+CREATE INDEX IF NOT EXISTS idx_files_run_score ON files(run_id, complexity_score);
+CREATE INDEX IF NOT EXISTS idx_files_path ON files(path);
+CREATE INDEX IF NOT EXISTS idx_scores_run_category ON category_scores(run_id, category, score);
+CREATE INDEX IF NOT EXISTS idx_scores_file ON category_scores(file_id);
+CREATE INDEX IF NOT EXISTS idx_statements_run_score ON statements(run_id, score);
+CREATE INDEX IF NOT EXISTS idx_statements_file ON statements(file_id);
+CREATE INDEX IF NOT EXISTS idx_statement_scores_run_category ON statement_category_scores(run_id, category, score);
+CREATE INDEX IF NOT EXISTS idx_statement_scores_statement ON statement_category_scores(statement_id);
+"""
+
+def _result_status(result):
+    """
+    분석 결과의 상태 문자열
+    
+    Args:
+        result (dict): 분석 결과
+        
+    Returns:
+        tuple: (상태, 메시지)
+    """
+    if 'error' in result:
+        return 'error', result['error']
+    if 'complexity_score' not in result:
+        return 'skipped', result.get('budget_exceeded')
+    if 'budget_exceeded' in result:
+        return 'degraded', result['budget_exceeded']
+    return 'ok', None
+
+def _result_statements(result):
+    """
+    분석 결과에 포함된 SQL 문별 점수
+    
+    PL/SQL 파일의 SQL 문(오프셋과 소속 단위 포함)과 Java/Kotlin 소스의 SQL 문을 같은 형식으로 변환합니다.
+    
+    Args:
+        result (dict): 분석 결과
+        
+    Returns:
+        list: (line, start_offset, end_offset, kind, unit, score, detailed_scores) 목록
+    """
+    if result.get('is_plsql'):
+        units = result['plsql_units']
+        return [(statement['start_line'], statement['start'], statement['end'], statement['keyword'],
+                 f"{units[statement['unit']]['kind']} {units[statement['unit']]['name']}"
+                 if statement['unit'] is not None else None,
+                 statement['score'], statement['detailed_scores'])
+                for statement in result.get('plsql_statements', [])]
+    return [(statement['line'], None, None, statement['kind'], None,
+             statement['score'], statement.get('detailed_scores', {}))
+            for statement in result.get('source_statements', [])]
+
+def _relative_path(path, root):
+    """
+    실행 루트 기준 상대 경로 ('/' 구분)
+    
+    루트를 어떻게 입력했는지(s, ./s, 절대 경로)나 작업 디렉토리와 관계없이 같은 파일은
+    같은 경로가 되므로 실행 간 비교에 사용합니다. 압축 파일 분석 결과는 압축 파일 안의
+    멤버 경로를 사용합니다.
+    
+    Args:
+        path (str): 분석 결과의 파일 경로
+        root (str): 실행 루트 (None이면 절대 경로 사용)
+        
+    Returns:
+        str: 상대 경로
+    """
+    path = os.path.abspath(path)
+    if root is None:
+        return path.replace(os.sep, '/')
+    root = os.path.abspath(root)
+    archive_prefix = root + ARCHIVE_SEPARATOR
+    if path.startswith(archive_prefix):
+        return path[len(archive_prefix):]
+    return os.path.relpath(path, root).replace(os.sep, '/')
+
+def _relative_prefix(prefix, root):
+    """
+    경로 접두사 필터를 저장된 경로와 같은 형식으로 변환
+    
+    루트 기준 상대 경로(예: 'module_x/')는 그대로 사용하고, 절대 경로나 현재 디렉토리
+    기준으로 루트 아래를 가리키는 경로(예: './repo/module_x')는 루트 기준 상대 경로로 바꿉니다.
+    
+    Args:
+        prefix (str): 경로 접두사
+        root (str): 실행 루트 (None이면 절대 경로로 저장된 실행)
+        
+    Returns:
+        str: 저장된 경로와 비교할 접두사 (끝의 '/'는 유지)
+    """
+    absolute = os.path.abspath(prefix)
+    if root is None or os.path.isabs(prefix) or absolute.startswith(os.path.abspath(root) + os.sep):
+        converted = _relative_path(prefix, root)
+    else:
+        converted = prefix.replace(os.sep, '/')
+        while converted.startswith('./'):
+            converted = converted[2:]
+    if prefix.endswith(('/', os.sep)) and not converted.endswith('/'):
+        converted += '/'
+    return converted
+
+def _prefix_range(prefix):
+    """
+    경로 접두사 조건을 색인을 사용할 수 있는 범위 조건으로 변환
+    
+    Args:
+        prefix (str): 경로 접두사
+        
+    Returns:
+        tuple: (하한, 상한)
+    """
+    return prefix, prefix + '\U0010ffff'
+
+def _unique_path(path, seen):
+    """
+    실행 안에서 중복되지 않는 저장 경로
+    
+    Args:
+        path (str): 상대 경로
+        seen (Counter): 지금까지 저장한 경로별 횟수 (갱신됨)
+        
+    Returns:
+        str: 처음 나온 경로는 그대로, 두 번째부터는 '경로#순번'
+    """
+    seen[path] += 1
+    return path if seen[path] == 1 else f"{path}#{seen[path]}"
+
+class ResultsDatabase:
+    """
+    분석 결과 SQLite 저장소
+    
+    Args:
+        path (str): 데이터베이스 파일 경로
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self._migrate()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """
+        데이터베이스 연결 종료
+        """
+        self._conn.close()
+    
+    def _migrate(self):
+        """
+        이전 형식의 데이터베이스를 현재 형식으로 변환
+        
+        형식 0은 파일 경로를 명령줄에 입력한 그대로 저장했으므로 실행 루트 기준 상대 경로로 바꿉니다.
+        """
+        with self._conn:
+            for run in self._conn.execute("SELECT run_id, root FROM runs").fetchall():
+                files = self._conn.execute("SELECT file_id, path FROM files WHERE run_id = ?",
+                                           (run['run_id'],)).fetchall()
+                seen = Counter()
+                for row in files:
+                    path = _unique_path(_relative_path(row['path'], run['root']), seen)
+                    self._conn.execute("UPDATE files SET path = ?, directory = ? WHERE file_id = ?",
+                                       (path, os.path.dirname(path), row['file_id']))
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    
+    def store_run(self, results, root=None, label=None, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        한 번의 분석 실행 결과를 일괄 저장
+        
+        batch_size건마다 하나의 트랜잭션으로 삽입합니다. 파일 경로는 root 기준 상대 경로로
+        저장하며, 같은 경로가 두 번 이상 나오면(이름이 같은 압축 파일 멤버 등) 두 번째부터
+        '경로#2'처럼 순번을 붙입니다. 저장 중 오류가 나면 이미 저장한 부분도 지웁니다.
+        
+        Args:
+            results (iterable): 분석 결과
+            root (str): 분석 루트 디렉토리 또는 압축 파일 (None이면 절대 경로로 저장)
+            label (str): 실행 이름 (예: 브랜치, 날짜)
+            batch_size (int): 트랜잭션당 결과 수
+            
+        Returns:
+            int: 저장된 실행 ID
+        """
+        if root is not None:
+            root = os.path.abspath(root)
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (created_at, root, label) VALUES (?, ?, ?)",
+                (datetime.now().isoformat(timespec='seconds'), root, label)
+            )
+        run_id = cursor.lastrowid
+        
+        file_count = 0
+        batch = []
+        seen = Counter()
+        try:
+            for result in results:
+                batch.append(result)
+                if len(batch) >= batch_size:
+                    file_count += self._insert_batch(run_id, batch, root, seen)
+                    batch = []
+            if batch:
+                file_count += self._insert_batch(run_id, batch, root, seen)
+        except BaseException:
+            self._delete_run(run_id)
+            raise
+        
+        with self._conn:
+            self._conn.execute("UPDATE runs SET file_count = ? WHERE run_id = ?", (file_count, run_id))
+        return run_id
+    
+    def _delete_run(self, run_id):
+        """
+        실행과 그 실행의 모든 결과 삭제
+        
+        Args:
+            run_id (int): 실행 ID
+        """
+        with self._conn:
+            for table in ('statement_category_scores', 'statements', 'category_scores', 'files', 'runs'):
+                self._conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+    
+    def _insert_batch(self, run_id, results, root=None, seen=None):
+        """
+        결과 묶음을 하나의 트랜잭션으로 삽입
+        
+        Args:
+            run_id (int): 실행 ID
+            results (list): 분석 결과 묶음
+            root (str): 실행 루트 (파일 경로를 이 경로 기준 상대 경로로 저장)
+            seen (Counter): 이 실행에서 지금까지 저장한 경로별 횟수 (중복 경로 구분용)
+            
+        Returns:
+            int: 삽입한 결과 수
+        """
+        if seen is None:
+            seen = Counter()
+        with self._conn:
+            for result in results:
+                status, message = _result_status(result)
+                path = _unique_path(_relative_path(result['file_path'], root), seen)
+                cursor = self._conn.execute(
+                    "INSERT INTO files (run_id, path, directory, status, is_mybatis, "
+                    "complexity_score, description, message) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (run_id, path, os.path.dirname(path), status,
+                     result.get('is_mybatis'), result.get('complexity_score'),
+                     result.get('description'), message)
+                )
+                file_id = cursor.lastrowid
+                self._conn.executemany(
+                    "INSERT INTO category_scores (file_id, run_id, category, score) VALUES (?, ?, ?, ?)",
+                    [(file_id, run_id, category, score)
+                     for category, score in result.get('detailed_scores', {}).items()]
+                )
+                for line, start, end, kind, unit, score, detailed_scores in _result_statements(result):
+                    cursor = self._conn.execute(
+                        "INSERT INTO statements (file_id, run_id, line, start_offset, end_offset, "
+                        "kind, unit, score) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (file_id, run_id, line, start, end, kind, unit, score)
+                    )
+                    statement_id = cursor.lastrowid
+                    self._conn.executemany(
+                        "INSERT INTO statement_category_scores (statement_id, run_id, category, score) "
+                        "VALUES (?, ?, ?, ?)",
+                        [(statement_id, run_id, category, category_score)
+                         for category, category_score in detailed_scores.items()]
+                    )
+        return len(results)
+    
+    def runs(self):
+        """
+        저장된 실행 목록
+        
+        Returns:
+            list: 실행 정보 (최신 순)
+        """
+        return self._conn.execute("SELECT * FROM runs ORDER BY run_id DESC").fetchall()
+    
+    def latest_run_id(self, offset=0):
+        """
+        최근 실행 ID
+        
+        Args:
+            offset (int): 0이면 최신 실행, 1이면 그 직전 실행
+            
+        Returns:
+            int: 실행 ID (없으면 None)
+        """
+        row = self._conn.execute(
+            "SELECT run_id FROM runs ORDER BY run_id DESC LIMIT 1 OFFSET ?", (offset,)
+        ).fetchone()
+        return row['run_id'] if row else None
+    
+    def run_root(self, run_id):
+        """
+        실행 루트
+        
+        Args:
+            run_id (int): 실행 ID
+            
+        Returns:
+            str: 실행 루트 절대 경로 (기록되지 않았으면 None)
+        """
+        row = self._conn.execute("SELECT root FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return row['root'] if row else None
+    
+    def top(self, limit=100, run_id=None, category=None, path_prefix=None, min_score=None,
+            statements=False):
+        """
+        점수 상위 N개 파일 또는 SQL 문 조회
+        
+        Args:
+            limit (int): 조회할 개수
+            run_id (int): 실행 ID (None이면 최신 실행)
+            category (str): 세부 평가 요소 (None이면 complexity_score 기준)
+            path_prefix (str): 경로 접두사 필터 (실행 루트 기준, 예: 'module_x/')
+            min_score (float): 최소 점수 필터
+            statements (bool): 파일 대신 SQL 문 단위로 조회 (PL/SQL, Java/Kotlin 소스의 SQL 문)
+            
+        Returns:
+            list: (path, score, description) 행 목록 (path는 실행 루트 기준 상대 경로)
+                (statements이면 (path, line, kind, unit, score) 행 목록)
+        """
+        if run_id is None:
+            run_id = self.latest_run_id()
+        
+        if statements:
+            if category is None:
+                sql = ("SELECT f.path, t.line, t.kind, t.unit, t.score AS score FROM statements t "
+                       "JOIN files f ON f.file_id = t.file_id WHERE t.run_id = ?")
+                score_column = "t.score"
+                params = [run_id]
+            else:
+                sql = ("SELECT f.path, t.line, t.kind, t.unit, s.score AS score "
+                       "FROM statement_category_scores s "
+                       "JOIN statements t ON t.statement_id = s.statement_id "
+                       "JOIN files f ON f.file_id = t.file_id WHERE s.run_id = ? AND s.category = ?")
+                score_column = "s.score"
+                params = [run_id, category]
+        elif category is None:
+            sql = ("SELECT f.path, f.complexity_score AS score, f.description FROM files f "
+                   "WHERE f.run_id = ? AND f.complexity_score IS NOT NULL")
+            score_column = "f.complexity_score"
+            params = [run_id]
+        else:
+            sql = ("SELECT f.path, s.score AS score, f.description FROM category_scores s "
+                   "JOIN files f ON f.file_id = s.file_id WHERE s.run_id = ? AND s.category = ?")
+            score_column = "s.score"
+            params = [run_id, category]
+        
+        if path_prefix:
+            sql += " AND f.path >= ? AND f.path < ?"
+            params.extend(_prefix_range(_relative_prefix(path_prefix, self.run_root(run_id))))
+        if min_score is not None:
+            sql += f" AND {score_column} >= ?"
+            params.append(min_score)
+        
+        sql += f" ORDER BY {score_column} DESC, f.path{', t.line' if statements else ''} LIMIT ?"
+        params.append(limit)
+        return self._conn.execute(sql, params).fetchall()
+    
+    def diff(self, old_run_id=None, new_run_id=None, limit=100, path_prefix=None):
+        """
+        두 실행 사이의 점수 변화 조회
+        
+        Args:
+            old_run_id (int): 기준 실행 ID (None이면 최신 직전 실행)
+            new_run_id (int): 비교 실행 ID (None이면 최신 실행)
+            limit (int): 조회할 개수 (변화량 절댓값 순)
+            path_prefix (str): 경로 접두사 필터 (비교 실행의 루트 기준)
+            
+        Returns:
+            list: (path, old_score, new_score, delta) 행 목록 (path는 실행 루트 기준 상대 경로,
+                추가/삭제된 파일은 한쪽 점수가 None)
+        """
+        if new_run_id is None:
+            new_run_id = self.latest_run_id()
+        if old_run_id is None:
+            old_run_id = self.latest_run_id(offset=1)
+        
+        path_filter = ""
+        params = [old_run_id, new_run_id]
+        if path_prefix:
+            path_filter = " AND paths.path >= ? AND paths.path < ?"
+            params.extend(_prefix_range(_relative_prefix(path_prefix, self.run_root(new_run_id))))
+        
+        sql = f"""
+            WITH old AS (SELECT path, complexity_score FROM files WHERE run_id = ?),
+                 new AS (SELECT path, complexity_score FROM files WHERE run_id = ?),
+                 paths AS (SELECT path FROM old UNION SELECT path FROM new)
+            SELECT paths.path AS path, old.complexity_score AS old_score,
+                   new.complexity_score AS new_score,
+                   IFNULL(new.complexity_score, 0) - IFNULL(old.complexity_score, 0) AS delta
+            FROM paths
+            LEFT JOIN old ON old.path = paths.path
+            LEFT JOIN new ON new.path = paths.path
+            WHERE (old.complexity_score IS NOT new.complexity_score){path_filter}
+            ORDER BY ABS(delta) DESC, paths.path
+            LIMIT ?
+        """
+        params.append(limit)
+        return self._conn.execute(sql, params).fetchall()
+
+def _format_score(score):
+    """
+    조회 결과 점수 표시용 문자열
+    
+    Args:
+        score (float): 점수 (None 가능)
+        
+    Returns:
+        str: 표시 문자열
+    """
+    return "-" if score is None else f"{score:g}"
+
+def main():
+    """
+    메인 함수: 저장된 분석 결과 조회
+    """
+    parser = argparse.ArgumentParser(description="SQLite에 저장된 SQL 복잡도 분석 결과 조회")
+    parser.add_argument('database', help="분석 결과 데이터베이스 파일 경로")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    subparsers.add_parser('runs', help="저장된 실행 목록")
+    
+    top_parser = subparsers.add_parser('top', help="점수 상위 N개 파일 또는 SQL 문")
+    top_parser.add_argument('-n', '--limit', type=int, default=100, help="조회할 개수 (기본값 100)")
+    top_parser.add_argument('--run', type=int, default=None, help="실행 ID (기본값: 최신 실행)")
+    top_parser.add_argument('--category', default=None, help="세부 평가 요소 (예: postgres_conversion)")
+    top_parser.add_argument('--path-prefix', default=None, help="경로 접두사 필터")
+    top_parser.add_argument('--min-score', type=float, default=None, help="최소 점수")
+    top_parser.add_argument('--statements', action='store_true',
+                            help="파일 대신 SQL 문 단위로 조회 (PL/SQL, Java/Kotlin 소스의 SQL 문)")
+    
+    diff_parser = subparsers.add_parser('diff', help="두 실행 사이의 점수 변화")
+    diff_parser.add_argument('--from', dest='old_run', type=int, default=None,
+                             help="기준 실행 ID (기본값: 최신 직전 실행)")
+    diff_parser.add_argument('--to', dest='new_run', type=int, default=None,
+                             help="비교 실행 ID (기본값: 최신 실행)")
+    diff_parser.add_argument('-n', '--limit', type=int, default=100, help="조회할 개수 (기본값 100)")
+    diff_parser.add_argument('--path-prefix', default=None, help="경로 접두사 필터")
+    
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.database):
+        print(f"오류: {args.database} 데이터베이스가 없습니다.")
+        return
+    
+    with ResultsDatabase(args.database) as db:
+        if args.command == 'top':
+            rows = db.top(args.limit, args.run, args.category, args.path_prefix, args.min_score,
+                          args.statements)
+            for row in rows:
+                if args.statements:
+                    print(f"{_format_score(row['score'])}\t{row['kind']}\t{row['unit'] or '-'}\t"
+                          f"{row['path']}:{row['line']}")
+                else:
+                    print(f"{_format_score(row['score'])}\t{row['description']}\t{row['path']}")
+        elif args.command == 'diff':
+            for row in db.diff(args.old_run, args.new_run, args.limit, args.path_prefix):
+                print(f"{row['delta']:+.1f}\t{_format_score(row['old_score'])} -> "
+                      f"{_format_score(row['new_score'])}\t{row['path']}")
+        else:
+            for row in db.runs():
+                print(f"{row['run_id']}\t{row['created_at']}\t{row['file_count']}개\t"
+                      f"{row['label'] or '-'}\t{row['root'] or '-'}")
+
+if __name__ == "__main__":
+    main()
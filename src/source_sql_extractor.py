@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Java/Kotlin 소스 SQL 추출기
+MyBatis 어노테이션(@Select 등)과 문자열 리터럴(JdbcTemplate 등에 전달되는 SQL, 단순 문자열 연결 포함)에서
+SQL 문을 소스 위치와 함께 추출하고 SQL 문별 점수를 파일 단위로 집계하는 도구
+"""
+
+import re
+import textwrap
+
+# 분석 대상 소스 파일 확장자와 언어
+SOURCE_EXTENSIONS = {
+    '.java': 'java',
+    '.kt': 'kotlin'
+}
+
+# SQL 문으로 시작하는 문자열 리터럴이 하나도 없는 파일은 토큰 스캔 없이 건너뛰기 위한 사전 검사 패턴
+# (Kotlin trimMargin 원시 문자열의 여백 접두사 한 글자 허용)
+_CANDIDATE_PATTERN = re.compile(
+    r'"(?:\s|\\[nrt])*(?:[^\w\s"\\]\s*)?(?:SELECT|INSERT|UPDATE|DELETE|MERGE|WITH|<script>)',
+    re.IGNORECASE
+)
+
+# 한 번의 스캔에 사용하는 토큰 패턴 (주석과 문자열을 먼저 매칭하고, 나머지 코드는 덩어리로 건너뜀)
+_TOKEN_PATTERN = re.compile(
+    r'(?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))'
+    r'|(?P<block>"""(?:\\.|[^\\])*?""")'
+    r'|(?P<string>"(?:\\.|[^"\\\n])*")'
+    r"|(?P<char>'(?:\\.|[^'\\\n])+')"
+    r'|(?P<annotation>@(?:[\w$]+\.)*(?P<annotation_name>Select|Insert|Update|Delete)\b)'
+    r'|(?P<plus>\+(?![+=]))'
+    r'|(?P<code>[^"\'/@+]+|["\'/@+])',
+    re.DOTALL
+)
+
+# 문자열 연결의 피연산자로 허용하는 변수/상수 이름
+_OPERAND_PATTERN = re.compile(r'\s*[\w$]+(?:\.[\w$]+)*\s*')
+
+# 어노테이션 인수의 괄호
+_BRACKET_PATTERN = re.compile(r'[()\[\]{}]')
+
+# 추출한 문자열을 SQL 문으로 인정하는 패턴 (일반 문장 속 "select" 등은 제외)
+_SQL_PATTERN = re.compile(
+    r'^\s*(?:<script>'
+    r'|SELECT\b.*?\bFROM\b'
+    r'|INSERT\s+(?:ALL\b|INTO\b)'
+    r'|UPDATE\s+\S+.*?\bSET\b'
+    r'|DELETE\s+(?:FROM\b|\S+\s+WHERE\b)'
+    r'|MERGE\s+INTO\b'
+    r'|WITH\s+\w+\s+AS\s*\()',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Kotlin 원시 문자열 뒤의 trimMargin 호출 (인수는 여백 접두사, 기본값 '|')
+_TRIM_MARGIN_PATTERN = re.compile(r'\s*\.\s*trimMargin\s*\(\s*(?:"((?:\\.|[^"\\\n])+)"\s*)?\)')
+
+# 문자열 이스케이프 시퀀스
+_ESCAPE_PATTERN = re.compile(r'\\(u+[0-9A-Fa-f]{4}|[0-7]{1,3}|.)', re.DOTALL)
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 's': ' ', '\n': ''}
+
+# 문자열 연결에서 리터럴이 아닌 피연산자(변수 등) 자리에 넣는 표시
+CONCAT_PLACEHOLDER = '?'
+
+def source_language(file_path):
+    """
+    파일 확장자로 소스 언어 판별
+    
+    Args:
+        file_path (str): 파일 경로
+        
+    Returns:
+        str: 'java' 또는 'kotlin' (분석 대상 소스가 아니면 None)
+    """
+    return SOURCE_EXTENSIONS.get(file_path[file_path.rfind('.'):].lower())
+
+def _unescape(match):
+    """
+    이스케이프 시퀀스 하나를 실제 문자로 변환
+    
+    Args:
+        match (re.Match): _ESCAPE_PATTERN 매칭 결과
+        
+    Returns:
+        str: 변환된 문자
+    """
+    escape = match.group(1)
+    if escape[0] == 'u' and len(escape) > 1:
+        return chr(int(escape[-4:], 16))
+    if escape[0] in '01234567':
+        return chr(int(escape, 8))
+    return _ESCAPES.get(escape, escape)
+
+def _trim_margin(value, margin):
+    """
+    Kotlin trimMargin과 같이 여백 접두사까지의 들여쓰기 제거
+    
+    Args:
+        value (str): 원시 문자열 값
+        margin (str): 여백 접두사 (예: '|')
+        
+    Returns:
+        str: 공백뿐인 첫 줄과 마지막 줄을 빼고, 각 줄의 앞 공백과 여백 접두사를 제거한 값
+    """
+    lines = value.split('\n')
+    if lines and not lines[0].strip():
+        lines = lines[1:]
+    if lines and not lines[-1].strip():
+        lines = lines[:-1]
+    trimmed = []
+    for line in lines:
+        content = line.lstrip()
+        trimmed.append(content[len(margin):] if content.startswith(margin) else line)
+    return '\n'.join(trimmed)
+
+def _literal_value(token, kind, language, margin=None):
+    """
+    문자열 리터럴 토큰의 값
+    
+    Args:
+        token (str): 따옴표를 포함한 리터럴
+        kind (str): 'string' 또는 'block' (텍스트 블록/원시 문자열)
+        language (str): 소스 언어
+        margin (str): 뒤따르는 trimMargin 호출의 여백 접두사 (Kotlin 원시 문자열, 없으면 None)
+        
+    Returns:
+        str: 문자열 값
+    """
+    if kind == 'string':
+        return _ESCAPE_PATTERN.sub(_unescape, token[1:-1])
+    
+    value = token[3:-3]
+    if language == 'kotlin':
+        # Kotlin 원시 문자열은 이스케이프를 처리하지 않음 (trimMargin이 없으면 trimIndent 관례에 맞춰 들여쓰기 제거)
+        if margin is not None:
+            return _trim_margin(value, margin)
+        return textwrap.dedent(value).strip('\n')
+    # Java 텍스트 블록: 여는 따옴표 뒤 줄바꿈을 제외하고 공통 들여쓰기 제거
+    value = value.split('\n', 1)[1] if '\n' in value else value
+    return _ESCAPE_PATTERN.sub(_unescape, textwrap.dedent(value))
+
+def extract_source_sql(text, language='java'):
+    """
+    Java/Kotlin 소스에서 SQL 문 추출
+    
+    한 번의 토큰 스캔으로 주석을 건너뛰며, '+'로 이어진 문자열 리터럴은 하나로 합칩니다.
+    연결 중간의 변수나 상수 이름은 CONCAT_PLACEHOLDER로 바꾸고, 메서드 호출 등 그 밖의
+    식을 만나면 연결을 끝냅니다. @Select/@Insert/@Update/@Delete 어노테이션의 문자열 배열은
+    MyBatis와 같이 공백으로 이어 붙입니다.
+    
+    Args:
+        text (str): 소스 코드
+        language (str): 'java' 또는 'kotlin'
+        
+    Returns:
+        list: SQL 문 목록
+            - line: 시작 줄 번호
+            - kind: 어노테이션 이름(예: '@Select'), 'literal' 또는 'concatenation'
+            - sql: SQL 문
+    """
+    if not _CANDIDATE_PATTERN.search(text):
+        return []
+    
+    statements = []
+    line = 1
+    line_offset = 0
+    
+    # 진행 중인 문자열 연결: [시작 위치, 조각 목록, 피연산자 대기 여부]
+    chain = None
+    # 진행 중인 어노테이션: [이름, 시작 위치, 괄호 깊이, 문자열 목록]
+    annotation = None
+    
+    def line_at(offset):
+        nonlocal line, line_offset
+        line += text.count('\n', line_offset, offset)
+        line_offset = offset
+        return line
+    
+    def finish_chain():
+        nonlocal chain
+        if chain is None:
+            return
+        start, parts, expecting = chain
+        chain = None
+        if expecting:
+            # '+' 뒤에 리터럴/이름이 아닌 식이 오면 그 자리도 표시
+            parts.append(CONCAT_PLACEHOLDER)
+        value = ''.join(parts)
+        if annotation is not None and annotation[2] > 0:
+            annotation[3].append(value)
+        elif _SQL_PATTERN.match(value):
+            kind = 'literal' if len(parts) == 1 else 'concatenation'
+            statements.append({'line': line_at(start), 'kind': kind, 'sql': value.strip()})
+    
+    for match in _TOKEN_PATTERN.finditer(text):
+        token_kind = match.lastgroup
+        if token_kind == 'comment':
+            continue
+        
+        if token_kind in ('string', 'block'):
+            margin = None
+            if token_kind == 'block' and language == 'kotlin':
+                margin_match = _TRIM_MARGIN_PATTERN.match(text, match.end())
+                if margin_match:
+                    margin = _ESCAPE_PATTERN.sub(_unescape, margin_match.group(1) or '|')
+            value = _literal_value(match.group(), token_kind, language, margin)
+            if chain is not None and chain[2]:
+                chain[1].append(value)
+                chain[2] = False
+            else:
+                finish_chain()
+                chain = [match.start(), [value], False]
+            continue
+        
+        if token_kind == 'plus' and chain is not None and not chain[2]:
+            chain[2] = True
+            continue
+        
+        code = match.group()
+        if chain is not None:
+            if code.isspace():
+                continue
+            if chain[2] and _OPERAND_PATTERN.fullmatch(code):
+                chain[1].append(CONCAT_PLACEHOLDER)
+                chain[2] = False
+                continue
+        
+        finish_chain()
+        
+        if token_kind == 'annotation':
+            annotation = ['@' + match.group('annotation_name'), match.start(), 0, []]
+            continue
+        if annotation is None or code.isspace():
+            continue
+        if annotation[2] == 0 and not code.lstrip().startswith('('):
+            # 인수가 없는 어노테이션
+            annotation = None
+            continue
+        
+        for bracket in _BRACKET_PATTERN.finditer(code):
+            annotation[2] += 1 if bracket.group() in '([{' else -1
+            if annotation[2] <= 0:
+                value = ' '.join(annotation[3])
+                if _SQL_PATTERN.match(value):
+                    statements.append({'line': line_at(annotation[1]), 'kind': annotation[0],
+                                       'sql': value.strip()})
+                annotation = None
+                break
+    
+    finish_chain()
+    return statements
+
+def analyze_source_sql(text, language, score_query):
+    """
+    소스에서 추출한 SQL 문을 각각 점수화하고 파일 단위로 집계
+    
+    Args:
+        text (str): 소스 코드
+        language (str): 'java' 또는 'kotlin'
+        score_query (callable): SQL 문 점수 함수 (calculate_query_complexity 형식)
+        
+    Returns:
+        dict: 분석 결과 (SQL 문이 없으면 None)
+            - complexity_score: SQL 문 중 최고 점수
+            - detailed_scores: 최고 점수 SQL 문의 세부 평가 요소 점수
+            - statement_count: SQL 문 수
+            - statements: SQL 문별 위치와 점수 목록 (line, kind, score, detailed_scores)
+    """
+    statements = extract_source_sql(text, language)
+    if not statements:
+        return None
+    
+    summaries = []
+    for statement in statements:
+        score, scores = score_query(statement['sql'])
+        summaries.append({'line': statement['line'], 'kind': statement['kind'], 'score': score,
+                          'detailed_scores': scores})
+    
+    # 최고 점수 SQL 문(동점이면 앞선 문)의 세부 점수를 파일의 세부 점수로 사용
+    top_summary = max(summaries, key=lambda summary: summary['score'])
+    
+    return {
+        'complexity_score': top_summary['score'],
+        'detailed_scores': top_summary['detailed_scores'],
+        'statement_count': len(summaries),
+        'statements': summaries
+    }
@@ -7,19 +7,64 @@ SQL 파일 복잡도 분석기
 """
 
 import os
-import sys
 import re
+import argparse
+import functools
+import itertools
+import multiprocessing
 from collections import defaultdict
 
 # 기존 분석기 임포트
 try:
     # 패키지로 설치된 경우
-    from .query_complexity_analyzer import calculate_query_complexity, get_complexity_description
+    from .query_complexity_analyzer import (calculate_complexity_score, calculate_query_complexity,
+                                            estimate_query_complexity, get_complexity_description)
     from .mybatis_query_analyzer import analyze_mybatis_query
+    from .query_clustering import (DEFAULT_THRESHOLD, MinHasher, cluster_signatures,
+                                   estimate_similarity)
+    from .plsql_parser import analyze_plsql, is_plsql_source
+    from .source_sql_extractor import SOURCE_EXTENSIONS, analyze_source_sql, source_language
+    from .archive_reader import is_archive, iter_archive_members
+    from .file_sampling import CONFIDENCE_LEVEL, DEFAULT_SAMPLE_SEED, StratifiedSample, parse_sample
+    from .report_stats import REPORT_PERCENTILES, ComplexityAggregator, format_summary_row
+    from .checkpoint_journal import CheckpointJournal, content_digest
+    from .results_db import ResultsDatabase
+    from .partial_results import (merge_partial_results, parse_shard, shard_of,
+                                  write_partial_results)
 except ImportError:
     # 직접 실행하는 경우
-    from query_complexity_analyzer import calculate_query_complexity, get_complexity_description
+    from query_complexity_analyzer import (calculate_complexity_score, calculate_query_complexity,
+                                           estimate_query_complexity, get_complexity_description)
     from mybatis_query_analyzer import analyze_mybatis_query
+    from query_clustering import (DEFAULT_THRESHOLD, MinHasher, cluster_signatures,
+                                  estimate_similarity)
+    from plsql_parser import analyze_plsql, is_plsql_source
+    from source_sql_extractor import SOURCE_EXTENSIONS, analyze_source_sql, source_language
+    from archive_reader import is_archive, iter_archive_members
+    from file_sampling import CONFIDENCE_LEVEL, DEFAULT_SAMPLE_SEED, StratifiedSample, parse_sample
+    from report_stats import REPORT_PERCENTILES, ComplexityAggregator, format_summary_row
+    from checkpoint_journal import CheckpointJournal, content_digest
+    from results_db import ResultsDatabase
+    from partial_results import (merge_partial_results, parse_shard, shard_of,
+                                 write_partial_results)
+
+# 복잡도 설명 표시 순서
+COMPLEXITY_ORDER = {
+    "매우 간단 (Very Simple)": 0,
+    "간단 (Simple)": 1,
+    "중간 (Moderate)": 2,
+    "복잡 (Complex)": 3,
+    "매우 복잡 (Very Complex)": 4,
+    "극도로 복잡 (Extremely Complex)": 5
+}
+
+# 보고서에 표시할 소스 언어 이름과 SQL 문 종류
+SOURCE_LANGUAGE_NAMES = {'java': 'Java', 'kotlin': 'Kotlin'}
+SOURCE_STATEMENT_KINDS = {'literal': '문자열', 'concatenation': '문자열 연결'}
+
+# 예산 초과 파일 처리 방식
+BUDGET_DEGRADE = 'degrade'
+BUDGET_SKIP = 'skip'
 
 def is_mybatis_xml(content):
     """
@@ -35,49 +80,158 @@ def is_mybatis_xml(content):
     xml_pattern = r'<\s*(select|insert|update|delete)[\s>]'
     return bool(re.search(xml_pattern, content, re.IGNORECASE))
 
-def analyze_sql_file(file_path):
+def _score_only_query(query):
+    """
+    총점 전용 모드 점수 함수 (calculate_query_complexity 형식으로 반환)
+    
+    Args:
+        query (str): 평가할 SQL 쿼리
+        
+    Returns:
+        float: 0-10 사이의 복잡도 점수
+        dict: 빈 세부 점수
+    """
+    return calculate_complexity_score(query), {}
+
+def _score_embedded_query(query, degraded=False, score_only=False):
+    """
+    소스 코드에서 추출한 SQL 문 점수 (<script>로 시작하는 MyBatis 동적 쿼리 포함)
+    
+    Args:
+        query (str): SQL 문
+        degraded (bool): 저비용 근사 모드 사용 여부
+        score_only (bool): 총점 전용 모드 여부
+        
+    Returns:
+        float: 0-10 사이의 복잡도 점수
+        dict: 세부 평가 요소별 점수
+    """
+    if query.startswith('<script>'):
+        result = analyze_mybatis_query(query, degraded=degraded, score_only=score_only)
+        return result['final_complexity'], result.get('detailed_scores', {})
+    if degraded:
+        return estimate_query_complexity(query)
+    if score_only:
+        return _score_only_query(query)
+    return calculate_query_complexity(query)
+
+def analyze_sql_file(file_path, degraded=False, score_only=False, data=None):
     """
     SQL 파일을 분석하여 복잡도 계산
     
     Args:
         file_path (str): SQL 파일 경로
+        degraded (bool): 저비용 근사 모드 사용 여부
+        score_only (bool): 세부 평가 요소 없이 총점만 계산할지 여부
+        data (bytes): 이미 읽은 파일 내용 (압축 파일 멤버 등, None이면 file_path에서 읽음)
         
     Returns:
         dict: 분석 결과
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if data is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        else:
+            # 파일에서 읽을 때와 같이 줄바꿈을 '\n'으로 통일
+            content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        
+        return analyze_sql_content(content, file_path, degraded, score_only)
+    
+    except Exception as e:
+        # 콘솔 출력 없이 결과로만 오류를 전달 (보고서의 분석 오류 섹션에 표시)
+        return {
+            'file_name': os.path.basename(file_path),
+            'file_path': file_path,
+            'error': str(e)
+        }
+
+def analyze_sql_content(content, file_path, degraded=False, score_only=False):
+    """
+    이미 읽어 둔 SQL 파일 내용을 분석하여 복잡도 계산
+    
+    Args:
+        content (str): 파일 내용
+        file_path (str): 보고서에 표시할 파일 경로
+        degraded (bool): 저비용 근사 모드 사용 여부
+        score_only (bool): 세부 평가 요소 없이 총점만 계산할지 여부
+            (결과에 detailed_scores가 없고 score_only 키가 추가됨)
+            
+    Returns:
+        dict: 분석 결과 (SQL 문이 없는 Java/Kotlin 소스는 'no_sql' 키만 있는 결과)
+    """
+    # 파일 이름 추출
+    file_name = os.path.basename(file_path)
+    
+    # Java/Kotlin 소스는 어노테이션과 문자열 리터럴의 SQL 문을 추출하여 SQL 문별로 점수 계산
+    language = source_language(file_path)
+    
+    if language is not None:
+        score_query = functools.partial(_score_embedded_query, degraded=degraded, score_only=score_only)
+        source_result = analyze_source_sql(content, language, score_query)
+        if source_result is None:
+            return {'file_name': file_name, 'file_path': file_path, 'no_sql': True}
         
-        # 파일 이름 추출
-        file_name = os.path.basename(file_path)
+        complexity_score = source_result['complexity_score']
+        analysis = {
+            'file_name': file_name,
+            'file_path': file_path,
+            'is_mybatis': False,
+            'source_language': language,
+            'complexity_score': complexity_score,
+            'description': get_complexity_description(complexity_score),
+            'detailed_scores': source_result['detailed_scores'],
+            'statement_count': source_result['statement_count'],
+            'source_statements': source_result['statements']
+        }
+    elif is_mybatis_xml(content):
+        # MyBatis 동적 쿼리 분석
+        result = analyze_mybatis_query(content, degraded=degraded, score_only=score_only)
+        complexity_score = result['final_complexity']
+        description = get_complexity_description(complexity_score)
         
-        # MyBatis XML 형식인지 확인
-        is_mybatis = is_mybatis_xml(content)
+        analysis = {
+            'file_name': file_name,
+            'file_path': file_path,
+            'is_mybatis': True,
+            'complexity_score': complexity_score,
+            'description': description,
+            'base_complexity': result['base_complexity'],
+            'max_complexity': result['max_complexity'],
+            'dynamic_complexity': result['dynamic_complexity'],
+            'detailed_scores': result.get('detailed_scores')
+        }
+    else:
+        if degraded:
+            score_query = estimate_query_complexity
+        elif score_only:
+            score_query = _score_only_query
+        else:
+            score_query = calculate_query_complexity
         
-        if is_mybatis:
-            # MyBatis 동적 쿼리 분석
-            result = analyze_mybatis_query(content)
-            complexity_score = result['final_complexity']
-            description = get_complexity_description(complexity_score)
-            
-            return {
+        # PL/SQL 단위(패키지 본문, 프로시저 등)는 내장 SQL 문별로 점수 계산 후 단위별 집계
+        plsql_result = analyze_plsql(content, score_query) if is_plsql_source(content) else None
+        
+        if plsql_result is not None:
+            complexity_score = plsql_result['complexity_score']
+            analysis = {
                 'file_name': file_name,
                 'file_path': file_path,
-                'is_mybatis': True,
+                'is_mybatis': False,
+                'is_plsql': True,
                 'complexity_score': complexity_score,
-                'description': description,
-                'base_complexity': result['base_complexity'],
-                'max_complexity': result['max_complexity'],
-                'dynamic_complexity': result['dynamic_complexity'],
-                'detailed_scores': result['detailed_scores']
+                'description': get_complexity_description(complexity_score),
+                'detailed_scores': plsql_result['detailed_scores'],
+                'statement_count': plsql_result['statement_count'],
+                'plsql_statements': plsql_result['statements'],
+                'plsql_units': plsql_result['units']
             }
         else:
             # 일반 SQL 쿼리 분석
-            complexity_score, detailed_scores = calculate_query_complexity(content)
+            complexity_score, detailed_scores = score_query(content)
             description = get_complexity_description(complexity_score)
             
-            return {
+            analysis = {
                 'file_name': file_name,
                 'file_path': file_path,
                 'is_mybatis': False,
@@ -86,120 +240,680 @@ def analyze_sql_file(file_path):
                 'detailed_scores': detailed_scores
             }
     
-    except Exception as e:
-        print(f"Error analyzing file {file_path}: {str(e)}")
-        return {
-            'file_name': os.path.basename(file_path),
-            'file_path': file_path,
-            'error': str(e)
-        }
+    if degraded:
+        analysis['degraded'] = True
+    if score_only:
+        del analysis['detailed_scores']
+        analysis['score_only'] = True
+    
+    return analysis
+
+def _budget_worker(conn, score_only=False):
+    """
+    시간 예산 모드의 작업 프로세스: (파일 경로, 내용)을 받아 분석 결과를 돌려줌
+    
+    Args:
+        conn (multiprocessing.connection.Connection): 부모 프로세스와의 연결
+        score_only (bool): 총점 전용 모드 여부
+    """
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        file_path, data = message
+        conn.send(analyze_sql_file(file_path, score_only=score_only, data=data))
+
+def _skipped_result(file_path, reason):
+    """
+    예산을 넘겨 점수를 매기지 않은 파일의 결과
+    
+    Args:
+        file_path (str): 파일 경로
+        reason (str): 예산 초과 사유
+        
+    Returns:
+        dict: 'budget_exceeded' 키만 있고 점수가 없는 분석 결과
+    """
+    return {
+        'file_name': os.path.basename(file_path),
+        'file_path': file_path,
+        'budget_exceeded': reason
+    }
 
-def analyze_directory(directory_path):
+class BudgetedFileAnalyzer:
+    """
+    파일별 크기/시간 예산을 적용하는 분석기
+    
+    시간 예산이 지정되면 분석은 재사용되는 작업 프로세스에서 실행되며,
+    예산을 넘긴 파일은 작업 프로세스를 종료해 취소한 뒤 on_budget_exceeded
+    설정에 따라 근사 모드로 다시 점수를 매기거나 건너뜁니다.
+    나머지 파일은 새 작업 프로세스에서 계속 분석됩니다.
+    크기 예산을 넘긴 파일은 근사 모드도 파일 전체를 읽어야 하므로 설정과 관계없이
+    읽지 않고 건너뜁니다.
+    
+    Args:
+        max_file_size (int): 파일 크기 예산 (바이트, None이면 제한 없음)
+        time_budget (float): 파일별 분석 시간 예산 (초, None이면 제한 없음)
+        on_budget_exceeded (str): 'degrade'(근사 점수) 또는 'skip'(건너뜀)
+        score_only (bool): 세부 평가 요소 없이 총점만 계산할지 여부
+    """
+    
+    def __init__(self, max_file_size=None, time_budget=None, on_budget_exceeded=BUDGET_DEGRADE,
+                 score_only=False):
+        if on_budget_exceeded not in (BUDGET_DEGRADE, BUDGET_SKIP):
+            raise ValueError(f"지원하지 않는 예산 초과 처리 방식: {on_budget_exceeded}")
+        self.max_file_size = max_file_size
+        self.time_budget = time_budget
+        self.on_budget_exceeded = on_budget_exceeded
+        self.score_only = score_only
+        self._process = None
+        self._conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def analyze(self, file_path, data=None):
+        """
+        예산을 적용하여 파일 하나를 분석
+        
+        Args:
+            file_path (str): SQL 파일 경로
+            data (bytes): 이미 읽은 파일 내용 (압축 파일 멤버 등, None이면 file_path에서 읽음)
+            
+        Returns:
+            dict: 분석 결과 (예산 초과 시 'budget_exceeded' 키 포함)
+        """
+        if self.max_file_size is not None:
+            if data is not None:
+                size = len(data)
+            else:
+                try:
+                    size = os.path.getsize(file_path)
+                except OSError:
+                    size = 0
+            if size > self.max_file_size:
+                return _skipped_result(file_path, f"파일 크기 초과 ({size} > {self.max_file_size} bytes)")
+        
+        if self.time_budget is None:
+            return analyze_sql_file(file_path, score_only=self.score_only, data=data)
+        
+        self._start_worker()
+        self._conn.send((file_path, data))
+        if self._conn.poll(self.time_budget):
+            try:
+                return self._conn.recv()
+            except EOFError:
+                # 작업 프로세스가 비정상 종료된 경우 (메모리 부족 등)
+                self._stop_worker(kill=True)
+                return {
+                    'file_name': os.path.basename(file_path),
+                    'file_path': file_path,
+                    'error': "분석 프로세스가 비정상 종료되었습니다"
+                }
+        
+        # 예산 초과: 작업 프로세스를 종료하여 진행 중인 분석을 취소
+        self._stop_worker(kill=True)
+        return self._handle_over_budget(file_path, f"시간 초과 ({self.time_budget:g}초)", data)
+    
+    def close(self):
+        """
+        작업 프로세스 종료
+        """
+        self._stop_worker(kill=False)
+    
+    def _handle_over_budget(self, file_path, reason, data=None):
+        if self.on_budget_exceeded == BUDGET_SKIP:
+            return _skipped_result(file_path, reason)
+        
+        result = analyze_sql_file(file_path, degraded=True, score_only=self.score_only, data=data)
+        result['budget_exceeded'] = reason
+        return result
+    
+    def _start_worker(self):
+        if self._process is not None and self._process.is_alive():
+            return
+        parent_conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=_budget_worker,
+                                                args=(child_conn, self.score_only), daemon=True)
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+    
+    def _stop_worker(self, kill):
+        if self._process is None:
+            return
+        if kill:
+            self._process.terminate()
+        else:
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        self._process.join()
+        self._conn.close()
+        self._process = None
+        self._conn = None
+
+def find_sql_files(directory_path, include_sources=False):
+    """
+    디렉토리 내의 모든 SQL 파일 경로를 찾음
+    
+    디렉토리와 파일을 이름순으로 탐색하므로 파일 시스템이나 머신과 관계없이
+    같은 트리에서는 항상 같은 순서가 나옵니다.
+    
+    Args:
+        directory_path (str): 탐색할 디렉토리 경로
+        include_sources (bool): SQL을 포함할 수 있는 Java/Kotlin 소스 파일도 찾을지 여부
+        
+    Yields:
+        str: SQL 파일 경로
+    """
+    extensions = ('.sql',) + tuple(SOURCE_EXTENSIONS) if include_sources else ('.sql',)
+    for root, dirs, files in os.walk(directory_path):
+        dirs.sort()
+        for file in sorted(files):
+            if file.endswith(extensions):
+                yield os.path.join(root, file)
+
+def analyze_directory(directory_path, max_file_size=None, time_budget=None,
+                      on_budget_exceeded=BUDGET_DEGRADE, cluster_threshold=None, shard=None,
+                      journal=None, score_only=False, include_sources=False, sample=None):
     """
     디렉토리 내의 모든 SQL 파일 분석
     
     Args:
         directory_path (str): 분석할 디렉토리 경로
+        max_file_size (int): 파일 크기 예산 (바이트, None이면 제한 없음)
+        time_budget (float): 파일별 분석 시간 예산 (초, None이면 제한 없음)
+        on_budget_exceeded (str): 예산 초과 시 처리 방식 ('degrade' 또는 'skip')
+        cluster_threshold (float): 유사 쿼리 클러스터링 임계 유사도 (None이면 사용 안 함)
+        shard (tuple): (샤드 번호, 전체 샤드 수), 지정하면 해당 샤드의 파일만 분석
+        journal (CheckpointJournal): 체크포인트 저널 (기록된 파일은 다시 분석하지 않음)
+        score_only (bool): 세부 평가 요소 없이 총점만 계산할지 여부
+        include_sources (bool): Java/Kotlin 소스의 SQL 문도 분석할지 여부
+            (SQL 문이 없는 소스 파일은 결과에서 제외)
+        sample (StratifiedSample): 층화 표본 (지정하면 표본으로 뽑힌 파일만 분석, 샤드와 함께 사용 불가)
         
     Returns:
         list: 각 파일의 분석 결과
     """
-    results = []
+    if sample is not None and shard is not None:
+        raise ValueError("표본 분석은 샤드 분석과 함께 사용할 수 없습니다")
     
-    # 디렉토리 내의 모든 .sql 파일 찾기
-    for root, _, files in os.walk(directory_path):
-        for file in files:
-            if file.endswith('.sql'):
-                file_path = os.path.join(root, file)
-                result = analyze_sql_file(file_path)
-                results.append(result)
+    if shard is None:
+        file_paths = list(find_sql_files(directory_path, include_sources))
+        if sample is not None:
+            file_paths = sample.draw(file_paths, directory_path)
+    else:
+        # 전체 탐색 순서를 기록해 두어 병합 시 원래 순서로 복원
+        index, count = shard
+        discovery_order = {}
+        for discovery_index, file_path in enumerate(find_sql_files(directory_path, include_sources)):
+            if shard_of(file_path, directory_path, count) == index:
+                discovery_order[file_path] = discovery_index
+        file_paths = list(discovery_order)
+    
+    # 저널에 기록된 파일은 기록된 결과를 사용
+    results = [None] * len(file_paths)
+    for index, file_path in enumerate(file_paths):
+        if journal is not None:
+            results[index] = journal.lookup(file_path)
+    
+    # 대표 파일이 바뀌었거나 없어진 클러스터 멤버는 기록된 결과를 쓰지 않고 다시 분석
+    # (대표 파일의 이전 점수를 물려받거나 대표 없는 클러스터가 남지 않도록)
+    cached_paths = {file_paths[index] for index, result in enumerate(results) if result is not None}
+    for index, result in enumerate(results):
+        if result is not None and result.get('cluster_representative', file_paths[index]) not in cached_paths:
+            results[index] = None
+    pending = [index for index, result in enumerate(results) if result is None]
+    
+    # 저널에 기록할 내용 해시는 분석할 때 읽은 내용으로 계산하여 파일을 다시 읽지 않음
+    digests = {} if journal is not None else None
+    
+    def analyze_pending(index):
+        file_path = file_paths[index]
+        data = _read_within_budget(file_path, max_file_size) if journal is not None else None
+        if data is None:
+            return analyzer.analyze(file_path)
+        digests[file_path] = content_digest(data)
+        return analyzer.analyze(file_path, data)
+    
+    with BudgetedFileAnalyzer(max_file_size, time_budget, on_budget_exceeded, score_only) as analyzer:
+        if cluster_threshold is None:
+            completed = ((index, analyze_pending(index)) for index in pending)
+        else:
+            # 소스 파일은 파일 내용이 아닌 SQL 문 단위로 점수를 매기므로 클러스터링하지 않음
+            sql_pending = [index for index in pending if source_language(file_paths[index]) is None]
+            source_pending = [index for index in pending if source_language(file_paths[index]) is not None]
+            pending_paths = [file_paths[index] for index in sql_pending]
+            completed = itertools.chain(
+                ((sql_pending[position], result) for position, result
+                 in iter_clustered_results(pending_paths, analyzer, cluster_threshold, digests)),
+                ((index, analyze_pending(index)) for index in source_pending)
+            )
+        
+        for index, result in completed:
+            results[index] = result
+            if journal is not None:
+                journal.record(file_paths[index], result, digests.pop(file_paths[index], None))
+    
+    if include_sources:
+        results = [result for result in results if not result.get('no_sql')]
+    
+    if shard is not None:
+        for result in results:
+            result['discovery_index'] = discovery_order[result['file_path']]
     
     return results
 
-def generate_report(results, output_file=None):
+def _read_within_budget(file_path, max_file_size=None):
+    """
+    분석과 저널 해시에 함께 사용할 파일 내용 읽기
+    
+    분석한 내용과 해시한 내용이 항상 같도록 한 번 읽은 bytes를 양쪽에 사용합니다.
+    
+    Args:
+        file_path (str): 파일 경로
+        max_file_size (int): 파일 크기 예산 (초과 파일은 읽지 않음)
+        
+    Returns:
+        bytes: 파일 내용 (읽을 수 없거나 예산을 넘으면 None)
+    """
+    try:
+        if max_file_size is not None and os.path.getsize(file_path) > max_file_size:
+            return None
+        with open(file_path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def analyze_archive(archive_path, max_file_size=None, time_budget=None,
+                    on_budget_exceeded=BUDGET_DEGRADE, score_only=False, include_sources=False):
+    """
+    압축 파일(zip/jar/war, tar.gz) 안의 SQL 파일을 풀지 않고 분석
+    
+    멤버는 압축 파일에 저장된 순서대로 하나씩 읽어 분석하며, 결과의 file_path는
+    '압축 파일 경로!/멤버 경로' 형식입니다. max_file_size를 넘는 멤버는 메모리에
+    읽지 않으므로 디렉토리 분석과 마찬가지로 on_budget_exceeded와 관계없이 건너뜁니다.
+    
+    Args:
+        archive_path (str): 분석할 압축 파일 경로
+        max_file_size (int): 파일 크기 예산 (바이트, None이면 제한 없음)
+        time_budget (float): 파일별 분석 시간 예산 (초, None이면 제한 없음)
+        on_budget_exceeded (str): 예산 초과 시 처리 방식 ('degrade' 또는 'skip')
+        score_only (bool): 세부 평가 요소 없이 총점만 계산할지 여부
+        include_sources (bool): Java/Kotlin 소스의 SQL 문도 분석할지 여부
+        
+    Returns:
+        list: 각 파일의 분석 결과
+    """
+    extensions = ('.sql',) + (tuple(SOURCE_EXTENSIONS) if include_sources else ())
+    
+    results = []
+    with BudgetedFileAnalyzer(max_file_size, time_budget, on_budget_exceeded, score_only) as analyzer:
+        for member_path, data, size in iter_archive_members(archive_path, extensions, max_file_size):
+            if data is None:
+                results.append(_skipped_result(member_path, f"파일 크기 초과 ({size} > {max_file_size} bytes)"))
+                continue
+            result = analyzer.analyze(member_path, data)
+            if not result.get('no_sql'):
+                results.append(result)
+    return results
+
+def _split_by_representative(clusters, signatures, threshold):
+    """
+    LSH 클러스터를 대표 파일과 직접 유사한 멤버끼리의 그룹으로 나눔
+    
+    후보 연결로 묶인 클러스터는 대표 파일과 유사하지 않은 멤버를 포함할 수 있으므로,
+    남은 멤버 중 첫 파일을 대표로 삼아 대표와의 추정 유사도가 threshold 이상인 멤버만
+    그룹에 넣고 나머지로 같은 과정을 반복합니다.
+    
+    Args:
+        clusters (list): cluster_signatures 결과
+        signatures (list): MinHash 서명 목록
+        threshold (float): 같은 그룹으로 볼 최소 추정 유사도
+        
+    Yields:
+        tuple: (대표 인덱스, {멤버 인덱스: 대표와의 추정 유사도})
+    """
+    for members in clusters:
+        while members:
+            representative = members[0]
+            similarities = {}
+            remaining = []
+            for index in members[1:]:
+                similarity = estimate_similarity(signatures[representative], signatures[index])
+                if similarity >= threshold:
+                    similarities[index] = similarity
+                else:
+                    remaining.append(index)
+            yield representative, similarities
+            members = remaining
+
+def iter_clustered_results(file_paths, analyzer, threshold=DEFAULT_THRESHOLD, digests=None):
+    """
+    거의 동일한 SQL 문을 클러스터로 묶고 클러스터마다 대표 파일만 점수 계산
+    
+    점수를 매기는 단위(SQL 문 하나 또는 MyBatis 매퍼 하나)인 파일을 클러스터링하며,
+    여러 SQL 문을 담은 PL/SQL 파일은 클러스터링하지 않고 각각 분석합니다.
+    LSH 후보 연결로 만들어진 클러스터는 대표 파일(클러스터의 첫 파일)과의 추정
+    유사도가 threshold 이상인 멤버끼리 다시 나누므로, 대표와 유사하지 않은 멤버가
+    대표의 점수를 물려받지 않습니다.
+    대표 파일과 대표와 가장 덜 유사한 멤버를 분석하여 점수 범위를 구하고(분석한 멤버
+    기준의 관측 범위이며 상한/하한을 보장하지는 않음), 나머지 멤버는 예산 초과 표시를
+    제외한 대표 파일의 결과를 물려받습니다.
+    
+    Args:
+        file_paths (list): 분석할 파일 경로 목록
+        analyzer (BudgetedFileAnalyzer): 파일 분석기
+        threshold (float): 같은 클러스터로 볼 최소 추정 유사도
+        digests (dict): 지정하면 파일 내용의 content_digest 값을 경로별로 기록
+            (분석한 파일은 분석한 내용, 점수를 물려받은 멤버는 서명을 만든 내용 기준)
+            
+    Yields:
+        tuple: (file_paths 내 인덱스, 분석 결과), 클러스터 단위로 완료되는 대로 반환
+    """
+    hasher = MinHasher()
+    signatures = []
+    for file_path in file_paths:
+        try:
+            data = _read_within_budget(file_path, analyzer.max_file_size)
+            if data is None:
+                signatures.append(None)
+                continue
+            if digests is not None:
+                digests[file_path] = content_digest(data)
+            content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+            # PL/SQL 파일은 SQL 문 여러 개를 담고 있으므로 단독으로 분석
+            signatures.append(None if is_plsql_source(content) else hasher.query_signature(content))
+        except (OSError, UnicodeDecodeError):
+            # 읽을 수 없는 파일은 단독으로 분석하여 오류를 보고
+            signatures.append(None)
+    
+    def analyze_file(index):
+        # 서명을 만든 뒤 파일이 바뀌었을 수 있으므로 분석할 내용을 다시 읽어 그 내용으로 해시
+        # (모든 파일 내용을 클러스터링이 끝날 때까지 메모리에 유지하지 않음)
+        file_path = file_paths[index]
+        data = _read_within_budget(file_path, analyzer.max_file_size)
+        if data is not None and digests is not None:
+            digests[file_path] = content_digest(data)
+        return analyzer.analyze(file_path, data)
+    
+    clusters = cluster_signatures(signatures, threshold)
+    for representative, similarities in _split_by_representative(clusters, signatures, threshold):
+        similar_members = sorted(similarities)
+        
+        representative_result = analyze_file(representative)
+        
+        if not similar_members:
+            yield representative, representative_result
+            continue
+        
+        if not is_scored(representative_result):
+            # 대표 파일을 분석하지 못하면 멤버를 각각 분석
+            yield representative, representative_result
+            for index in similar_members:
+                yield index, analyze_file(index)
+            continue
+        
+        outlier = min(similar_members, key=lambda index: similarities[index])
+        outlier_result = analyze_file(outlier)
+        
+        scores = [representative_result['complexity_score']]
+        if is_scored(outlier_result):
+            scores.append(outlier_result['complexity_score'])
+        
+        representative_path = file_paths[representative]
+        representative_result['cluster_representative'] = representative_path
+        representative_result['cluster_size'] = len(similar_members) + 1
+        representative_result['cluster_score_range'] = [min(scores), max(scores)]
+        representative_result['cluster_scored_count'] = len(scores)
+        yield representative, representative_result
+        
+        for index in similar_members:
+            if index == outlier:
+                member_result = outlier_result
+            else:
+                member_result = dict(representative_result)
+                member_result['file_name'] = os.path.basename(file_paths[index])
+                member_result['file_path'] = file_paths[index]
+                member_result['cluster_inherited'] = True
+                del member_result['cluster_size']
+                del member_result['cluster_score_range']
+                del member_result['cluster_scored_count']
+                # 예산 초과는 대표 파일의 상태이므로 물려받지 않음
+                member_result.pop('budget_exceeded', None)
+                member_result.pop('degraded', None)
+            member_result['cluster_representative'] = representative_path
+            member_result['cluster_similarity'] = round(similarities[index], 2)
+            yield index, member_result
+
+def is_scored(result):
+    """
+    분석 결과에 복잡도 점수가 있는지 확인 (오류 및 건너뛴 파일 제외)
+    
+    Args:
+        result (dict): 분석 결과
+        
+    Returns:
+        bool: 점수 존재 여부
+    """
+    return 'error' not in result and 'complexity_score' in result
+
+def format_summary(aggregate):
+    """
+    집계 결과로 보고서의 요약, 복잡도 분포, 점수 통계, 디렉토리별 요약 섹션 생성
+    
+    Args:
+        aggregate (ComplexityAggregator): 분석 결과 집계
+        
+    Returns:
+        list: 보고서 줄 목록
+    """
+    report = []
+    report.append("\n## 요약")
+    report.append(f"- MyBatis 동적 쿼리: {aggregate.mybatis_count}개")
+    report.append(f"- 일반 SQL 쿼리: {aggregate.regular_sql_count}개")
+    report.append(f"- 분석 오류: {aggregate.error_count}개")
+    if aggregate.budget_count:
+        report.append(f"- 예산 초과: {aggregate.budget_count}개")
+    
+    report.append("\n### 복잡도 분포")
+    
+    for description, count in sorted(aggregate.description_counts.items(), 
+                                   key=lambda x: COMPLEXITY_ORDER.get(x[0], 999)):
+        percentage = (count / aggregate.scored_count) * 100 if aggregate.scored_count > 0 else 0
+        report.append(f"- {description}: {count}개 ({percentage:.1f}%)")
+    
+    if aggregate.complexity.count:
+        percentile_headers = " | ".join(f"p{p}" for p in REPORT_PERCENTILES)
+        table_header = f"| 항목 | 개수 | 평균 | 최소 | {percentile_headers} | 최대 |"
+        table_divider = "|" + "---|" * (len(REPORT_PERCENTILES) + 5)
+        
+        report.append("\n### 점수 통계")
+        report.append(table_header)
+        report.append(table_divider)
+        report.append(format_summary_row("complexity_score", aggregate.complexity))
+        for category in sorted(aggregate.categories):
+            report.append(format_summary_row(category, aggregate.categories[category]))
+        
+        directories = aggregate.rollup_directories()
+        if len(directories) > 1:
+            report.append("\n### 디렉토리별 요약 (하위 디렉토리 포함)")
+            report.append(table_header + " 오류 |")
+            report.append(table_divider + "---|")
+            for directory, directory_aggregate in directories:
+                row = format_summary_row(directory or ".", directory_aggregate.complexity)
+                report.append(f"{row} {directory_aggregate.error_count} |")
+    
+    return report
+
+def format_sample_estimate(estimate):
+    """
+    표본 추정 결과로 보고서의 표본 추정 섹션 생성
+    
+    Args:
+        estimate (dict): StratifiedSample.estimate 결과
+        
+    Returns:
+        list: 보고서 줄 목록
+    """
+    population = estimate['population']
+    report = []
+    report.append("\n## 표본 추정")
+    report.append(f"- 표본: 전체 {population}개 파일 중 {estimate['sample_size']}개 "
+                  f"(층 {estimate['strata']}개 중 {estimate['sampled_strata']}개에서 추출)")
+    report.append(f"- 신뢰구간: {CONFIDENCE_LEVEL:.0%} (층화 추정, 정규 근사)")
+    report.append("\n| 복잡도 | 표본 수 | 추정 비율 | 신뢰구간 | 추정 파일 수 |")
+    report.append("|---|---|---|---|---|")
+    for category, sample_count, proportion, low, high in sorted(
+            estimate['buckets'], key=lambda x: COMPLEXITY_ORDER.get(x[0], 999)):
+        report.append(f"| {category} | {sample_count} | {proportion:.1%} | {low:.1%} ~ {high:.1%} | "
+                      f"{round(proportion * population)} ({round(low * population)} ~ "
+                      f"{round(high * population)}) |")
+    return report
+
+def generate_report(results, output_file=None, sample=None):
     """
     분석 결과를 보고서로 생성
     
     Args:
         results (list): 분석 결과 목록
         output_file (str): 출력 파일 경로 (None인 경우 콘솔에 출력)
+        sample (StratifiedSample): 결과를 만든 층화 표본 (지정하면 전체 분포 추정 섹션 추가)
     """
     report = []
     report.append("# SQL 쿼리 복잡도 분석 보고서")
     report.append(f"\n분석 파일 수: {len(results)}")
     
-    # 복잡도 레벨별 파일 수 집계
-    complexity_counts = defaultdict(int)
-    mybatis_count = 0
-    regular_sql_count = 0
-    error_count = 0
+    # 결과를 한 번만 순회하며 통계 집계와 섹션별 분류를 함께 수행
+    aggregate = ComplexityAggregator()
+    scored_results = []
+    error_files = []
+    budget_files = []
+    cluster_members = defaultdict(list)
     
     for result in results:
+        aggregate.add(result)
+        if is_scored(result):
+            scored_results.append(result)
         if 'error' in result:
-            error_count += 1
-            continue
-            
-        complexity_counts[result['description']] += 1
-        if result['is_mybatis']:
-            mybatis_count += 1
-        else:
-            regular_sql_count += 1
+            error_files.append(result)
+        if 'budget_exceeded' in result:
+            budget_files.append(result)
+        if 'cluster_representative' in result:
+            cluster_members[result['cluster_representative']].append(result)
     
-    report.append("\n## 요약")
-    report.append(f"- MyBatis 동적 쿼리: {mybatis_count}개")
-    report.append(f"- 일반 SQL 쿼리: {regular_sql_count}개")
-    report.append(f"- 분석 오류: {error_count}개")
-    
-    report.append("\n### 복잡도 분포")
-    
-    # 복잡도 순서 정의
-    complexity_order = {
-        "매우 간단 (Very Simple)": 0,
-        "간단 (Simple)": 1,
-        "중간 (Moderate)": 2,
-        "복잡 (Complex)": 3,
-        "매우 복잡 (Very Complex)": 4,
-        "극도로 복잡 (Extremely Complex)": 5
-    }
+    report.extend(format_summary(aggregate))
     
-    for description, count in sorted(complexity_counts.items(), 
-                                   key=lambda x: complexity_order.get(x[0], 999)):
-        percentage = (count / (len(results) - error_count)) * 100 if (len(results) - error_count) > 0 else 0
-        report.append(f"- {description}: {count}개 ({percentage:.1f}%)")
+    if sample is not None:
+        report.extend(format_sample_estimate(sample.estimate(results)))
     
     # 복잡도 순으로 정렬
-    sorted_results = sorted([r for r in results if 'error' not in r], 
+    sorted_results = sorted(scored_results, 
                            key=lambda x: x['complexity_score'], 
                            reverse=True)
     
     report.append("\n## 파일별 상세 분석")
     
     for result in sorted_results:
+        # 클러스터 멤버는 대표 파일 항목과 클러스터 섹션에서만 표시
+        if result.get('cluster_representative', result['file_path']) != result['file_path']:
+            continue
+        
         file_name = result['file_name']
         complexity = result['complexity_score']
         description = result['description']
         
         report.append(f"\n### {file_name} - {complexity}/10 ({description})")
         
+        if 'cluster_size' in result:
+            report.append(f"- 유사 쿼리 클러스터 대표 (멤버 {result['cluster_size']}개)")
+        
+        if result.get('degraded'):
+            report.append(f"- 근사 점수: {result.get('budget_exceeded', '저비용 모드')}")
+        
         if result['is_mybatis']:
             report.append(f"- 유형: MyBatis 동적 쿼리")
             report.append(f"- 기본 SQL 복잡도: {result['base_complexity']}/10")
             report.append(f"- 최대 SQL 복잡도: {result['max_complexity']}/10")
             report.append(f"- 동적 쿼리 복잡도: {result['dynamic_complexity']}/3.0")
+        elif result.get('is_plsql'):
+            report.append(f"- 유형: PL/SQL (단위 {len(result['plsql_units'])}개, "
+                          f"SQL 문 {result['statement_count']}개, 점수는 SQL 문 중 최고 점수)")
+            report.append("\n단위별 집계:")
+            for unit in result['plsql_units']:
+                indent = "  " if unit['parent'] is not None else ""
+                report.append(f"{indent}- {unit['kind']} {unit['name']} "
+                              f"({unit['start_line']}-{unit['end_line']}행): "
+                              f"SQL 문 {unit['statement_count']}개, "
+                              f"최고 {unit['max_score']}/10, 평균 {unit['mean_score']}/10")
+            report.append("\nSQL 문별 점수:")
+            for statement in result.get('plsql_statements', []):
+                unit = result['plsql_units'][statement['unit']]['name'] if statement['unit'] is not None else "-"
+                report.append(f"- {statement['start_line']}행 {statement['keyword']} ({unit}): "
+                              f"{statement['score']}/10")
+        elif result.get('source_language'):
+            language = SOURCE_LANGUAGE_NAMES.get(result['source_language'], result['source_language'])
+            report.append(f"- 유형: {language} 소스 내장 SQL (SQL 문 {result['statement_count']}개, "
+                          f"점수는 SQL 문 중 최고 점수)")
+            report.append("\nSQL 문별 점수:")
+            for statement in result['source_statements']:
+                kind = SOURCE_STATEMENT_KINDS.get(statement['kind'], statement['kind'])
+                report.append(f"- {statement['line']}행 {kind}: {statement['score']}/10")
         else:
             report.append(f"- 유형: 일반 SQL 쿼리")
         
-        report.append("\n세부 평가 요소:")
-        for category, score in result['detailed_scores'].items():
-            report.append(f"- {category}: {score}")
+        if 'detailed_scores' in result:
+            report.append("\n세부 평가 요소:")
+            for category, score in result['detailed_scores'].items():
+                report.append(f"- {category}: {score}")
+    
+    # 유사 쿼리 클러스터 목록
+    if cluster_members:
+        report.append("\n## 유사 쿼리 클러스터")
+        clusters = sorted(cluster_members.values(), key=len, reverse=True)
+        for members in clusters:
+            representative = next((m for m in members if 'cluster_size' in m), None)
+            if representative is None:
+                # 대표 파일의 결과가 없는 클러스터 (대표 파일이 빠진 결과를 병합한 경우 등)
+                representative_name = os.path.basename(members[0]['cluster_representative'])
+                report.append(f"\n### {representative_name} - 멤버 {len(members)}개 (대표 파일 결과 없음)")
+            else:
+                low, high = representative['cluster_score_range']
+                scored_count = representative.get('cluster_scored_count', 2)
+                report.append(f"\n### {representative['file_name']} - 멤버 {len(members)}개, "
+                              f"점수 범위 {low}~{high}/10 (편차 {round(high - low, 1)}, "
+                              f"개별 분석한 {scored_count}개 기준)")
+            for member in members:
+                if member is representative:
+                    report.append(f"- {member['file_path']} (대표, {member['complexity_score']}/10)")
+                elif member.get('cluster_inherited'):
+                    report.append(f"- {member['file_path']} (유사도 {member['cluster_similarity']})")
+                else:
+                    score = member.get('complexity_score', '-')
+                    report.append(f"- {member['file_path']} (유사도 {member['cluster_similarity']}, "
+                                  f"개별 분석 {score}/10)")
     
     # 오류 발생 파일 목록
-    error_files = [r for r in results if 'error' in r]
     if error_files:
         report.append("\n## 분석 오류 파일")
         for result in error_files:
             report.append(f"- {result['file_name']}: {result['error']}")
     
+    # 예산 초과 파일 목록
+    if budget_files:
+        report.append("\n## 예산 초과 파일")
+        for result in budget_files:
+            handling = "근사 점수 적용" if is_scored(result) else "분석 취소"
+            report.append(f"- {result['file_path']}: {result['budget_exceeded']} ({handling})")
+    
     # 보고서 출력 또는 파일 저장
     report_text = "\n".join(report)
     
@@ -212,21 +926,129 @@ def generate_report(results, output_file=None):
     
     return report_text
 
-def main():
+def _parse_size(value):
     """
-    메인 함수
+    크기 문자열을 바이트 수로 변환 (예: 512K, 10M, 1G)
+    
+    Args:
+        value (str): 크기 문자열
+        
+    Returns:
+        int: 바이트 수
     """
-    if len(sys.argv) < 2:
-        print("사용법: python sql_directory_analyzer.py <디렉토리_경로> [출력_파일_경로]")
-        return
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    value = value.strip().upper()
+    try:
+        if value and value[-1] in units:
+            return int(float(value[:-1]) * units[value[-1]])
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"잘못된 크기 값: {value}")
+
+def _parse_shard_arg(value):
+    """
+    argparse용 샤드 지정 문자열 변환
     
-    directory_path = sys.argv[1]
+    Args:
+        value (str): 'i/N' 형식 문자열
+        
+    Returns:
+        tuple: (샤드 번호, 전체 샤드 수)
+    """
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def _parse_sample_arg(value):
+    """
+    argparse용 표본 크기 문자열 변환
+    
+    Args:
+        value (str): 파일 수 또는 비율 문자열
+        
+    Returns:
+        int 또는 float: 파일 수 또는 비율
+    """
+    try:
+        return parse_sample(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def _journal_options(args):
+    """
+    체크포인트 저널 헤더에 기록할, 파일별 결과에 영향을 주는 분석 옵션
+    
+    Args:
+        args (argparse.Namespace): 명령줄 인수
+        
+    Returns:
+        dict: 분석 옵션
+    """
+    return {
+        'max_file_size': args.max_file_size,
+        'time_budget': args.time_budget,
+        'on_budget_exceeded': args.on_budget_exceeded,
+        'score_only': args.score_only,
+        'cluster': args.cluster
+    }
+
+def build_arg_parser():
+    """
+    명령줄 인수 파서 생성
     
-    # 출력 파일 경로가 명령줄 인수로 제공되었는지 확인
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+    Returns:
+        argparse.ArgumentParser: 인수 파서
+    """
+    parser = argparse.ArgumentParser(description="디렉토리 내 SQL 파일 복잡도 분석")
+    parser.add_argument('directory_path',
+                        help="분석할 디렉토리 또는 압축 파일(.zip, .jar, .war, .ear, .tar.gz, .tgz, .tar) 경로")
+    parser.add_argument('output_file', nargs='?', help="출력 파일 경로 (생략 시 저장 여부를 물어봄)")
+    parser.add_argument('--max-file-size', type=_parse_size, default=None,
+                        help="파일 크기 예산 (예: 512K, 10M). 초과 파일은 읽지 않고 건너뜀")
+    parser.add_argument('--time-budget', type=float, default=None,
+                        help="파일별 분석 시간 예산 (초). 초과 시 분석을 취소")
+    parser.add_argument('--cluster', nargs='?', type=float, const=DEFAULT_THRESHOLD, default=None,
+                        metavar='THRESHOLD',
+                        help=f"거의 동일한 쿼리를 클러스터로 묶어 대표 파일만 분석 "
+                             f"(임계 유사도, 기본값 {DEFAULT_THRESHOLD})")
+    parser.add_argument('--shard', type=_parse_shard_arg, default=None, metavar='I/N',
+                        help="경로 해시로 나눈 N개 샤드 중 I번째(1부터) 샤드의 파일만 분석")
+    parser.add_argument('--partial', default=None, metavar='PATH',
+                        help="보고서 대신 부분 결과 파일(.jsonl.gz)을 저장 (analyze-sql-merge로 병합)")
+    parser.add_argument('--journal', default=None, metavar='PATH',
+                        help="완료된 파일별 결과를 기록할 체크포인트 저널 파일 경로")
+    parser.add_argument('--resume', action='store_true',
+                        help="--journal에 기록된 파일 중 바뀌지 않은 파일은 다시 분석하지 않고 이어서 실행")
+    parser.add_argument('--db', default=None, metavar='PATH',
+                        help="분석 결과를 저장할 SQLite 데이터베이스 경로 (query-sql-results로 조회)")
+    parser.add_argument('--run-label', default=None,
+                        help="--db에 저장할 실행 이름 (예: 브랜치, 릴리스)")
+    parser.add_argument('--include-sources', action='store_true',
+                        help="Java/Kotlin 소스(.java, .kt)의 MyBatis 어노테이션과 문자열 리터럴 SQL도 분석")
+    parser.add_argument('--score-only', action='store_true',
+                        help="세부 평가 요소 없이 총점만 계산 (최대 점수에 도달한 규칙은 건너뛰는 빠른 모드)")
+    parser.add_argument('--sample', type=_parse_sample_arg, default=None, metavar='N|FRACTION',
+                        help="디렉토리/크기로 층화한 표본 N개 파일(또는 0-1 사이 비율)만 분석하고 "
+                             "전체 복잡도 분포를 신뢰구간과 함께 추정")
+    parser.add_argument('--sample-seed', type=int, default=DEFAULT_SAMPLE_SEED,
+                        help=f"표본 시드 (기본값 {DEFAULT_SAMPLE_SEED}). 같은 시드로 표본 크기를 늘리면 "
+                             f"이전 표본을 포함")
+    parser.add_argument('--on-budget-exceeded', choices=[BUDGET_DEGRADE, BUDGET_SKIP],
+                        default=BUDGET_DEGRADE,
+                        help="시간 예산 초과 파일 처리 방식: degrade(근사 점수, 기본값) 또는 skip(건너뜀)")
+    return parser
+
+def main():
+    """
+    메인 함수
+    """
+    args = build_arg_parser().parse_args()
+    directory_path = args.directory_path
+    output_file = args.output_file
     
-    # 출력 파일이 제공되지 않은 경우 사용자에게 물어봄
-    if output_file is None:
+    # 출력 파일이 제공되지 않은 경우 사용자에게 물어봄 (부분 결과 저장 시 제외)
+    if output_file is None and args.partial is None:
         user_input = input("분석 결과를 파일로 저장하시겠습니까? (y/n): ").strip().lower()
         if user_input == 'y' or user_input == 'yes':
             default_output = os.path.join(os.path.dirname(directory_path), "analysis_report.md")
@@ -234,18 +1056,107 @@ def main():
             if not output_file:
                 output_file = default_output
     
-    if not os.path.isdir(directory_path):
-        print(f"오류: {directory_path}는 유효한 디렉토리가 아닙니다.")
+    archive = os.path.isfile(directory_path) and is_archive(directory_path)
+    if not archive and not os.path.isdir(directory_path):
+        print(f"오류: {directory_path}는 유효한 디렉토리나 압축 파일이 아닙니다.")
+        return
+    
+    if archive and (args.cluster is not None or args.shard or args.journal):
+        print("오류: 압축 파일 분석에는 --cluster, --shard, --journal/--resume을 사용할 수 없습니다.")
+        return
+    
+    if args.sample is not None and (archive or args.shard or args.partial):
+        print("오류: --sample은 디렉토리 분석에서만 사용할 수 있으며 --shard, --partial과 함께 사용할 수 없습니다.")
+        return
+    
+    if args.resume and not args.journal:
+        print("오류: --resume은 --journal과 함께 사용해야 합니다.")
         return
     
-    print(f"{directory_path} 디렉토리의 SQL 파일 분석 중...")
-    results = analyze_directory(directory_path)
+    journal = None
+    if args.journal:
+        try:
+            journal = CheckpointJournal(args.journal, resume=args.resume, options=_journal_options(args))
+        except ValueError as e:
+            print(f"오류: {e}")
+            return
+    if journal is not None and len(journal):
+        print(f"체크포인트 저널에서 {len(journal)}건의 기록을 불러왔습니다.")
+    
+    sample = StratifiedSample(args.sample, args.sample_seed) if args.sample is not None else None
+    
+    if archive:
+        print(f"{directory_path} 압축 파일의 SQL 파일 분석 중...")
+        results = analyze_archive(directory_path,
+                                  max_file_size=args.max_file_size,
+                                  time_budget=args.time_budget,
+                                  on_budget_exceeded=args.on_budget_exceeded,
+                                  score_only=args.score_only,
+                                  include_sources=args.include_sources)
+    else:
+        if args.shard:
+            print(f"{directory_path} 디렉토리의 SQL 파일 분석 중... (샤드 {args.shard[0]}/{args.shard[1]})")
+        elif sample is not None:
+            print(f"{directory_path} 디렉토리의 SQL 파일 표본 분석 중... (시드 {args.sample_seed})")
+        else:
+            print(f"{directory_path} 디렉토리의 SQL 파일 분석 중...")
+        try:
+            results = analyze_directory(directory_path,
+                                        max_file_size=args.max_file_size,
+                                        time_budget=args.time_budget,
+                                        on_budget_exceeded=args.on_budget_exceeded,
+                                        cluster_threshold=args.cluster,
+                                        shard=args.shard,
+                                        journal=journal,
+                                        score_only=args.score_only,
+                                        include_sources=args.include_sources,
+                                        sample=sample)
+        finally:
+            if journal is not None:
+                journal.close()
+    
+    if args.db:
+        with ResultsDatabase(args.db) as db:
+            run_id = db.store_run(results, root=directory_path, label=args.run_label)
+        print(f"분석 결과가 {args.db}에 실행 #{run_id}로 저장되었습니다.")
+    
+    if args.partial:
+        write_partial_results(args.partial, results, root=directory_path, shard=args.shard)
+        print(f"부분 결과 {len(results)}건이 {args.partial}에 저장되었습니다.")
+        return
     
     if not results:
         print("SQL 파일을 찾을 수 없습니다.")
         return
     
-    generate_report(results, output_file)
+    generate_report(results, output_file, sample)
+
+def merge_main():
+    """
+    부분 결과 병합 명령: 샤드별 부분 결과 파일을 합쳐 하나의 보고서 생성
+    """
+    parser = argparse.ArgumentParser(description="샤드 분석 부분 결과를 병합하여 보고서 생성")
+    parser.add_argument('partials', nargs='+', help="부분 결과 파일 경로 (.jsonl.gz)")
+    parser.add_argument('-o', '--output', default=None, help="출력 파일 경로 (생략 시 콘솔에 출력)")
+    parser.add_argument('--db', default=None, metavar='PATH',
+                        help="병합된 결과를 저장할 SQLite 데이터베이스 경로")
+    parser.add_argument('--run-label', default=None, help="--db에 저장할 실행 이름")
+    args = parser.parse_args()
+    
+    results, warnings, root = merge_partial_results(args.partials)
+    for warning in warnings:
+        print(f"경고: {warning}")
+    
+    if not results:
+        print("병합할 분석 결과가 없습니다.")
+        return
+    
+    if args.db:
+        with ResultsDatabase(args.db) as db:
+            run_id = db.store_run(results, root=root, label=args.run_label)
+        print(f"분석 결과가 {args.db}에 실행 #{run_id}로 저장되었습니다.")
+    
+    generate_report(results, args.output)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+테스트 공통 설정
+src 디렉토리의 모듈을 직접 실행할 때와 같은 방식으로 가져오도록 경로를 추가하고 공통 fixture를 정의
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+@pytest.fixture
+def chained_signatures():
+    """
+    A-B, B-C는 유사하지만 A-C는 유사하지 않은 서명 세 개
+    
+    Returns:
+        list: [A, B, C] 서명 (A-B, B-C 유사도 약 0.86, A-C 유사도 약 0.72)
+    """
+    from query_clustering import DEFAULT_NUM_PERM
+    a = list(range(DEFAULT_NUM_PERM))
+    b = a[:55] + [1000 + i for i in range(9)]
+    c = [2000 + i for i in range(9)] + b[9:]
+    return [tuple(a), tuple(b), tuple(c)]
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'samples')
+
+@pytest.fixture
+def sql_tree(tmp_path):
+    """
+    샘플 SQL 파일과 값만 다른 복사본을 하위 디렉토리에 나누어 담은 분석 대상 디렉토리
+    
+    Returns:
+        pathlib.Path: 분석 루트 디렉토리
+    """
+    root = tmp_path / 'sql'
+    samples = sorted(name for name in os.listdir(SAMPLES_DIR) if name.endswith('.sql'))
+    for index in range(24):
+        name = samples[index % len(samples)]
+        with open(os.path.join(SAMPLES_DIR, name), 'r', encoding='utf-8') as f:
+            content = f.read()
+        directory = root / f'app{index % 3}' / f'mod{index % 2}'
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f'q{index:02d}_{name}').write_text(content.replace('2010', str(2000 + index)),
+                                                        encoding='utf-8')
+    (root / 'broken.sql').write_bytes(b"SELECT \xff\xfe FROM dual")
+    return root
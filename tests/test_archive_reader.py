@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+압축 파일 멤버 읽기 테스트
+크기 예산을 넘는 멤버를 읽지 않고 내보내는지 확인
+"""
+
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from archive_reader import iter_archive_members
+
+SMALL_SQL = b"SELECT 1 FROM dual"
+LARGE_SQL = b"SELECT * FROM users WHERE " + b"id = 1 OR " * 200 + b"1 = 1"
+
+def _write_zip(path):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('db/small.sql', SMALL_SQL)
+        archive.writestr('db/large.sql', LARGE_SQL)
+        archive.writestr('README.txt', b"not sql")
+
+def _write_tar(path):
+    with tarfile.open(path, 'w:gz') as archive:
+        for name, data in (('./db/small.sql', SMALL_SQL), ('./db/large.sql', LARGE_SQL)):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+@pytest.mark.parametrize('file_name, write', [('bundle.zip', _write_zip), ('bundle.tar.gz', _write_tar)])
+def test_oversized_members_are_not_read(tmp_path, file_name, write):
+    archive_path = str(tmp_path / file_name)
+    write(archive_path)
+    
+    members = list(iter_archive_members(archive_path, max_file_size=100))
+    
+    assert members == [
+        (archive_path + '!/db/small.sql', SMALL_SQL, len(SMALL_SQL)),
+        (archive_path + '!/db/large.sql', None, len(LARGE_SQL)),
+    ]
+
+def test_members_are_read_without_budget(tmp_path):
+    archive_path = str(tmp_path / 'bundle.zip')
+    _write_zip(archive_path)
+    
+    members = list(iter_archive_members(archive_path))
+    
+    assert [data for _, data, _ in members] == [SMALL_SQL, LARGE_SQL]
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+층화 표본 추출 테스트
+표본의 재현성과 포함 관계, 합성 모집단에서 신뢰구간의 포함 확률을 확인
+"""
+
+import random
+
+import pytest
+
+from file_sampling import EXCLUDED_CATEGORY, StratifiedSample
+
+# 합성 모집단의 분류와 디렉토리별 분류 확률 (층화가 추정에 영향을 주도록 디렉토리마다 다르게)
+CATEGORIES = ("간단 (Simple)", "중간 (Moderate)", "복잡 (Complex)")
+DIRECTORY_WEIGHTS = {
+    'billing': (0.7, 0.2, 0.1),
+    'orders': (0.3, 0.4, 0.3),
+    'reports': (0.1, 0.3, 0.6),
+}
+FILE_SIZES = (200, 2000, 6000)
+
+@pytest.fixture
+def population(tmp_path):
+    """
+    디렉토리와 크기가 다른 파일 600개와 파일별 분류
+    
+    Returns:
+        str: 분석 루트 디렉토리
+        list: 파일 경로 (탐색 순서)
+        dict: 파일 경로별 분류
+    """
+    rng = random.Random(7)
+    root = tmp_path / 'population'
+    file_paths = []
+    categories = {}
+    for directory, weights in DIRECTORY_WEIGHTS.items():
+        (root / directory).mkdir(parents=True)
+        for index in range(200):
+            path = root / directory / f'q{index:03d}.sql'
+            path.write_bytes(b'x' * rng.choice(FILE_SIZES))
+            file_paths.append(str(path))
+            categories[str(path)] = rng.choices(CATEGORIES, weights)[0]
+    return str(root), file_paths, categories
+
+def _results(file_paths, categories):
+    return [{'file_path': file_path, 'complexity_score': 1.0, 'description': categories[file_path]}
+            for file_path in file_paths]
+
+def test_same_seed_draws_same_sample(population):
+    root, file_paths, _ = population
+    
+    first = StratifiedSample(60, seed=3).draw(file_paths, root)
+    second = StratifiedSample(60, seed=3).draw(list(reversed(file_paths)), root)
+    other_seed = StratifiedSample(60, seed=4).draw(file_paths, root)
+    
+    assert len(first) == 60
+    assert sorted(first) == sorted(second)
+    assert sorted(first) != sorted(other_seed)
+    # 탐색 순서 유지
+    assert first == [file_path for file_path in file_paths if file_path in set(first)]
+
+@pytest.mark.parametrize('smaller, larger', [(10, 50), (50, 51), (0.05, 0.2), (30, 0.5)])
+def test_larger_sample_contains_smaller(population, smaller, larger):
+    root, file_paths, _ = population
+    
+    for seed in range(5):
+        small = StratifiedSample(smaller, seed).draw(file_paths, root)
+        large = StratifiedSample(larger, seed).draw(file_paths, root)
+        assert set(small) <= set(large)
+
+def test_allocation_is_proportional_to_strata(population):
+    root, file_paths, _ = population
+    sample = StratifiedSample(0.1, seed=0)
+    
+    drawn = sample.draw(file_paths, root)
+    
+    assert len(drawn) == sample.sample_size == 60
+    for stratum, count in sample.population.items():
+        assert abs(sample.allocation[stratum] - count * 0.1) <= 1
+
+def test_full_sample_estimates_exact_proportions(population):
+    root, file_paths, categories = population
+    sample = StratifiedSample(len(file_paths))
+    
+    drawn = sample.draw(file_paths, root)
+    estimate = sample.estimate(_results(drawn, categories)[1:])
+    
+    buckets = {bucket[0]: bucket[2:] for bucket in estimate['buckets']}
+    for category in CATEGORIES:
+        share = sum(1 for file_path in file_paths[1:] if categories[file_path] == category) / len(file_paths)
+        assert buckets[category] == pytest.approx((share, share, share))
+    # 결과에서 빠진 표본 파일은 분석 제외로 분류
+    assert buckets[EXCLUDED_CATEGORY][0] == pytest.approx(1 / len(file_paths))
+
+def test_confidence_interval_coverage(population):
+    root, file_paths, categories = population
+    truth = {category: sum(1 for file_path in file_paths if categories[file_path] == category)
+             / len(file_paths) for category in CATEGORIES}
+    
+    trials = 200
+    covered = {category: 0 for category in CATEGORIES}
+    for seed in range(trials):
+        sample = StratifiedSample(80, seed)
+        estimate = sample.estimate(_results(sample.draw(file_paths, root), categories))
+        for category, _, _, low, high in estimate['buckets']:
+            if low <= truth[category] <= high:
+                covered[category] += 1
+    
+    # 95% 신뢰구간: 정규 근사와 시행 수를 고려한 허용 범위 (너무 넓은 구간도 실패)
+    for category in CATEGORIES:
+        assert 0.88 <= covered[category] / trials <= 0.99
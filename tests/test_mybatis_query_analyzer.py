@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MyBatis 동적 쿼리 분석 테스트
+lxml 파서와 표준 라이브러리 파서가 같은 결과를 내는지 확인
+"""
+
+import pytest
+
+import mybatis_query_analyzer
+from mybatis_query_analyzer import analyze_mybatis_dynamic_query
+
+DOCUMENTS = {
+    'simple': """<select id="findUser">
+        SELECT * FROM users
+        <where>
+            <if test="name != null">AND name = #{name}</if>
+            <choose>
+                <when test="age > 0">AND age = #{age}</when>
+                <otherwise>AND age IS NULL</otherwise>
+            </choose>
+        </where>
+        ORDER BY id
+    </select>""",
+    'mapper': """<?xml version="1.0" encoding="UTF-8"?>
+    <!DOCTYPE mapper PUBLIC "-//mybatis.org//DTD Mapper 3.0//EN" "http://mybatis.org/dtd/mybatis-3-mapper.dtd">
+    <mapper namespace="com.example.UserMapper">
+        <!-- 사용자 조회 -->
+        <select id="find">SELECT u.* FROM users u<?hint keep?>
+            <foreach collection="ids" item="id" open="WHERE id IN (" separator="," close=")">#{id}</foreach>
+        </select>
+        <update id="touch">UPDATE users <set><if test="a">a = 1,</if></set> WHERE id = 1</update>
+    </mapper>""",
+    'euc_kr_declaration': """<?xml version="1.0" encoding="EUC-KR"?>
+    <select id="find">SELECT '한글' FROM dual <if test="x">WHERE 1 = 1</if></select>""",
+    'namespace': """<m:mapper xmlns:m="urn:example"><m:select>SELECT 1 FROM dual
+        <m:if test="x">WHERE <m:trim prefix="(" suffix=")">a = 1</m:trim></m:if></m:select></m:mapper>""",
+    'deep': "<select>SELECT 1 FROM dual " + "<if test=\"x\">AND 1 = 1 " * 3000 + "</if>" * 3000 + "</select>",
+    'malformed': "<select>SELECT 1 FROM dual <if test=\"x\">AND 1 = 1</select>",
+}
+
+def _analyze_with(factories, xml_content):
+    """
+    지정한 파서 순서로 동적 쿼리 분석
+    
+    Args:
+        factories (tuple): (파서 생성 함수, 입력 인코딩) 목록
+        xml_content (str): MyBatis XML 내용
+        
+    Returns:
+        tuple: analyze_mybatis_dynamic_query 결과
+    """
+    original = mybatis_query_analyzer._PARSER_FACTORIES
+    mybatis_query_analyzer._PARSER_FACTORIES = factories
+    try:
+        return analyze_mybatis_dynamic_query(xml_content)
+    finally:
+        mybatis_query_analyzer._PARSER_FACTORIES = original
+
+@pytest.mark.parametrize('name', sorted(DOCUMENTS))
+@pytest.mark.parametrize('chunk_size', [7, mybatis_query_analyzer.FEED_CHUNK_SIZE])
+def test_lxml_matches_stdlib(name, chunk_size, monkeypatch):
+    pytest.importorskip('lxml')
+    monkeypatch.setattr(mybatis_query_analyzer, 'FEED_CHUNK_SIZE', chunk_size)
+    xml_content = DOCUMENTS[name]
+    
+    stdlib_result = _analyze_with(((mybatis_query_analyzer._create_stdlib_parser, None),), xml_content)
+    lxml_first_result = _analyze_with(
+        ((mybatis_query_analyzer._create_lxml_parser, mybatis_query_analyzer.LXML_FEED_ENCODING),
+         (mybatis_query_analyzer._create_stdlib_parser, None)),
+        xml_content
+    )
+    
+    assert lxml_first_result == stdlib_result
+
+def test_dynamic_tags_are_scored():
+    base_sql, dynamic_complexity, max_sql = analyze_mybatis_dynamic_query(DOCUMENTS['simple'])
+    
+    assert base_sql.startswith("SELECT * FROM users")
+    assert "AND age IS NULL" in max_sql
+    assert dynamic_complexity > 0
+
+def test_malformed_xml_returns_empty_result():
+    assert analyze_mybatis_dynamic_query(DOCUMENTS['malformed']) == ("", 0, "")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+샤드 분석 부분 결과 테스트
+샤드별 부분 결과를 병합한 보고서가 한 번에 분석한 보고서와 같은지 확인
+"""
+
+import pytest
+
+from partial_results import merge_partial_results, parse_shard, write_partial_results
+from sql_directory_analyzer import analyze_directory, generate_report
+
+def _report(results, path):
+    generate_report(results, str(path))
+    return path.read_text(encoding='utf-8')
+
+@pytest.mark.parametrize('count', [1, 3, 7])
+def test_merged_shards_match_unsharded_report(sql_tree, tmp_path, count):
+    expected = _report(analyze_directory(str(sql_tree)), tmp_path / 'full.md')
+    
+    partial_paths = []
+    for index in range(1, count + 1):
+        results = analyze_directory(str(sql_tree), shard=(index, count))
+        partial_path = str(tmp_path / f'shard{index}.jsonl.gz')
+        write_partial_results(partial_path, results, str(sql_tree), (index, count))
+        partial_paths.append(partial_path)
+    
+    # 부분 결과 파일 순서와 관계없이 원래 탐색 순서로 병합
+    merged, warnings, root = merge_partial_results(list(reversed(partial_paths)))
+    
+    assert warnings == []
+    assert root == str(sql_tree)
+    assert _report(merged, tmp_path / 'merged.md') == expected
+
+def test_duplicate_and_missing_shards_are_reported(sql_tree, tmp_path):
+    partial_paths = {}
+    for index in (1, 2):
+        partial_path = str(tmp_path / f'shard{index}.jsonl.gz')
+        write_partial_results(partial_path, analyze_directory(str(sql_tree), shard=(index, 3)),
+                              str(sql_tree), (index, 3))
+        partial_paths[index] = partial_path
+    
+    _, warnings, _ = merge_partial_results([partial_paths[1], partial_paths[2], partial_paths[2]])
+    
+    assert warnings == [f"샤드 2/3가 중복되었습니다: {partial_paths[2]}", "누락된 샤드: 3/3"]
+
+def test_mixed_shard_counts_are_reported(sql_tree, tmp_path):
+    paths = []
+    for shard in ((1, 2), (1, 3)):
+        path = str(tmp_path / f'shard{shard[0]}of{shard[1]}.jsonl.gz')
+        write_partial_results(path, analyze_directory(str(sql_tree), shard=shard), str(sql_tree), shard)
+        paths.append(path)
+    
+    _, warnings, _ = merge_partial_results(paths)
+    
+    assert warnings == ["전체 샤드 수가 서로 다른 부분 결과가 섞여 있습니다: [2, 3]"]
+
+@pytest.mark.parametrize('value', ['0/3', '4/3', '1', 'a/b'])
+def test_invalid_shard_is_rejected(value):
+    with pytest.raises(ValueError):
+        parse_shard(value)
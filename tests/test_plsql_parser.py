@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PL/SQL 단위 분석기 테스트
+단위 경계, 전방 선언, 컬렉션 메서드, 단위 밖 최상위 SQL 문 처리를 확인
+"""
+
+from plsql_parser import analyze_plsql, parse_plsql
+from query_complexity_analyzer import calculate_query_complexity
+
+def _statement_texts(text):
+    _, statements = parse_plsql(text)
+    return [(text[statement['start']:statement['end']], statement['unit']) for statement in statements]
+
+def test_top_level_statements_after_unit_are_kept():
+    text = """CREATE OR REPLACE PROCEDURE touch_audit IS
+BEGIN
+  UPDATE audit_log SET touched = SYSDATE WHERE id = 1;
+END;
+/
+INSERT INTO orders_archive (id, total)
+SELECT o.id, SUM(l.amount) FROM orders o JOIN order_lines l ON l.order_id = o.id
+WHERE o.status IN (SELECT code FROM closed_status) GROUP BY o.id;
+MERGE INTO customers c USING staged_customers s ON (c.id = s.id)
+WHEN MATCHED THEN UPDATE SET c.name = s.name
+WHEN NOT MATCHED THEN INSERT (id, name) VALUES (s.id, s.name);
+GRANT SELECT ON orders_archive TO reporting;
+CREATE TABLE orders_copy AS SELECT * FROM orders;
+"""
+    units, statements = parse_plsql(text)
+    
+    assert [unit['name'] for unit in units] == ['touch_audit']
+    assert [(statement['keyword'], statement['unit']) for statement in statements] == [
+        ('UPDATE', 0), ('INSERT', None), ('MERGE', None), ('SELECT', None)
+    ]
+    
+    # 파일 점수는 단위 안팎의 모든 SQL 문 중 최고 점수
+    result = analyze_plsql(text, calculate_query_complexity)
+    top_level_score, _ = calculate_query_complexity(text[statements[1]['start']:statements[1]['end']])
+    assert result['complexity_score'] == max(statement['score'] for statement in result['statements'])
+    assert result['complexity_score'] >= top_level_score > result['units'][0]['max_score']
+
+def test_forward_declaration_is_not_a_unit():
+    text = """CREATE OR REPLACE PACKAGE BODY billing AS
+  PROCEDURE post_invoice(p_id NUMBER);
+
+  PROCEDURE close_month IS
+  BEGIN
+    post_invoice(1);
+  END close_month;
+
+  PROCEDURE post_invoice(p_id NUMBER) IS
+  BEGIN
+    INSERT INTO ledger (invoice_id) VALUES (p_id);
+  END post_invoice;
+END billing;
+"""
+    units, statements = parse_plsql(text)
+    
+    assert [(unit['kind'], unit['name']) for unit in units] == [
+        ('PACKAGE BODY', 'billing'), ('PROCEDURE', 'close_month'), ('PROCEDURE', 'post_invoice')
+    ]
+    assert units[2]['start_line'] == 9
+    assert [(statement['keyword'], statement['unit']) for statement in statements] == [('INSERT', 2)]
+
+def test_collection_delete_is_not_a_statement():
+    text = """CREATE OR REPLACE PROCEDURE reset_cache IS
+  TYPE id_table IS TABLE OF NUMBER;
+  v_tab id_table := id_table(1, 2, 3);
+BEGIN
+  v_tab.DELETE;
+  v_tab . DELETE(1);
+  DELETE FROM cache_entries WHERE expired = 'Y';
+END;
+"""
+    assert _statement_texts(text) == [("DELETE FROM cache_entries WHERE expired = 'Y'", 0)]
+
+def test_nested_units_roll_up_to_parent():
+    text = """CREATE OR REPLACE PROCEDURE outer_proc IS
+  FUNCTION inner_count RETURN NUMBER IS
+    v_count NUMBER;
+  BEGIN
+    SELECT COUNT(*) INTO v_count FROM items;
+    RETURN v_count;
+  END inner_count;
+BEGIN
+  IF inner_count > 0 THEN
+    UPDATE items SET checked = 'Y';
+  END IF;
+END outer_proc;
+"""
+    units, statements = parse_plsql(text)
+    
+    assert [(unit['name'], unit['parent'], unit['start_line'], unit['end_line']) for unit in units] == [
+        ('outer_proc', None, 1, 12), ('inner_count', 0, 2, 7)
+    ]
+    assert [(statement['keyword'], statement['unit']) for statement in statements] == [
+        ('SELECT', 1), ('UPDATE', 0)
+    ]
+    
+    result = analyze_plsql(text, calculate_query_complexity)
+    assert [unit['statement_count'] for unit in result['units']] == [2, 1]
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+유사 쿼리 클러스터링 테스트
+토큰 정규화, MinHash 유사도 추정, LSH 클러스터 구성 확인
+"""
+
+from query_clustering import MinHasher, cluster_signatures, estimate_similarity, tokenize_query
+
+BASE_QUERY = """
+SELECT o.order_id, o.order_date, c.customer_name, SUM(i.amount) AS total
+FROM orders o
+JOIN customers c ON c.customer_id = o.customer_id
+JOIN order_items i ON i.order_id = o.order_id
+WHERE o.status = 'OPEN' AND o.order_date > SYSDATE - 30
+GROUP BY o.order_id, o.order_date, c.customer_name
+ORDER BY total DESC
+"""
+
+def test_literals_and_comments_are_normalized():
+    copy = BASE_QUERY.replace("'OPEN'", "'CLOSED'").replace("30", "90") + "-- 복사본"
+    
+    assert tokenize_query(copy) == tokenize_query(BASE_QUERY)
+
+def test_identical_queries_have_identical_signatures():
+    hasher = MinHasher()
+    
+    assert hasher.query_signature(BASE_QUERY) == hasher.query_signature(BASE_QUERY.lower())
+    assert estimate_similarity(hasher.query_signature(BASE_QUERY),
+                               hasher.query_signature("SELECT 1 FROM dual")) < 0.2
+
+def test_near_duplicates_are_clustered_and_distinct_queries_are_not():
+    hasher = MinHasher()
+    queries = [
+        BASE_QUERY,
+        "SELECT employee_id, last_name FROM employees START WITH manager_id IS NULL "
+        "CONNECT BY PRIOR employee_id = manager_id",
+        BASE_QUERY.replace("'OPEN'", "'SHIPPED'"),
+    ]
+    signatures = [hasher.query_signature(query) for query in queries] + [None]
+    
+    assert cluster_signatures(signatures) == [[0, 2], [1], [3]]
+
+def test_chained_candidates_are_joined_by_lsh(chained_signatures):
+    a, b, c = chained_signatures
+    
+    assert estimate_similarity(a, b) >= 0.8
+    assert estimate_similarity(b, c) >= 0.8
+    assert estimate_similarity(a, c) < 0.8
+    # LSH 후보 연결은 추이적으로 합쳐지므로 대표 기준 분할이 필요함
+    assert cluster_signatures([a, b, c], threshold=0.8) == [[0, 1, 2]]
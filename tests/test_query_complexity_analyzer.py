@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SQL 쿼리 복잡도 분석 테스트
+총점 전용 모드(calculate_complexity_score)의 총점이 기본 모드(calculate_query_complexity)와 같은지 확인
+"""
+
+import os
+import random
+
+import pytest
+
+from query_complexity_analyzer import calculate_complexity_score, calculate_query_complexity
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'samples')
+
+# 무작위 쿼리 생성에 쓰는 구문 조각 (카테고리별 상한과 조기 종료 조건을 넘나들도록 반복 횟수도 무작위)
+FRAGMENTS = [
+    "JOIN orders o{n} ON o{n}.user_id = u.id",
+    "LEFT OUTER JOIN items i{n} ON i{n}.order_id = o.id",
+    "WHERE u.id IN (SELECT id FROM users WHERE status = 'A' AND id IN (SELECT user_id FROM roles))",
+    "AND EXISTS (SELECT 1 FROM audit a{n} WHERE a{n}.id = u.id)",
+    "CONNECT BY PRIOR emp_id = mgr_id START WITH mgr_id IS NULL",
+    "UNION ALL SELECT id, name FROM archived_users",
+    "INTERSECT SELECT id, name FROM admins",
+    "MINUS SELECT id, name FROM banned",
+    "GROUP BY u.dept_id HAVING COUNT(*) > {n}",
+    "ORDER BY u.name DESC",
+    "DECODE(u.type, 1, 'A', 2, 'B', 'C')",
+    "NVL(u.nick, u.name)",
+    "NVL2(u.a, u.b, u.c)",
+    "TO_CHAR(u.created, 'YYYY-MM-DD')",
+    "TO_DATE('2020-01-01', 'YYYY-MM-DD')",
+    "LISTAGG(u.name, ',') WITHIN GROUP (ORDER BY u.name)",
+    "REGEXP_LIKE(u.email, '^a')",
+    "SYS_CONTEXT('USERENV', 'SESSION_USER')",
+    "EXTRACT(YEAR FROM u.created)",
+    "ROW_NUMBER() OVER (PARTITION BY u.dept_id ORDER BY u.salary)",
+    "RANK() OVER (ORDER BY u.salary DESC)",
+    "SUM(u.salary) OVER (PARTITION BY u.dept_id)",
+    "CASE WHEN u.a = 1 THEN 'x' WHEN u.a = 2 THEN 'y' ELSE 'z' END",
+    "AVG(u.salary)", "COUNT(DISTINCT u.id)", "MAX(u.age)",
+    "my_pkg.calc_bonus(u.id, {n})", "fn_custom{n}(u.a)",
+    "WHERE ROWNUM <= {n}", "u.ROWID", "SYS_CONNECT_BY_PATH(u.name, '/')",
+    "MODEL DIMENSION BY (id) MEASURES (sal) RULES (sal[1] = 0)",
+    "PIVOT (SUM(sal) FOR dept IN (10, 20))",
+    "AS OF TIMESTAMP SYSTIMESTAMP FLASHBACK",
+    "/*+ INDEX(u idx_users) */",
+    "MERGE INTO target t USING source s ON (t.id = s.id) WHEN MATCHED THEN UPDATE SET t.v = s.v",
+    "FOR UPDATE NOWAIT",
+    "(+)",
+    "PARTITION (p_2020)",
+    "DBMS_OUTPUT.PUT_LINE('x')",
+    "EXECUTE IMMEDIATE 'SELECT 1 FROM dual'",
+    "BULK COLLECT INTO v_rows",
+    "WITH cte{n} AS (SELECT * FROM t{n})",
+]
+
+def _random_query(rng):
+    """
+    구문 조각을 무작위로 이어 붙인 쿼리
+    
+    Args:
+        rng (random.Random): 난수 생성기
+        
+    Returns:
+        str: 생성된 쿼리
+    """
+    parts = ["SELECT u.id, u.name FROM users u"]
+    for _ in range(rng.randint(0, 25)):
+        fragment = rng.choice(FRAGMENTS).format(n=rng.randint(1, 9))
+        parts.append(fragment * rng.choice([1, 1, 1, 2, 5]))
+    if rng.random() < 0.1:
+        # 데이터 볼륨 점수 구간을 넘나드는 긴 쿼리
+        parts.append("-- " + "x" * rng.randint(100, 6000))
+    separator = rng.choice([" ", "\n", "\n    "])
+    query = separator.join(parts)
+    return query.lower() if rng.random() < 0.2 else query
+
+def _sample_queries():
+    """
+    samples 디렉토리의 SQL 파일 내용
+    
+    Returns:
+        list: 파일 내용 목록
+    """
+    queries = []
+    for file_name in sorted(os.listdir(SAMPLES_DIR)):
+        if file_name.endswith('.sql'):
+            with open(os.path.join(SAMPLES_DIR, file_name), 'r', encoding='utf-8') as file:
+                queries.append(file.read())
+    return queries
+
+@pytest.mark.parametrize('query', _sample_queries() + ["SELECT 1 FROM dual", "select *\nfrom dual"])
+def test_score_only_matches_full_analysis_for_samples(query):
+    assert calculate_complexity_score(query) == calculate_query_complexity(query)[0]
+
+@pytest.mark.parametrize('seed', range(4))
+def test_score_only_matches_full_analysis_for_random_queries(seed):
+    rng = random.Random(seed)
+    for _ in range(50):
+        query = _random_query(rng)
+        assert calculate_complexity_score(query) == calculate_query_complexity(query)[0], query
+
+def test_empty_query_is_rejected_by_both_modes():
+    with pytest.raises(Exception):
+        calculate_query_complexity("  ")
+    with pytest.raises(ValueError):
+        calculate_complexity_score("  ")
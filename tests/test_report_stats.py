@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+통계 집계기 테스트
+부분 집계 병합이 한 번에 집계한 결과와 같은지, 백분위수 규칙이 맞는지 확인
+"""
+
+import json
+import random
+
+import pytest
+
+from report_stats import ComplexityAggregator, ScoreSummary, aggregate_results
+
+DESCRIPTIONS = ("간단 (Simple)", "중간 (Moderate)", "복잡 (Complex)")
+
+def _random_results(rng, count):
+    """
+    디렉토리, 유형, 오류/예산 초과가 섞인 무작위 분석 결과
+    
+    Args:
+        rng (random.Random): 난수 생성기
+        count (int): 결과 수
+        
+    Returns:
+        list: 분석 결과 목록
+    """
+    results = []
+    for index in range(count):
+        file_path = f"/repo/app{rng.randint(0, 2)}/mod{rng.randint(0, 3)}/q{index}.sql"
+        kind = rng.random()
+        if kind < 0.05:
+            results.append({'file_path': file_path, 'error': "읽기 오류"})
+        elif kind < 0.1:
+            results.append({'file_path': file_path, 'budget_exceeded': "시간 초과 (1초)"})
+        else:
+            result = {
+                'file_path': file_path,
+                'is_mybatis': rng.random() < 0.3,
+                'complexity_score': round(rng.uniform(0, 10), 1),
+                'description': rng.choice(DESCRIPTIONS),
+                'detailed_scores': {
+                    'structural_complexity': round(rng.uniform(0, 3), 1),
+                    'postgres_conversion': round(rng.uniform(0, 2), 1),
+                }
+            }
+            if kind < 0.15:
+                result['budget_exceeded'] = "시간 초과 (1초)"
+            results.append(result)
+    return results
+
+@pytest.mark.parametrize('seed', range(5))
+def test_merged_partials_equal_single_pass(seed):
+    rng = random.Random(seed)
+    results = _random_results(rng, 400)
+    
+    # 임의 위치에서 나눈 부분 집계를 JSON으로 직렬화했다가 복원하여 병합
+    cuts = sorted(rng.sample(range(1, len(results)), 4))
+    bounds = [0] + cuts + [len(results)]
+    merged = ComplexityAggregator()
+    for start, end in zip(bounds, bounds[1:]):
+        partial = aggregate_results(results[start:end])
+        merged.merge(ComplexityAggregator.from_dict(json.loads(json.dumps(partial.to_dict()))))
+    
+    assert merged.to_dict() == aggregate_results(results).to_dict()
+
+def test_to_dict_round_trip():
+    aggregate = aggregate_results(_random_results(random.Random(7), 100))
+    
+    restored = ComplexityAggregator.from_dict(json.loads(json.dumps(aggregate.to_dict())))
+    
+    assert restored.to_dict() == aggregate.to_dict()
+    assert restored.complexity.percentile(90) == aggregate.complexity.percentile(90)
+
+def test_directories_roll_up_to_ancestors():
+    aggregate = aggregate_results(_random_results(random.Random(3), 200))
+    
+    app = aggregate.directories['/repo/app0']
+    modules = [aggregate.directories[f'/repo/app0/mod{index}'] for index in range(4)
+               if f'/repo/app0/mod{index}' in aggregate.directories]
+    
+    assert app.file_count == sum(module.file_count for module in modules)
+    assert [directory for directory, _ in aggregate.rollup_directories()][0] == '/repo'
+
+@pytest.mark.parametrize('percent, expected', [(0, 1.0), (10, 1.0), (50, 5.0), (51, 6.0),
+                                               (90, 9.0), (99, 10.0), (100, 10.0)])
+def test_percentile_uses_nearest_rank(percent, expected):
+    summary = ScoreSummary()
+    for value in range(10, 0, -1):
+        summary.add(float(value))
+    
+    assert summary.percentile(percent) == expected
+
+def test_scores_are_quantized_to_tenths():
+    summary = ScoreSummary()
+    for value in (0.1, 0.2, 0.30000000000000004, 2.449):
+        summary.add(value)
+    
+    assert summary.total == 3.0
+    assert summary.minimum == 0.1
+    assert summary.maximum == 2.4
+    assert ScoreSummary().percentile(50) is None
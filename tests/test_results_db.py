@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+결과 데이터베이스 테스트
+루트를 입력한 방식과 관계없이 실행 간 경로가 맞는지, 중복 경로와 저장 실패를 처리하는지 확인
+"""
+
+import sqlite3
+import zipfile
+
+import pytest
+
+from results_db import ResultsDatabase
+from sql_directory_analyzer import analyze_archive, analyze_directory
+
+ROOT_FORMS = ('sql', './sql', 'sql/')
+
+@pytest.fixture
+def db(tmp_path):
+    with ResultsDatabase(str(tmp_path / 'results.db')) as database:
+        yield database
+
+def _store(db, root):
+    return db.store_run(analyze_directory(root), root=root)
+
+def test_runs_from_differently_typed_roots_share_paths(sql_tree, db, monkeypatch):
+    monkeypatch.chdir(sql_tree.parent)
+    run_ids = [_store(db, root) for root in ROOT_FORMS + (str(sql_tree),)]
+    
+    for run_id in run_ids[1:]:
+        assert db.diff(run_ids[0], run_id) == []
+    paths = [row['path'] for row in db.top(run_id=run_ids[0])]
+    assert paths and all(path.startswith('app') for path in paths)
+
+@pytest.mark.parametrize('prefix', ['app1/', './app1/', 'sql/app1/', './sql/app1/', None])
+def test_path_prefix_does_not_depend_on_root_form(sql_tree, db, monkeypatch, prefix):
+    monkeypatch.chdir(sql_tree.parent)
+    if prefix is None:
+        prefix = str(sql_tree / 'app1') + '/'
+    
+    for root in ROOT_FORMS:
+        rows = db.top(run_id=_store(db, root), path_prefix=prefix)
+        assert len(rows) == 8
+        assert all(row['path'].startswith('app1/') for row in rows)
+
+def test_duplicate_archive_members_are_stored(tmp_path, db):
+    archive_path = str(tmp_path / 'bundle.zip')
+    with pytest.warns(UserWarning), zipfile.ZipFile(archive_path, 'w') as archive:
+        archive.writestr('db/query.sql', "SELECT 1 FROM dual")
+        archive.writestr('db/query.sql', "SELECT a FROM t1 JOIN t2 ON t1.id = t2.id")
+    
+    run_id = db.store_run(analyze_archive(archive_path), root=archive_path)
+    
+    assert db.runs()[0]['file_count'] == 2
+    assert sorted(row['path'] for row in db.top(run_id=run_id)) == ['db/query.sql', 'db/query.sql#2']
+
+def test_failed_store_leaves_no_run(sql_tree, db):
+    def results():
+        yield from analyze_directory(str(sql_tree))[:5]
+        raise RuntimeError("분석 중단")
+    
+    with pytest.raises(RuntimeError):
+        db.store_run(results(), root=str(sql_tree), batch_size=2)
+    
+    assert db.runs() == []
+    with sqlite3.connect(db.path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 0
+
+def test_old_database_paths_are_migrated(sql_tree, tmp_path, monkeypatch):
+    monkeypatch.chdir(sql_tree.parent)
+    db_path = str(tmp_path / 'old.db')
+    with ResultsDatabase(db_path) as db:
+        run_id = _store(db, 'sql')
+        expected = db.top(run_id=run_id)
+    
+    # 형식 0: 입력한 루트와 경로를 그대로 저장
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE runs SET root = 'sql'")
+        conn.execute("UPDATE files SET path = './sql/' || path, directory = './sql/' || directory")
+        conn.execute("PRAGMA user_version = 0")
+    
+    with ResultsDatabase(db_path) as db:
+        assert db.top(run_id=run_id) == expected
+        assert db.diff(run_id, _store(db, str(sql_tree))) == []
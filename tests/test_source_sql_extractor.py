@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Java/Kotlin 소스 SQL 추출기 테스트
+문자열 연결, 어노테이션 배열, Kotlin 원시 문자열의 추출 결과를 확인
+"""
+
+import pytest
+
+from source_sql_extractor import extract_source_sql
+
+def _extract(text, language='java'):
+    return [(statement['line'], statement['kind'], statement['sql'])
+            for statement in extract_source_sql(text, language)]
+
+def test_concatenation_stops_at_method_call():
+    text = '''class OrderDao {
+    List<Order> find(String col) {
+        String sql = "select " + col + " from " + getTable() + " where id = ?";
+        return jdbc.query(sql, mapper);
+    }
+}
+'''
+    assert _extract(text) == [(3, 'concatenation', 'select ? from ?')]
+
+def test_concatenation_keeps_names_and_constants():
+    text = '''String sql = "SELECT id FROM " + Tables.ORDERS
+        + " WHERE status = 'OPEN'" // 열린 주문
+        + " AND owner = ?";
+'''
+    assert _extract(text) == [
+        (1, 'concatenation', "SELECT id FROM ? WHERE status = 'OPEN' AND owner = ?")
+    ]
+
+@pytest.mark.parametrize('language, annotation', [
+    ('java', '@Select({"SELECT id, name", "FROM users", "WHERE id = #{id}"})'),
+    ('kotlin', '@Select(value = ["SELECT id, name", "FROM users", "WHERE id = #{id}"])'),
+])
+def test_annotation_array_is_joined(language, annotation):
+    text = f'''interface UserMapper {{
+    {annotation}
+    User findById(long id);
+
+    @Options(useCache = false)
+    @Update("UPDATE users SET name = #{{name}} WHERE id = #{{id}}")
+    void rename(User user);
+}}
+'''
+    assert _extract(text, language) == [
+        (2, '@Select', 'SELECT id, name FROM users WHERE id = #{id}'),
+        (6, '@Update', 'UPDATE users SET name = #{name} WHERE id = #{id}'),
+    ]
+
+@pytest.mark.parametrize('call, margin', [('.trimMargin()', '|'), ('.trimMargin("#")', '#')])
+def test_kotlin_trim_margin_strips_prefix(call, margin):
+    text = f'''val sql = """
+        {margin}SELECT o.id, o.total
+        {margin}  FROM orders o
+        {margin} WHERE o.status = 'OPEN'
+    """{call}
+'''
+    assert _extract(text, 'kotlin') == [
+        (1, 'literal', "SELECT o.id, o.total\n  FROM orders o\n WHERE o.status = 'OPEN'")
+    ]
+
+def test_kotlin_raw_string_without_trim_margin_is_dedented():
+    text = '''val sql = """
+        SELECT id
+          FROM users
+    """.trimIndent()
+'''
+    assert _extract(text, 'kotlin') == [(1, 'literal', 'SELECT id\n  FROM users')]
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+디렉토리 분석 테스트
+예산 적용, 클러스터링, 체크포인트 저널 동작 확인
+"""
+
+import os
+
+import pytest
+
+from checkpoint_journal import CheckpointJournal
+from sql_directory_analyzer import (BUDGET_DEGRADE, BudgetedFileAnalyzer, _split_by_representative,
+                                    analyze_directory, generate_report, iter_clustered_results)
+
+SIMPLE_SQL = "SELECT id, name FROM users WHERE status = 'A'"
+
+def test_oversized_file_is_skipped_without_reading_in_degrade_mode(tmp_path, monkeypatch):
+    large = tmp_path / 'large.sql'
+    large.write_text(SIMPLE_SQL + "\n" + "-- padding\n" * 100, encoding='utf-8')
+    
+    def fail_open(*args, **kwargs):
+        raise AssertionError("크기 예산을 넘은 파일을 읽음")
+    monkeypatch.setattr('builtins.open', fail_open)
+    
+    with BudgetedFileAnalyzer(max_file_size=100, on_budget_exceeded=BUDGET_DEGRADE) as analyzer:
+        result = analyzer.analyze(str(large))
+    
+    assert 'complexity_score' not in result
+    assert result['budget_exceeded'].startswith("파일 크기 초과")
+
+def test_file_within_budget_is_scored(tmp_path):
+    small = tmp_path / 'small.sql'
+    small.write_text(SIMPLE_SQL, encoding='utf-8')
+    
+    with BudgetedFileAnalyzer(max_file_size=1024) as analyzer:
+        result = analyzer.analyze(str(small))
+    
+    assert result['complexity_score'] >= 0
+    assert 'budget_exceeded' not in result
+
+def test_chained_cluster_is_split_by_representative(chained_signatures):
+    groups = list(_split_by_representative([[0, 1, 2]], chained_signatures, 0.8))
+    
+    assert [(representative, sorted(members)) for representative, members in groups] == [(0, [1]), (2, [])]
+
+def test_members_not_similar_to_representative_are_analyzed(tmp_path):
+    base = "SELECT a.id, a.name, b.total FROM accounts a JOIN balances b ON b.account_id = a.id WHERE a.region = 'EU'"
+    paths = []
+    for name, query in (('a.sql', base), ('b.sql', base), ('c.sql', "SELECT 1 FROM dual")):
+        path = tmp_path / name
+        path.write_text(query, encoding='utf-8')
+        paths.append(str(path))
+    
+    with BudgetedFileAnalyzer() as analyzer:
+        results = dict(iter_clustered_results(paths, analyzer, threshold=0.8))
+    
+    assert results[0]['cluster_size'] == 2
+    assert results[1]['cluster_representative'] == paths[0]
+    assert 'cluster_representative' not in results[2]
+
+CLUSTER_OPTIONS = {'cluster': 0.8}
+
+def _cluster_run(root, journal_path, resume):
+    with CheckpointJournal(str(journal_path), resume=resume, options=CLUSTER_OPTIONS) as journal:
+        return analyze_directory(str(root), cluster_threshold=0.8, journal=journal)
+
+def _representatives(results):
+    return {result['file_path'] for result in results if 'cluster_size' in result}
+
+@pytest.mark.parametrize('change', ['delete', 'modify'])
+def test_resume_reanalyzes_members_of_changed_representative(sql_tree, tmp_path, change):
+    journal_path = tmp_path / 'journal.jsonl'
+    first = _cluster_run(sql_tree, journal_path, resume=False)
+    representative = sorted(_representatives(first))[0]
+    members = [result['file_path'] for result in first
+               if result.get('cluster_representative') == representative and result['file_path'] != representative]
+    assert members
+    
+    if change == 'delete':
+        os.remove(representative)
+    else:
+        with open(representative, 'a', encoding='utf-8') as f:
+            f.write("\nUNION ALL SELECT id FROM t1 CONNECT BY PRIOR id = parent_id")
+    
+    resumed = _cluster_run(sql_tree, journal_path, resume=True)
+    
+    # 바뀐 대표의 이전 결과를 물려받은 멤버가 남지 않아 모든 클러스터에 현재 대표가 있음
+    for result in resumed:
+        if 'cluster_representative' in result:
+            assert result['cluster_representative'] in _representatives(resumed)
+    generate_report(resumed, str(tmp_path / 'report.md'))
+
+def test_report_tolerates_cluster_without_representative(tmp_path):
+    member = {'file_name': 'b.sql', 'file_path': '/x/b.sql', 'is_mybatis': False, 'complexity_score': 1.0,
+              'description': "간단 (Simple)", 'cluster_representative': '/x/a.sql',
+              'cluster_similarity': 0.9, 'cluster_inherited': True}
+    
+    generate_report([member], str(tmp_path / 'report.md'))
+    
+    assert "a.sql - 멤버 1개 (대표 파일 결과 없음)" in (tmp_path / 'report.md').read_text(encoding='utf-8')